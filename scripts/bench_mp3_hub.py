@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for the MP3 broadcast hub in stream_to_nest.py
+
+Feeds synthetic 128 kbps MP3 frames through a pipe into BroadcastHub as fast
+as the hub takes them, with N listeners writing every chunk to /dev/null
+(one write syscall per chunk, like a socket send). Reports, per mode and
+listener count:
+
+  - chunk buffers allocated per second and per audio second: a fresh bytes
+    object per chunk per listener in "bytes" mode (what the --flask WSGI
+    path pays), none in "views" mode (memoryview slices of the hub's
+    preallocated slots, as the default asyncio server sends them)
+  - GC generation-0 collections per second (object churn)
+  - CPU ms per listener per second of audio (process CPU time)
+
+Usage:
+  python scripts/bench_mp3_hub.py                      # 1, 4, 16 listeners, both modes
+  python scripts/bench_mp3_hub.py -l 1 -l 32 --audio-seconds 600 --json
+"""
+
+import argparse
+import gc
+import io
+import json
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import stream_to_nest  # noqa: E402
+
+# MPEG-1 Layer III, 128 kbps, 48 kHz, no padding: 384 bytes, 24 ms
+FRAME = bytes([0xFF, 0xFB, 0x94, 0x00]) + bytes(380)
+FRAME_MS = 24
+WRITE_FRAMES = 8  # Frames per pipe write, roughly what ffmpeg flushes at a time
+
+
+def feed(fd, frames):
+    """Write the synthetic stream into the pipe, then close it (ends the hub)."""
+    block = FRAME * WRITE_FRAMES
+    for _ in range(frames // WRITE_FRAMES):
+        os.write(fd, block)
+    os.close(fd)
+
+
+def run(listeners, audio_seconds, copy):
+    """One run. Returns a result dict."""
+    frames = int(audio_seconds * 1000 / FRAME_MS)
+    read_fd, write_fd = os.pipe()
+    source = io.open(read_fd, 'rb', buffering=stream_to_nest.CHUNK_SIZE)
+    # Large lag bound: listeners here are never slow, nothing should drop
+    hub = stream_to_nest.BroadcastHub(source)
+
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    counts = [[0, 0, 0] for _ in range(listeners)]  # [chunks, bytes objects, bytes sent]
+
+    def consume(index):
+        stream = hub.listen(0, 10 ** 9, name=f"bench-{index}", copy=copy)
+        count = counts[index]
+        for chunk in stream:
+            os.write(devnull, chunk)
+            count[0] += 1
+            count[2] += len(chunk)
+            if type(chunk) is bytes:
+                count[1] += 1
+
+    threads = [threading.Thread(target=consume, args=(i,), daemon=True) for i in range(listeners)]
+    for thread in threads:
+        thread.start()
+
+    gc_before = gc.get_stats()[0]["collections"]
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    hub.start()
+    # Listeners register on their first next(); only feed once all are in
+    while len(hub.listeners) < listeners:
+        time.sleep(0.001)
+    feeder = threading.Thread(target=feed, args=(write_fd, frames), daemon=True)
+    feeder.start()
+    for thread in threads:
+        thread.join()
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+    gc_collections = gc.get_stats()[0]["collections"] - gc_before
+    os.close(devnull)
+    source.close()
+
+    audio = frames * FRAME_MS / 1000
+    chunks = sum(c[0] for c in counts)
+    allocations = sum(c[1] for c in counts)
+    return {
+        "mode": "bytes" if copy else "views",
+        "listeners": listeners,
+        "audio_s": round(audio, 1),
+        "wall_s": round(wall, 3),
+        "chunks": chunks,
+        # Every listener should get the whole stream
+        "delivered": min(c[2] for c in counts) == frames // WRITE_FRAMES * WRITE_FRAMES * len(FRAME),
+        "dropped_bytes": hub.stats()["dropped_bytes"],
+        "buffer_allocs_per_s": round(allocations / wall),
+        "buffer_allocs_per_audio_s": round(allocations / audio, 1),
+        "gc_gen0_per_s": round(gc_collections / wall, 1),
+        "cpu_ms_per_listener_audio_s": round(cpu * 1000 / listeners / audio, 4),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark BroadcastHub allocations and CPU per listener")
+    parser.add_argument("-l", "--listeners", type=int, action="append", help="listener count (repeatable)")
+    parser.add_argument("--audio-seconds", type=float, default=300, help="seconds of audio per run (default 300)")
+    parser.add_argument("--mode", choices=("views", "bytes", "both"), default="both")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    opts = parser.parse_args()
+
+    modes = [False, True] if opts.mode == "both" else [opts.mode == "bytes"]
+    results = [run(n, opts.audio_seconds, copy)
+               for n in opts.listeners or [1, 4, 16]
+               for copy in modes]
+
+    if opts.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{opts.audio_seconds:g} s of 128 kbps MP3 per run\n")
+    print(f"{'mode':<6} {'listeners':>9} {'allocs/s':>10} {'allocs/audio s':>15} {'gc0/s':>7} {'cpu ms/listener/audio s':>24}")
+    for r in results:
+        print(f"{r['mode']:<6} {r['listeners']:>9} {r['buffer_allocs_per_s']:>10} "
+              f"{r['buffer_allocs_per_audio_s']:>15} {r['gc_gen0_per_s']:>7} {r['cpu_ms_per_listener_audio_s']:>24}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark for cast-helper.py
+
+Every Electron call spawns a fresh Python process, so interpreter start +
+module load is paid on each command. This measures, per command, the wall
+time from spawn to the first byte of stdout (the JSON result) and collects
+cast-helper's own --profile-startup breakdown (module load, lazy imports).
+
+Usage:
+  python scripts/bench_startup.py                  # default command set, 10 runs each
+  python scripts/bench_startup.py -n 20 --json     # machine-readable output
+  python scripts/bench_startup.py -c "discover 3 --cached" -c "get-audio-outputs"
+
+Default commands have no side effects on speakers or audio devices.
+"""
+
+import argparse
+import json
+import os
+import shlex
+import statistics
+import subprocess
+import sys
+import time
+
+HELPER = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src', 'main', 'cast-helper.py')
+
+DEFAULT_COMMANDS = [
+    "get-audio-outputs",
+    "set-audio-output __bench_no_such_device__",
+    "measure-latency",  # Missing args -> usage error: pure startup cost
+]
+
+
+def run_once(python, args):
+    """Spawn cast-helper once. Returns (first_output_ms, total_ms, profile dict or None)."""
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        [python, HELPER] + args + ["--profile-startup"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE
+    )
+    proc.stdout.read(1)  # Blocks until the first byte of the result
+    first_output_ms = (time.perf_counter() - start) * 1000
+    _, stderr = proc.communicate()
+    total_ms = (time.perf_counter() - start) * 1000
+
+    profile = None
+    for line in stderr.decode(errors='replace').splitlines():
+        if line.startswith('{"profile"'):
+            profile = json.loads(line)["profile"]
+    return first_output_ms, total_ms, profile
+
+
+def baseline(python, runs):
+    """Bare interpreter start (python -c pass), for reference."""
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([python, "-c", "pass"], check=False)
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def summarize(samples):
+    ordered = sorted(samples)
+    return {
+        "min": round(ordered[0], 1),
+        "median": round(statistics.median(ordered), 1),
+        "max": round(ordered[-1], 1)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark cast-helper.py startup per command")
+    parser.add_argument("-n", "--runs", type=int, default=10, help="runs per command (default 10)")
+    parser.add_argument("-c", "--command", action="append", help="command line to benchmark (repeatable)")
+    parser.add_argument("--python", default=sys.executable, help="interpreter to benchmark")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    opts = parser.parse_args()
+
+    results = {"python": opts.python, "baseline_ms": summarize(baseline(opts.python, opts.runs)), "commands": {}}
+
+    for command in opts.command or DEFAULT_COMMANDS:
+        first, total, module_load, imports = [], [], [], {}
+        for _ in range(opts.runs):
+            first_ms, total_ms, profile = run_once(opts.python, shlex.split(command))
+            first.append(first_ms)
+            total.append(total_ms)
+            if profile:
+                module_load.append(profile["module_load_ms"])
+                for name, ms in profile["imports_ms"].items():
+                    imports.setdefault(name, []).append(ms)
+        results["commands"][command] = {
+            "first_output_ms": summarize(first),
+            "total_ms": summarize(total),
+            "module_load_ms": summarize(module_load) if module_load else None,
+            "lazy_imports_ms": {name: round(statistics.median(ms), 1) for name, ms in imports.items()}
+        }
+
+    if opts.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"Interpreter: {opts.python}")
+    print(f"Baseline (python -c pass): median {results['baseline_ms']['median']} ms\n")
+    print(f"{'command':<45} {'first output':>14} {'module load':>12}  lazy imports")
+    for command, r in results["commands"].items():
+        load = r["module_load_ms"]["median"] if r["module_load_ms"] else "-"
+        lazy = ", ".join(f"{k} {v}ms" for k, v in r["lazy_imports_ms"].items()) or "none"
+        print(f"{command:<45} {r['first_output_ms']['median']:>11} ms {load:>9} ms  {lazy}")
+
+
+if __name__ == "__main__":
+    main()
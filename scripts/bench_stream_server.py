@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Load benchmark: asyncio stream server vs threaded Flask for /live.mp3
+
+Each run starts stream_to_nest.py's server in a child process, fed with
+synthetic 128 kbps MP3 frames at real-time pace through the broadcast hub,
+then opens N concurrent /live.mp3 listeners from this process. Reports per
+server and listener count:
+
+  - server CPU as % of one core while all listeners stream
+  - peak server thread count
+  - per-listener throughput (kbps, 128 expected) and how many listeners
+    fell below 95% of real time ("starved")
+  - median / max time to first audio byte
+
+Usage:
+  python scripts/bench_stream_server.py                        # 10, 100, 300 listeners, both servers
+  python scripts/bench_stream_server.py -l 500 --server asyncio --seconds 20 --json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import threading
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+# MPEG-1 Layer III, 128 kbps, 48 kHz, no padding: 384 bytes, 24 ms
+FRAME = bytes([0xFF, 0xFB, 0x94, 0x00]) + bytes(380)
+FRAME_MS = 24
+WRITE_FRAMES = 8
+BITRATE_KBPS = 128
+
+
+# =============================================================================
+# SERVER (child process)
+# =============================================================================
+
+def feed_realtime(fd):
+    """Write frames into the pipe at real-time pace, like ffmpeg would."""
+    block = FRAME * WRITE_FRAMES
+    interval = FRAME_MS * WRITE_FRAMES / 1000
+    next_write = time.perf_counter()
+    while True:
+        os.write(fd, block)
+        next_write += interval
+        time.sleep(max(0, next_write - time.perf_counter()))
+
+
+def serve(kind, port):
+    """Run one server until stdin closes; report CPU and threads on stdout."""
+    import io
+    sys.path.insert(0, ROOT)
+    import stream_to_nest
+
+    read_fd, write_fd = os.pipe()
+    hub = stream_to_nest.BroadcastHub(io.open(read_fd, 'rb', buffering=stream_to_nest.CHUNK_SIZE)).start()
+    threading.Thread(target=feed_realtime, args=(write_fd,), daemon=True).start()
+
+    if kind == "asyncio":
+        stream_to_nest.AsyncStreamServer().start(port, "127.0.0.1").set_hub(hub)
+    else:
+        import logging
+        logging.getLogger("werkzeug").setLevel(logging.ERROR)  # No per-request log lines
+        stream_to_nest._mp3_hub = hub
+        threading.Thread(
+            target=lambda: stream_to_nest.app.run(host="127.0.0.1", port=port, threaded=True, use_reloader=False),
+            daemon=True).start()
+
+    peak_threads = 0
+
+    def sample_threads():
+        nonlocal peak_threads
+        while True:
+            peak_threads = max(peak_threads, threading.active_count())
+            time.sleep(0.1)
+
+    threading.Thread(target=sample_threads, daemon=True).start()
+    print("READY", flush=True)
+
+    sys.stdin.readline()  # "go": all listeners connected
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    sys.stdin.readline()  # EOF: measurement over
+    print(json.dumps({
+        "cpu_s": time.process_time() - cpu_start,
+        "wall_s": time.perf_counter() - wall_start,
+        "peak_threads": peak_threads,
+    }), flush=True)
+
+
+# =============================================================================
+# LOAD (parent process)
+# =============================================================================
+
+async def listener(port, stats, started, stop):
+    """One /live.mp3 client: count body bytes until told to stop."""
+    opened = time.perf_counter()
+    reader, writer = await asyncio.open_connection("127.0.0.1", port, limit=2 ** 20)
+    writer.write(b"GET /live.mp3?prebuffer=0 HTTP/1.1\r\nHost: bench\r\n\r\n")
+    await writer.drain()
+    await reader.readuntil(b"\r\n\r\n")
+    started.release()
+    stats["first_byte_s"] = None
+    try:
+        while not stop.is_set():
+            data = await reader.read(65536)
+            if not data:
+                break
+            if stats["first_byte_s"] is None:
+                stats["first_byte_s"] = time.perf_counter() - opened
+            if stats.get("measuring"):
+                stats["bytes"] += len(data)
+    finally:
+        writer.close()
+
+
+async def load(port, listeners, seconds, child):
+    stats = [{"bytes": 0} for _ in range(listeners)]
+    started = asyncio.Semaphore(0)
+    stop = asyncio.Event()
+    tasks = [asyncio.create_task(listener(port, s, started, stop)) for s in stats]
+    for _ in range(listeners):
+        await started.acquire()
+
+    # Connected: measure a steady window
+    child.stdin.write("go\n")
+    child.stdin.flush()
+    for s in stats:
+        s["measuring"] = True
+    await asyncio.sleep(seconds)
+    for s in stats:
+        s["measuring"] = False
+    child.stdin.close()
+    stop.set()
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    return stats
+
+
+def run(kind, listeners, seconds, port):
+    child = subprocess.Popen(
+        [sys.executable, os.path.abspath(__file__), "--serve", kind, "--port", str(port)],
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+    try:
+        if child.stdout.readline().strip() != "READY":
+            raise RuntimeError(f"{kind} server did not start")
+        time.sleep(0.5)  # Let the server bind before the first connect
+        stats = asyncio.run(load(port, listeners, seconds, child))
+        server = json.loads(child.stdout.readline())
+    finally:
+        child.kill()
+        child.wait()
+
+    rates = [s["bytes"] * 8 / seconds / 1000 for s in stats]
+    first = [s["first_byte_s"] for s in stats if s.get("first_byte_s") is not None]
+    return {
+        "server": kind,
+        "listeners": listeners,
+        "cpu_pct": round(server["cpu_s"] / server["wall_s"] * 100, 1),
+        "peak_threads": server["peak_threads"],
+        "kbps_median": round(statistics.median(rates), 1),
+        "kbps_min": round(min(rates), 1),
+        "starved": sum(1 for r in rates if r < BITRATE_KBPS * 0.95),
+        "first_byte_ms_median": round(statistics.median(first) * 1000, 1) if first else None,
+        "first_byte_ms_max": round(max(first) * 1000, 1) if first else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test the /live.mp3 servers in stream_to_nest.py")
+    parser.add_argument("-l", "--listeners", type=int, action="append", help="listener count (repeatable)")
+    parser.add_argument("--seconds", type=float, default=10, help="measured seconds per run (default 10)")
+    parser.add_argument("--server", choices=("asyncio", "flask", "both"), default="both")
+    parser.add_argument("--port", type=int, default=18000)
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    parser.add_argument("--serve", choices=("asyncio", "flask"), help=argparse.SUPPRESS)
+    opts = parser.parse_args()
+
+    if opts.serve:
+        serve(opts.serve, opts.port)
+        return
+
+    kinds = ["asyncio", "flask"] if opts.server == "both" else [opts.server]
+    results = []
+    for n in opts.listeners or [10, 100, 300]:
+        for kind in kinds:
+            results.append(run(kind, n, opts.seconds, opts.port))
+            opts.port += 1  # Don't wait for TIME_WAIT on the previous run's port
+
+    if opts.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{opts.seconds:g} s measured per run, {BITRATE_KBPS} kbps stream\n")
+    print(f"{'server':<8} {'listeners':>9} {'cpu %':>7} {'threads':>8} {'kbps med/min':>14} {'starved':>8} {'first byte ms med/max':>22}")
+    for r in results:
+        print(f"{r['server']:<8} {r['listeners']:>9} {r['cpu_pct']:>7} {r['peak_threads']:>8} "
+              f"{r['kbps_median']:>7}/{r['kbps_min']:<6} {r['starved']:>8} "
+              f"{r['first_byte_ms_median']:>11}/{r['first_byte_ms_max']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,33 +5,157 @@ Cast Daemon - Persistent pychromecast connection manager
 Runs as a long-lived subprocess, maintaining persistent connections to Cast devices.
 This eliminates the 3-5 second mDNS discovery delay on each command.
 
+A single zeroconf CastBrowser runs for the daemon's lifetime and feeds an
+in-memory device registry, so new connections never start a fresh browse.
+
 Communication is via JSON lines on stdin/stdout:
   Input:  {"cmd": "set-volume", "speaker": "Living Room", "volume": 0.5, "ip": "192.168.x.x"}
   Output: {"success": true, "volume": 0.5}
 
-Supported commands:
-  - set-volume: Set speaker volume (0.0-1.0) - INSTANT with cached connection
+Commands run concurrently on a worker pool, so responses may arrive out of
+order - match them to requests using the echoed "requestId".
+
+Supported commands (speaker commands take "speaker" and optional "ip"):
+  - set-volume: Set speaker volume (0.0-1.0) - INSTANT with cached connection.
+    Bursts (slider drags) are coalesced per speaker: superseded targets are
+    dropped and every request is answered with the value actually applied.
   - get-volume: Get current volume
   - ping: Play test sound
   - connect: Establish connection to speaker
   - disconnect: Close connection to speaker
   - status: Get daemon status
+  - discover: List devices from the shared registry (+ group members) {"timeout", "events"}
+    With "events": true, "discover-device"/"discover-group" events (carrying
+    the requestId) arrive as devices are found, before the final response.
+  - get-group-members: Resolve members of a Cast group
+  - device-info: Detailed device status
+  - webrtc-launch: Launch receiver + send WebRTC URL {"url", "stream", "app_id"}
+  - webrtc-proxy-connect: Proxy WHEP signaling {"mediamtx_url", "stream", "app_id"}
+  - webrtc-multicast: webrtc-launch on several speakers {"speakers", "ips", "url", ...}
+  - hls-cast: Cast HLS to a TV {"url", "model", "app_id"}
+  - cast-url: Cast any URL to a TV {"url", "content_type"}
+  - stop / stop-fast: Quit the receiver (plays disconnect chime), keep connection
+  - stop-all: Quit receivers on all (or "speakers") in parallel; answers once audio
+    has stopped, chimes run in the background {"chime", "disconnect"}
+  - measure-latency: Ask the receiver for an RTT measurement {"timeout"}
+  - latency-stream-start: Receiver streams RTT/jitter samples {"interval_ms"}
+  - latency-stream-stop: Stop the stream (returns final stats)
+  - latency-stats: Sliding-window p50/p95/p99 RTT + jitter and recommendedDelay
+  - subscribe: Stream status events for a speaker (no more get-volume polling)
+  - unsubscribe: Stop streaming events for a speaker
+  - telemetry: MediaMTX WebRTC sessions (byte rates, stalls) + paths, sampled in the background
+  - batch: Run several commands in parallel: {"cmd": "batch", "commands": [...]}
   - quit: Shutdown daemon
+
+Any speaker command also accepts "targets" instead of "speaker" to fan out
+across speakers in one round trip (e.g. stereo pairs, multi-room):
+  {"cmd": "set-volume", "volume": 0.4, "targets": ["Left", {"speaker": "Right", "ip": "..."}]}
+Fan-out responses carry per-target "results" plus overall "timings".
+
+Subscribed speakers produce unsolicited event lines (no requestId):
+  {"event": "status", "seq": 12, "speaker": "Living Room", "volume": 0.4, "muted": false, "app_id": "..."}
+  {"event": "media", "seq": 13, "speaker": "Living Room", "player_state": "PLAYING", ...}
+  {"event": "connection", "seq": 14, "speaker": "Living Room", "status": "LOST"}
+"seq" increases monotonically across all events so clients can detect gaps.
+
+stop-all reports each speaker's background chime/disconnect when it finishes:
+  {"event": "stopped", "seq": 16, "speaker": "Living Room", "chime": true, "disconnected": false, "elapsed_ms": 1340}
+
+While a latency stream runs, the recommended sync delay is pushed when it moves:
+  {"event": "latency", "seq": 16, "speaker": "Living Room", "recommendedDelay": 190, "rtt": {"p50": ..., "p95": ..., "p99": ...}, ...}
+
+WebRTC sessions are sampled from MediaMTX in the background; state changes are
+always reported (speaker is null when the receiver IP isn't a connected speaker):
+  {"event": "stream", "seq": 15, "speaker": "Living Room", "state": "stalled", "path": "pcaudio", ...}
+
+Cast operations reuse cast-helper.py's implementations, run against the
+daemon's cached connections instead of a fresh process + discovery.
+
+The daemon also listens on an ephemeral 127.0.0.1 port, published with a
+per-run token in daemon.json next to the device cache. A standalone
+`cast-helper.py <command>` forwards to it (same JSON lines, plus "token";
+one result line per command, no events, no quit) and only runs in-process
+when no daemon answers.
 """
 
 import sys
+import os
 import json
 import time
 import threading
+import importlib.util
+import hmac
+import secrets
+import socketserver
 import pychromecast
+import zeroconf
 from collections import defaultdict
+from contextlib import ExitStack
+from concurrent.futures import ThreadPoolExecutor
 
-# Connection cache: speaker_name -> { cast, browser, connected_at, ip }
+def _load_helper():
+    """Load cast-helper.py as a module (hyphenated filename, so no plain import)."""
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cast-helper.py')
+    spec = importlib.util.spec_from_file_location('cast_helper', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+# Cast operations (webrtc-launch, hls-cast, stop-fast, ...) live in cast-helper.py
+helper = _load_helper()
+
+# Connection cache: speaker_name -> { cast, connected_at, ip, health }
 connections = {}
 connections_lock = threading.Lock()
 
+# Per-speaker locks: serialize work on ONE speaker (connect/disconnect) without
+# blocking commands for every other speaker. Created lazily under connections_lock.
+speaker_locks = defaultdict(threading.RLock)
+
+# Commands are dispatched to a worker pool - a slow mDNS lookup for one
+# unreachable speaker must never freeze volume changes on the others
+MAX_WORKERS = 8
+executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="cmd")
+
+# Serializes writes to stdout so concurrent responses never interleave
+output_lock = threading.Lock()
+
+# Shared discovery: ONE zeroconf instance + CastBrowser for the daemon's lifetime
+zconf = None
+browser = None
+discovery_started_at = None
+known_hosts = set()  # IP hints passed by commands, probed by the browser's host poller
+
+# Device registry fed by the browser: uuid -> CastInfo, plus name/host indexes
+registry = {'by_uuid': {}, 'by_name': {}, 'by_host': {}}
+registry_cond = threading.Condition()  # Notified whenever the registry changes
+
+# How long to wait for a device to appear in the registry
+LOOKUP_TIMEOUT_WITH_IP = 3  # seconds (known host probe)
+LOOKUP_TIMEOUT = 10  # seconds (mDNS only)
+
 # Keep connections alive by refreshing status periodically
 KEEPALIVE_INTERVAL = 30  # seconds
+KEEPALIVE_PROBE_TIMEOUT = 5  # seconds to wait for the receiver's status reply
+
+# Set on shutdown - stops the keepalive supervisor
+shutdown_event = threading.Event()
+
+# Latest-wins volume coalescing: speaker_name -> { target, ip, waiters, draining, last_sent }
+volume_queues = {}
+volume_lock = threading.Lock()
+VOLUME_MIN_INTERVAL = 0.05  # seconds between set_volume() sends per speaker (max 20/s)
+
+# Push subscriptions: speaker_name -> StatusSubscriber (kept, inactive, after unsubscribe)
+subscriptions = {}
+# speaker name -> interval_ms of an active receiver latency stream (restarted on reconnect)
+latency_streams = {}
+event_seq = 0  # Monotonic sequence number for event lines (guarded by output_lock)
+
+# Local control socket: CLI cast-helper.py invocations forward commands here
+control_server = None
+control_token = secrets.token_hex(16)
 
 
 def log(msg):
@@ -39,85 +163,513 @@ def log(msg):
     print(f"[Daemon] {msg}", file=sys.stderr, flush=True)
 
 
+def emit(data):
+    """Write one JSON line to stdout (thread-safe)."""
+    line = json.dumps(data)
+    with output_lock:
+        print(line, flush=True)
+
+
+def emit_event(event, speaker_name, **fields):
+    """Write an unsolicited event line with the next sequence number."""
+    global event_seq
+    with output_lock:
+        event_seq += 1
+        data = {"event": event, "seq": event_seq, "speaker": speaker_name, "ts": time.time()}
+        data.update(fields)
+        print(json.dumps(data), flush=True)
+
+
+def get_speaker_lock(speaker_name):
+    """Get the lock that serializes connection work for one speaker."""
+    with connections_lock:
+        return speaker_locks[speaker_name]
+
+
+def _on_device_update(uuid, _service):
+    """CastBrowser callback: index a new or updated device."""
+    cast_info = browser.devices.get(uuid) if browser else None
+    if not cast_info:
+        return
+    with registry_cond:
+        registry['by_uuid'][uuid] = cast_info
+        registry['by_name'][cast_info.friendly_name] = uuid
+        if cast_info.host:
+            registry['by_host'].setdefault(cast_info.host, set()).add(uuid)
+        registry_cond.notify_all()
+
+
+def _on_device_removed(uuid, _service, cast_info):
+    """CastBrowser callback: drop a device that left the network."""
+    with registry_cond:
+        registry['by_uuid'].pop(uuid, None)
+        if cast_info:
+            if registry['by_name'].get(cast_info.friendly_name) == uuid:
+                del registry['by_name'][cast_info.friendly_name]
+            registry['by_host'].get(cast_info.host, set()).discard(uuid)
+        registry_cond.notify_all()
+
+
+def start_discovery():
+    """Start the shared zeroconf browser (once, at daemon startup)."""
+    global zconf, browser, discovery_started_at
+    zconf = zeroconf.Zeroconf()
+    listener = pychromecast.SimpleCastListener(
+        add_callback=_on_device_update,
+        remove_callback=_on_device_removed,
+        update_callback=_on_device_update
+    )
+    browser = pychromecast.discovery.CastBrowser(listener, zconf)
+    browser.start_discovery()
+    discovery_started_at = time.time()
+    log("Shared discovery browser started")
+
+
+def stop_discovery():
+    """Stop the shared browser and close zeroconf."""
+    global zconf, browser
+    try:
+        if browser:
+            browser.stop_discovery()
+    except:
+        pass
+    try:
+        if zconf:
+            zconf.close()
+    except:
+        pass
+    browser = None
+    zconf = None
+
+
+def add_known_host(speaker_ip):
+    """Ask the shared browser to probe an IP directly (no new mDNS browse)."""
+    if not speaker_ip or not browser:
+        return
+    with registry_cond:
+        if speaker_ip in known_hosts:
+            return
+        known_hosts.add(speaker_ip)
+        hosts = list(known_hosts)
+    host_browser = getattr(browser, 'host_browser', None)
+    if host_browser:
+        host_browser.update_hosts(hosts)
+
+
+def _find_in_registry(speaker_name, speaker_ip=None):
+    """Look up a CastInfo by friendly name, falling back to host. Call with registry_cond held."""
+    uuid = registry['by_name'].get(speaker_name)
+    if uuid:
+        return registry['by_uuid'].get(uuid)
+    if speaker_ip:
+        for uuid in registry['by_host'].get(speaker_ip, ()):
+            cast_info = registry['by_uuid'].get(uuid)
+            if cast_info and cast_info.friendly_name == speaker_name:
+                return cast_info
+    return None
+
+
+def lookup_device(speaker_name, speaker_ip=None):
+    """Wait for a speaker to appear in the registry.
+
+    Already discovered: ~0ms
+    With IP hint: up to LOOKUP_TIMEOUT_WITH_IP (host poller probes the IP)
+    Without IP: up to LOOKUP_TIMEOUT (waits for mDNS announcements)
+    """
+    add_known_host(speaker_ip)
+    timeout = LOOKUP_TIMEOUT_WITH_IP if speaker_ip else LOOKUP_TIMEOUT
+    with registry_cond:
+        registry_cond.wait_for(lambda: _find_in_registry(speaker_name, speaker_ip) is not None, timeout)
+        return _find_in_registry(speaker_name, speaker_ip)
+
+
+def _new_health():
+    """Fresh health record for a just-opened connection."""
+    now = time.time()
+    return {'state': 'ok', 'last_check': now, 'last_ok': now, 'failures': 0, 'reconnects': 0}
+
+
+def _open_connection(speaker_name, speaker_ip=None):
+    """Open a new socket to a speaker (no caching).
+
+    Order: shared registry -> on-disk device cache (host:port, warm start
+    before mDNS has answered) -> wait for the shared browser.
+    """
+    with registry_cond:
+        cast_info = _find_in_registry(speaker_name, speaker_ip)
+
+    if not cast_info:
+        device = helper.find_cached_device(speaker_name, speaker_ip)
+        if device:
+            try:
+                cast = helper.connect_cached(device, speaker_ip, zconf=zconf)
+                log(f"Connected to '{speaker_name}' from device cache ({speaker_ip or device['ip']}:{device.get('port')})")
+                return cast
+            except Exception as e:
+                log(f"Cached address for '{speaker_name}' is stale ({e}), waiting for discovery...")
+        cast_info = lookup_device(speaker_name, speaker_ip)
+
+    if not cast_info:
+        log(f"Speaker '{speaker_name}' not found")
+        return None
+
+    cast = pychromecast.get_chromecast_from_cast_info(cast_info, zconf)
+    cast.wait(timeout=5)
+    return cast
+
+
+def is_connection_alive(cast):
+    """Cheap local liveness check - no network round trip."""
+    try:
+        return cast.socket_client.is_connected and cast.status is not None
+    except Exception:
+        return False
+
+
 def get_or_create_connection(speaker_name, speaker_ip=None):
     """Get existing connection or create new one.
 
     With cached connection: ~0ms
-    With IP hint: ~500ms
-    Without IP: ~3-5s (full mDNS scan)
+    Device already in registry: ~300ms (socket connect only)
+    Not yet discovered: waits for the shared browser (see lookup_device)
+
+    Only the per-speaker lock is held during the lookup - the global
+    connections_lock guards the dict itself and is never held across I/O.
+    A live cached connection is returned without taking the speaker lock, so
+    volume changes never wait behind a long session operation.
     """
     with connections_lock:
+        conn = connections.get(speaker_name)
+    if conn and is_connection_alive(conn['cast']):
+        return conn['cast']
+
+    with get_speaker_lock(speaker_name):
         # Check for existing valid connection
-        if speaker_name in connections:
-            conn = connections[speaker_name]
+        with connections_lock:
+            conn = connections.get(speaker_name)
+
+        if conn:
             cast = conn['cast']
 
-            # Verify connection is still alive
-            try:
-                # Quick status check - if this fails, connection is dead
-                _ = cast.status
+            # Verify connection is still alive (the supervisor normally keeps it so)
+            if is_connection_alive(cast):
                 log(f"Reusing cached connection to '{speaker_name}'")
-                return cast, None  # None browser = don't need to stop discovery
-            except Exception as e:
-                log(f"Cached connection dead: {e}")
-                # Clean up dead connection
-                try:
-                    if conn.get('browser'):
-                        conn['browser'].stop_discovery()
-                except:
-                    pass
-                del connections[speaker_name]
+                return cast
 
-        # Create new connection
+            log(f"Cached connection to '{speaker_name}' is dead")
+            # Clean up dead connection
+            try:
+                cast.disconnect()
+            except:
+                pass
+            with connections_lock:
+                connections.pop(speaker_name, None)
+
+        # Create new connection from the shared registry
         log(f"Creating new connection to '{speaker_name}'...")
 
         try:
-            if speaker_ip:
-                # Fast path: use known_hosts hint
-                log(f"Using known host: {speaker_ip}")
-                chromecasts, browser = pychromecast.get_listed_chromecasts(
-                    friendly_names=[speaker_name],
-                    known_hosts=[speaker_ip],
-                    timeout=3
-                )
-            else:
-                # Slow path: full mDNS discovery
-                log(f"Full mDNS discovery (slow)...")
-                chromecasts, browser = pychromecast.get_listed_chromecasts(
-                    friendly_names=[speaker_name],
-                    timeout=10
-                )
-
-            if not chromecasts:
-                log(f"Speaker '{speaker_name}' not found")
-                browser.stop_discovery()
-                return None, None
-
-            cast = chromecasts[0]
-            cast.wait(timeout=5)
+            cast = _open_connection(speaker_name, speaker_ip)
+            if not cast:
+                return None
 
             # Cache the connection
-            connections[speaker_name] = {
-                'cast': cast,
-                'browser': browser,
-                'connected_at': time.time(),
-                'ip': cast.cast_info.host
-            }
+            with connections_lock:
+                connections[speaker_name] = {
+                    'cast': cast,
+                    'connected_at': time.time(),
+                    'ip': cast.cast_info.host,
+                    'health': _new_health()
+                }
 
             log(f"Connected to '{speaker_name}' at {cast.cast_info.host}")
-            return cast, browser
+            if conn:
+                # Replaced a dead socket: move event streams over to the new one
+                restore_speaker_streams(speaker_name, cast)
+            return cast
 
         except Exception as e:
             log(f"Connection failed: {e}")
-            return None, None
+            return None
 
 
-def set_volume(speaker_name, volume, speaker_ip=None):
-    """Set volume on speaker using cached connection."""
+def probe_connection(cast, timeout=KEEPALIVE_PROBE_TIMEOUT):
+    """Actively probe a connection: request a receiver status and wait for the reply.
+
+    A half-open socket still takes the request, so only an answer counts.
+    Raises if the socket is gone; returns False if it reports disconnected
+    or no reply arrives within timeout.
+    """
+    if not cast.socket_client.is_connected:
+        return False
+    answered = threading.Event()
+    replies = []
+
+    def on_reply(success, _response):
+        replies.append(success)
+        answered.set()
+
+    cast.socket_client.receiver_controller.update_status(callback_function=on_reply)
+    return answered.wait(timeout) and replies[0]
+
+
+def restore_speaker_streams(speaker_name, cast, log_prefix=""):
+    """Move a speaker's status subscription and latency stream onto a new cast.
+
+    Called whenever a dead connection is replaced - by the keepalive
+    supervisor or by a user command that found the socket dead first.
+    """
+    with connections_lock:
+        subscriber = subscriptions.get(speaker_name)
+        latency_interval = latency_streams.get(speaker_name)
+
+    if subscriber and subscriber.active:
+        subscriber.attach(cast)
+    if latency_interval:
+        try:
+            helper.start_latency_stream(speaker_name, cast, latency_interval, on_latency_update)
+        except Exception as e:
+            log(f"{log_prefix}Latency stream restart failed for '{speaker_name}': {e}")
+
+
+def reconnect_speaker(speaker_name, dead_cast):
+    """Background reconnect of a dead cached connection.
+
+    Replaces the cast object in place so the next user command finds a live
+    socket. On failure the entry stays marked 'dead' and will be retried on
+    the next keepalive pass.
+    """
+    with get_speaker_lock(speaker_name):
+        with connections_lock:
+            conn = connections.get(speaker_name)
+        if not conn:
+            return  # Disconnected by the user meanwhile
+
+        # STABILITY: a user command may have replaced the entry with a fresh
+        # connection while we waited for the lock - never tear that down
+        if conn['cast'] is not dead_cast or is_connection_alive(conn['cast']):
+            with connections_lock:
+                if conn['health']['state'] == 'reconnecting':
+                    conn['health']['state'] = 'ok'
+            log(f"[Keepalive] '{speaker_name}' is live again, skipping reconnect")
+            return
+
+        try:
+            conn['cast'].disconnect()
+        except:
+            pass
+
+        try:
+            cast = _open_connection(speaker_name, conn.get('ip'))
+        except Exception as e:
+            log(f"[Keepalive] Reconnect to '{speaker_name}' failed: {e}")
+            cast = None
+
+        with connections_lock:
+            health = conn['health']
+            if cast:
+                conn['cast'] = cast
+                conn['ip'] = cast.cast_info.host
+                health['state'] = 'ok'
+                health['last_ok'] = time.time()
+                health['failures'] = 0
+                health['reconnects'] += 1
+            else:
+                health['state'] = 'dead'
+
+        if cast:
+            log(f"[Keepalive] Reconnected to '{speaker_name}' at {cast.cast_info.host}")
+            restore_speaker_streams(speaker_name, cast, "[Keepalive] ")
+
+
+def keepalive_loop():
+    """Supervisor: probe every cached connection each KEEPALIVE_INTERVAL.
+
+    Dead sockets are reconnected in the background so a user-facing command
+    never pays the reconnect cost.
+    """
+    while not shutdown_event.wait(KEEPALIVE_INTERVAL):
+        with connections_lock:
+            snapshot = list(connections.items())
+
+        for name, conn in snapshot:
+            health = conn['health']
+            if health['state'] == 'reconnecting':
+                continue
+
+            try:
+                alive = probe_connection(conn['cast'])
+            except Exception as e:
+                log(f"[Keepalive] Probe failed for '{name}': {e}")
+                alive = False
+
+            with connections_lock:
+                health['last_check'] = time.time()
+                if alive:
+                    health['state'] = 'ok'
+                    health['last_ok'] = health['last_check']
+                    health['failures'] = 0
+                    continue
+                health['failures'] += 1
+                health['state'] = 'reconnecting'
+                subscriber = subscriptions.get(name)
+
+            log(f"[Keepalive] '{name}' is unreachable, reconnecting in background...")
+            if subscriber:
+                subscriber.send("connection", status="LOST")
+            threading.Thread(target=reconnect_speaker, args=(name, conn['cast']), daemon=True).start()
+
+
+def speaker_for_host(host):
+    """Name of the connected speaker at host, if any."""
+    with connections_lock:
+        for name, conn in connections.items():
+            if conn.get('ip') == host:
+                return name
+    return None
+
+
+def on_stream_change(change, session):
+    """Telemetry callback: report stalled/resumed/closed WebRTC sessions as events."""
+    emit_event("stream", speaker_for_host(session.remote_host),
+               state=change,
+               path=session.path,
+               remote_addr=session.remote_addr,
+               bytes_per_sec=round(session.rate()))
+
+
+class StatusSubscriber:
+    """Forwards pychromecast status callbacks as JSON event lines.
+
+    pychromecast already receives CastStatus/MediaStatus pushes over the open
+    socket - we just relay them instead of making the UI poll get-volume.
+    Identical consecutive payloads are suppressed.
+
+    One subscriber per speaker for the daemon's lifetime: pychromecast has no
+    reliable unregister across versions, so unsubscribing only silences it
+    and subscribing again reactivates the same object - listeners never pile
+    up on a long-lived cast.
+    """
+
+    def __init__(self, speaker_name):
+        self.speaker_name = speaker_name
+        self.active = True
+        self.cast = None  # Cast our listeners are registered on
+        self._last = {}
+
+    def attach(self, cast):
+        """Start relaying from cast - called again after reconnects and re-subscribes."""
+        if cast is not self.cast:
+            cast.register_status_listener(self)
+            cast.media_controller.register_status_listener(self)
+            cast.register_connection_listener(self)
+            self.cast = cast
+        # Forget what was sent for the old socket (e.g. connection LOST) so
+        # the new one's state is pushed, and a later LOST isn't deduplicated
+        self._last = {}
+        # The new cast is connected before we register, so no connection
+        # event would arrive on its own
+        if cast.socket_client.is_connected:
+            self.send("connection", status="CONNECTED")
+        # Push current state immediately so the subscriber starts in sync
+        if cast.status:
+            self.new_cast_status(cast.status)
+
+    def send(self, event, **fields):
+        if not self.active or self._last.get(event) == fields:
+            return
+        self._last[event] = fields
+        emit_event(event, self.speaker_name, **fields)
+
+    def new_cast_status(self, status):
+        self.send(
+            "status",
+            volume=status.volume_level,
+            muted=status.volume_muted,
+            app_id=status.app_id,
+            display_name=status.display_name
+        )
+
+    def new_media_status(self, status):
+        self.send(
+            "media",
+            player_state=status.player_state,
+            content_id=status.content_id,
+            idle_reason=getattr(status, 'idle_reason', None)
+        )
+
+    def load_media_failed(self, item, error_code):
+        self.send("media", player_state="FAILED", error_code=error_code)
+
+    def new_connection_status(self, status):
+        self.send("connection", status=status.status)
+
+
+def subscribe_speaker(speaker_name, speaker_ip=None):
+    """Start streaming status events for a speaker."""
     try:
-        volume = max(0.0, min(1.0, float(volume)))
+        cast = get_or_create_connection(speaker_name, speaker_ip)
+        if not cast:
+            return {"success": False, "error": f"Speaker '{speaker_name}' not found"}
+
+        with connections_lock:
+            subscriber = subscriptions.get(speaker_name)
+            if subscriber is None:
+                subscriber = StatusSubscriber(speaker_name)
+                subscriptions[speaker_name] = subscriber
+            starting = not subscriber.active or subscriber.cast is not cast
+            subscriber.active = True
+
+        if starting:
+            subscriber.attach(cast)
+            log(f"Subscribed to status events from '{speaker_name}'")
+
+        return {"success": True, "speaker": speaker_name, "subscribed": True}
+
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+
+def unsubscribe_speaker(speaker_name):
+    """Stop streaming status events for a speaker."""
+    with connections_lock:
+        subscriber = subscriptions.get(speaker_name)
+        was_active = subscriber is not None and subscriber.active
+        if was_active:
+            # Kept (silent) for a later subscribe - see StatusSubscriber
+            subscriber.active = False
+    if was_active:
+        log(f"Unsubscribed from '{speaker_name}'")
+    return {"success": True, "speaker": speaker_name, "subscribed": False}
+
+
+def on_latency_update(speaker_name, stats):
+    """Latency tracker callback: the recommended delay moved past the hysteresis band."""
+    emit_event("latency", speaker_name, **stats)
+
+
+def start_latency_stream(speaker_name, speaker_ip=None, interval_ms=None):
+    """Have the receiver stream RTT/jitter samples into the speaker's tracker."""
+    interval_ms = int(interval_ms or helper.LATENCY_STREAM_INTERVAL_MS)
+    result = run_with_cast(speaker_name, speaker_ip, lambda cast: helper.start_latency_stream(
+        speaker_name, cast, interval_ms, on_latency_update))
+    if result.get('success'):
+        with connections_lock:
+            latency_streams[speaker_name] = interval_ms
+    return result
+
+
+def stop_latency_stream(speaker_name, speaker_ip=None):
+    """Stop the receiver's latency stream; returns the final window stats."""
+    with connections_lock:
+        latency_streams.pop(speaker_name, None)
+    return run_with_cast(speaker_name, speaker_ip, lambda cast: helper.stop_latency_stream(speaker_name, cast))
 
-        cast, _ = get_or_create_connection(speaker_name, speaker_ip)
+
+def _apply_volume(speaker_name, volume, speaker_ip=None):
+    """Send one volume change to the speaker using the cached connection."""
+    try:
+        cast = get_or_create_connection(speaker_name, speaker_ip)
         if not cast:
             return {"success": False, "error": f"Speaker '{speaker_name}' not found"}
 
@@ -131,10 +683,87 @@ def set_volume(speaker_name, volume, speaker_ip=None):
         return {"success": False, "error": str(e)}
 
 
+def queue_volume(speaker_name, volume, speaker_ip=None, on_done=None):
+    """Queue a volume target; only the latest pending target is ever sent.
+
+    on_done(result) is called once the change covering this request has been
+    applied. A single drainer thread per speaker does the sends, so a burst of
+    slider events never ties up the worker pool.
+    """
+    volume = max(0.0, min(1.0, float(volume)))
+
+    with volume_lock:
+        queue = volume_queues.get(speaker_name)
+        if queue is None:
+            queue = {'target': None, 'ip': None, 'waiters': [], 'draining': False, 'last_sent': 0.0}
+            volume_queues[speaker_name] = queue
+        queue['target'] = volume
+        queue['ip'] = speaker_ip or queue['ip']
+        queue['waiters'].append((volume, on_done))
+        start_drainer = not queue['draining']
+        queue['draining'] = True
+
+    if start_drainer:
+        threading.Thread(target=_drain_volume_queue, args=(speaker_name,), daemon=True).start()
+
+
+def _drain_volume_queue(speaker_name):
+    """Apply the newest queued target at a bounded rate until the queue is empty."""
+    queue = volume_queues[speaker_name]
+    while True:
+        # Rate limit BEFORE snapshotting so targets arriving meanwhile are merged
+        with volume_lock:
+            delay = queue['last_sent'] + VOLUME_MIN_INTERVAL - time.time()
+        if delay > 0:
+            time.sleep(delay)
+
+        with volume_lock:
+            if not queue['waiters']:
+                queue['draining'] = False
+                return
+            target, speaker_ip, waiters = queue['target'], queue['ip'], queue['waiters']
+            queue['waiters'] = []
+
+        result = _apply_volume(speaker_name, target, speaker_ip)
+
+        with volume_lock:
+            queue['last_sent'] = time.time()
+
+        if len(waiters) > 1:
+            log(f"Coalesced {len(waiters)} volume requests for '{speaker_name}' -> {int(target * 100)}%")
+        for requested, on_done in waiters:
+            if not on_done:
+                continue
+            response = dict(result)
+            response['requested'] = requested
+            response['coalesced'] = len(waiters) - 1
+            try:
+                on_done(response)
+            except Exception as e:
+                log(f"Volume callback failed: {e}")
+
+
+def set_volume(speaker_name, volume, speaker_ip=None):
+    """Set volume on speaker and wait for it to be applied (coalesced)."""
+    done = threading.Event()
+    holder = {}
+
+    def on_done(result):
+        holder['result'] = result
+        done.set()
+
+    try:
+        queue_volume(speaker_name, volume, speaker_ip, on_done)
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+    done.wait()
+    return holder['result']
+
+
 def get_volume(speaker_name, speaker_ip=None):
     """Get current volume from speaker."""
     try:
-        cast, _ = get_or_create_connection(speaker_name, speaker_ip)
+        cast = get_or_create_connection(speaker_name, speaker_ip)
         if not cast:
             return {"success": False, "error": f"Speaker '{speaker_name}' not found"}
 
@@ -150,7 +779,7 @@ def get_volume(speaker_name, speaker_ip=None):
 def ping_speaker(speaker_name, speaker_ip=None):
     """Verify connection to speaker (no sound - just connection test)."""
     try:
-        cast, _ = get_or_create_connection(speaker_name, speaker_ip)
+        cast = get_or_create_connection(speaker_name, speaker_ip)
         if not cast:
             return {"success": False, "error": f"Speaker '{speaker_name}' not found"}
 
@@ -171,7 +800,7 @@ def ping_speaker(speaker_name, speaker_ip=None):
 def connect_speaker(speaker_name, speaker_ip=None):
     """Explicitly establish connection to speaker."""
     try:
-        cast, _ = get_or_create_connection(speaker_name, speaker_ip)
+        cast = get_or_create_connection(speaker_name, speaker_ip)
         if not cast:
             return {"success": False, "error": f"Speaker '{speaker_name}' not found"}
 
@@ -193,14 +822,20 @@ def disconnect_speaker(speaker_name):
     the Default Media Receiver before quitting.
     """
     try:
-        with connections_lock:
-            if speaker_name in connections:
-                conn = connections[speaker_name]
+        with get_speaker_lock(speaker_name):
+            with connections_lock:
+                conn = connections.pop(speaker_name, None)
+                latency_streams.pop(speaker_name, None)
+
+            if conn:
                 cast = conn['cast']
 
+                session = helper.get_cast_session(cast)
+
                 # CRITICAL: quit_app() stops the Cast receiver - this actually stops audio!
+                # session.quit() returns as soon as the device reports the app gone
                 try:
-                    cast.quit_app()
+                    session.quit()
                     log(f"Quit Cast app on '{speaker_name}'")
                 except Exception as e:
                     log(f"quit_app failed: {e}")
@@ -208,11 +843,8 @@ def disconnect_speaker(speaker_name):
                 # PLAY DISCONNECT CHIME: Launch Default Media Receiver briefly
                 # The "ding" sound ONLY plays when start_app() is called!
                 try:
-                    time.sleep(0.3)  # Brief pause after quit
-                    cast.start_app("CC1AD845")  # Default Media Receiver - triggers ding!
                     log(f"Playing disconnect chime on '{speaker_name}'")
-                    time.sleep(1.0)  # Let the chime play
-                    cast.quit_app()  # Clean up - leave speaker idle
+                    session.chime()
                 except Exception as e:
                     log(f"Disconnect chime failed (non-critical): {e}")
 
@@ -221,12 +853,7 @@ def disconnect_speaker(speaker_name):
                     cast.disconnect()
                 except:
                     pass
-                try:
-                    if conn.get('browser'):
-                        conn['browser'].stop_discovery()
-                except:
-                    pass
-                del connections[speaker_name]
+                unsubscribe_speaker(speaker_name)
                 log(f"Disconnected from '{speaker_name}'")
                 return {"success": True}
             else:
@@ -236,24 +863,299 @@ def disconnect_speaker(speaker_name):
         return {"success": False, "error": str(e)}
 
 
+STOP_ALL_QUIT_TIMEOUT = 5  # seconds stop-all waits for the quits before answering
+
+
+def _stop_speaker(speaker_name, quit_done, outcome, chime, disconnect):
+    """Worker for stop_all: quit, signal, then chime/disconnect in the background.
+
+    The speaker lock is held for the whole sequence so a new launch on this
+    speaker can't be killed by the chime's trailing quit_app().
+    """
+    start = time.time()
+    chimed = False
+    try:
+        with get_speaker_lock(speaker_name):
+            with connections_lock:
+                conn = connections.pop(speaker_name, None) if disconnect else connections.get(speaker_name)
+                if disconnect:
+                    latency_streams.pop(speaker_name, None)
+
+            if not conn:
+                outcome.update({"success": True, "message": "Not connected"})
+                quit_done.set()
+                return
+
+            cast = conn['cast']
+            session = helper.get_cast_session(cast)
+            # CRITICAL: quit_app() stops the Cast receiver - this actually stops audio!
+            try:
+                session.quit()
+                outcome.update({"success": True, "quit_ms": int((time.time() - start) * 1000)})
+            except Exception as e:
+                outcome.update({"success": False, "error": f"quit_app failed: {e}"})
+            quit_done.set()
+
+            # PLAY DISCONNECT CHIME - caller has already been answered
+            if chime:
+                try:
+                    session.chime()
+                    chimed = True
+                except Exception as e:
+                    log(f"Disconnect chime failed on '{speaker_name}' (non-critical): {e}")
+
+            if disconnect:
+                try:
+                    cast.disconnect()
+                except:
+                    pass
+                unsubscribe_speaker(speaker_name)
+
+        emit_event("stopped", speaker_name,
+                   success=outcome.get("success", False),
+                   chime=chimed,
+                   disconnected=disconnect,
+                   elapsed_ms=int((time.time() - start) * 1000))
+    finally:
+        quit_done.set()
+
+
+def stop_all(speaker_names=None, chime=True, disconnect=False):
+    """Stop every (or the given) connected speaker in parallel.
+
+    Answers as soon as all receivers have quit - audio is already silent then.
+    Disconnect chimes (and socket teardown when disconnect=True) run
+    concurrently in the background; each speaker reports completion with a
+    {"event": "stopped", ...} line.
+    """
+    start = time.time()
+    if speaker_names is None:
+        with connections_lock:
+            speaker_names = list(connections)
+
+    pending = {}
+    for name in speaker_names:
+        quit_done, outcome = threading.Event(), {}
+        pending[name] = (quit_done, outcome)
+        threading.Thread(target=_stop_speaker, args=(name, quit_done, outcome, chime, disconnect),
+                         name=f"stop-{name}", daemon=True).start()
+
+    deadline = start + STOP_ALL_QUIT_TIMEOUT
+    results = {}
+    for name, (quit_done, outcome) in pending.items():
+        if quit_done.wait(max(0, deadline - time.time())):
+            results[name] = dict(outcome)
+        else:
+            results[name] = {"success": False, "error": "Timed out waiting for quit"}
+
+    return {
+        "success": all(r.get("success") for r in results.values()),
+        "results": results,
+        "count": len(results),
+        "background": chime or disconnect,
+        "elapsed_ms": int((time.time() - start) * 1000)
+    }
+
+
+def run_with_cast(speaker_name, speaker_ip, operation):
+    """Run a cast-helper operation against the cached connection for a speaker.
+
+    Holds the speaker lock so two session operations (e.g. launch + stop) on
+    the same speaker never interleave; other speakers are unaffected.
+    """
+    try:
+        with get_speaker_lock(speaker_name):
+            cast = get_or_create_connection(speaker_name, speaker_ip)
+            if not cast:
+                return {"success": False, "error": f"Speaker '{speaker_name}' not found"}
+            return operation(cast)
+    except Exception as e:
+        log(f"Operation on '{speaker_name}' failed: {e}")
+        return {"success": False, "error": str(e)}
+
+
+def registry_snapshot():
+    """Copy of every CastInfo currently known to the shared browser."""
+    with registry_cond:
+        return list(registry['by_uuid'].values())
+
+
+def wait_for_discovery(timeout):
+    """Make sure the shared browser has been listening for at least timeout seconds.
+
+    The browser runs continuously, so after daemon startup this returns at once.
+    """
+    remaining = (discovery_started_at or time.time()) + timeout - time.time()
+    if remaining > 0:
+        time.sleep(remaining)
+
+
+def stream_registry(timeout, on_device):
+    """Call on_device(CastInfo) for every known device, then for each new one
+    that appears until the browser has listened for timeout seconds."""
+    deadline = (discovery_started_at or time.time()) + timeout
+    seen = set()
+    while True:
+        with registry_cond:
+            fresh = [(uuid, info) for uuid, info in registry['by_uuid'].items() if uuid not in seen]
+            if not fresh:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    return
+                registry_cond.wait(remaining)
+                continue
+        for uuid, info in fresh:
+            seen.add(uuid)
+            on_device(info)
+
+
+def discover_devices(timeout=5, request_id=None, events=False):
+    """List all devices from the shared registry, resolving group members.
+
+    Same response shape as `cast-helper.py discover`, but without a new scan.
+    Right after daemon startup (browser still warming up) a fresh on-disk
+    cache answers instantly instead.
+
+    events=True emits a "discover-device" event per device as it is found and
+    a "discover-group" event as each group resolves (tagged with requestId),
+    before the final response.
+    """
+    try:
+        if events:
+            def on_device(info):
+                emit_event("discover-device", info.friendly_name, requestId=request_id,
+                           device=helper.describe_device(info))
+            stream_registry(timeout, on_device)
+        else:
+            if time.time() - (discovery_started_at or 0) < timeout:
+                cached = helper.cached_discover_result()
+                if cached:
+                    log(f"Discover answered from device cache ({len(cached['speakers'])} devices)")
+                    return cached
+            wait_for_discovery(timeout)
+
+        infos = registry_snapshot()
+        info_by_uuid = {str(info.uuid): info for info in infos}
+
+        speakers = []
+        groups = []
+        for info in infos:
+            device_data = helper.describe_device(info)
+            if info.cast_type == 'group':
+                device_data["members"] = []
+                groups.append((info, device_data))
+            speakers.append(device_data)
+
+        def group_done(group_data):
+            if events:
+                emit_event("discover-group", group_data["name"], requestId=request_id,
+                           uuid=group_data["uuid"], members=group_data["members"])
+
+        # All groups resolve concurrently over cached group connections
+        helper.resolve_groups(
+            groups, info_by_uuid,
+            connect=lambda info: get_or_create_connection(info.friendly_name, info.host),
+            on_resolved=group_done
+        )
+
+        helper.summarize_speakers(speakers)
+        helper.save_device_cache(speakers)
+        return {"success": True, "speakers": speakers}
+
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+
+def get_group_members(group_name, group_ip=None):
+    """Resolve the member speakers of a Cast group via the cached connection."""
+    infos = registry_snapshot()
+    if not any(info.friendly_name == group_name and info.cast_type == 'group' for info in infos):
+        wait_for_discovery(LOOKUP_TIMEOUT)
+        infos = registry_snapshot()
+    return run_with_cast(group_name, group_ip, lambda cast: helper.group_members_result(cast, infos))
+
+
+def webrtc_multicast(speaker_names, speaker_ips, https_url, stream_name, app_id):
+    """Launch the WebRTC receiver on several speakers using cached connections.
+
+    Like run_with_cast, but for every member at once: all their speaker locks
+    are held (taken in name order, so overlapping multicasts can't deadlock)
+    from the final connection check until every launch has returned.
+    """
+    def ip_for(index):
+        return speaker_ips[index] if speaker_ips and index < len(speaker_ips) else None
+
+    # Open missing connections in parallel first - each takes its own speaker lock
+    if speaker_names:
+        with ThreadPoolExecutor(max_workers=len(speaker_names)) as pool:
+            list(pool.map(lambda i: get_or_create_connection(speaker_names[i], ip_for(i)), range(len(speaker_names))))
+
+    with ExitStack() as stack:
+        for name in sorted(set(speaker_names)):
+            stack.enter_context(get_speaker_lock(name))
+        casts = {}
+        for index, name in enumerate(speaker_names):
+            # Under the lock: cached unless keepalive/a command replaced it meanwhile
+            cast = get_or_create_connection(name, ip_for(index))
+            if cast:
+                casts[name] = cast
+        return helper.webrtc_launch_multicast(speaker_names, https_url, speaker_ips, stream_name, app_id, casts=casts)
+
+
 def get_status():
     """Get daemon status including active connections."""
     with connections_lock:
         active = []
+        now = time.time()
         for name, conn in connections.items():
+            health = conn['health']
             active.append({
                 "name": name,
                 "ip": conn.get('ip'),
                 "connected_at": conn.get('connected_at'),
-                "age_seconds": int(time.time() - conn.get('connected_at', 0))
+                "age_seconds": int(now - conn.get('connected_at', 0)),
+                "health": {
+                    "state": health['state'],
+                    "last_ok_seconds": int(now - health['last_ok']),
+                    "failures": health['failures'],
+                    "reconnects": health['reconnects']
+                }
             })
 
-        return {
-            "success": True,
-            "running": True,
-            "connections": active,
-            "connection_count": len(active)
-        }
+    with registry_cond:
+        known_devices = len(registry['by_uuid'])
+
+    # Outside connections_lock: telemetry_summary() -> speaker_for_host() takes it
+    return {
+        "success": True,
+        "running": True,
+        "connections": active,
+        "connection_count": len(active),
+        "known_devices": known_devices,
+        "keepalive_interval": KEEPALIVE_INTERVAL,
+        "http": helper.http_pool.metrics(),
+        "telemetry": telemetry_summary()
+    }
+
+
+def telemetry_summary():
+    """Compact per-speaker view of the MediaMTX sampler for status/health."""
+    snapshot = helper.telemetry.snapshot()
+    streams = []
+    for session in snapshot['sessions']:
+        host = session['remote_addr'].rsplit(':', 1)[0].strip('[]')
+        streams.append({
+            "speaker": speaker_for_host(host),
+            "path": session['path'],
+            "bytes_per_sec": session['bytes_per_sec'],
+            "stalled": session['stalled']
+        })
+    return {
+        "api_ok": snapshot['api_ok'],
+        "last_sample_ms_ago": snapshot['last_sample_ms_ago'],
+        "stalled": snapshot['stalled'],
+        "streams": streams
+    }
 
 
 def cleanup_all():
@@ -265,26 +1167,107 @@ def cleanup_all():
                 conn['cast'].disconnect()
             except:
                 pass
-            try:
-                if conn.get('browser'):
-                    conn['browser'].stop_discovery()
-            except:
-                pass
         connections.clear()
+    helper.http_pool.close()
     log("All connections closed")
 
 
-def process_command(cmd_data):
-    """Process a single command and return result."""
+# Commands that make no sense inside a batch / fan-out
+NON_BATCHABLE = ('batch', 'quit')
+
+
+def expand_targets(cmd_data):
+    """Turn {"cmd": X, "targets": [...]} into one sub-command per speaker.
+
+    A target is a speaker name or a dict of per-target overrides
+    (speaker, ip, volume, ...).
+    """
+    base = {k: v for k, v in cmd_data.items() if k not in ('targets', 'requestId')}
+    commands = []
+    for target in cmd_data.get('targets') or []:
+        sub = dict(base)
+        if isinstance(target, dict):
+            sub.update(target)
+        else:
+            sub['speaker'] = target
+        commands.append(sub)
+    return commands
+
+
+def _timed_command(sub):
+    """Run one batch entry synchronously and time it."""
+    start = time.time()
+    if sub.get('cmd') in NON_BATCHABLE:
+        result = {"success": False, "error": f"'{sub.get('cmd')}' not allowed in batch"}
+    else:
+        try:
+            result = process_command(sub, sync=True)
+        except Exception as e:
+            result = {"success": False, "error": str(e)}
+    result['cmd'] = sub.get('cmd')
+    if sub.get('speaker'):
+        result['speaker'] = sub['speaker']
+    result['elapsed_ms'] = int((time.time() - start) * 1000)
+    return result
+
+
+def run_batch(commands):
+    """Run commands in parallel (one thread each) and collect per-entry results.
+
+    Uses its own short-lived threads rather than the shared pool - a batch
+    worker waiting on sub-tasks queued behind it could otherwise deadlock.
+    """
+    start = time.time()
+    if not commands:
+        return {"success": False, "error": "No commands/targets given", "results": []}
+
+    with ThreadPoolExecutor(max_workers=len(commands), thread_name_prefix="batch") as pool:
+        results = list(pool.map(_timed_command, commands))
+
+    succeeded = sum(1 for r in results if r.get('success'))
+    return {
+        "success": succeeded == len(results),
+        "results": results,
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded,
+        "timings": {
+            "total_ms": int((time.time() - start) * 1000),
+            "slowest_ms": max(r['elapsed_ms'] for r in results)
+        }
+    }
+
+
+def process_command(cmd_data, sync=False):
+    """Process a single command and return result.
+
+    Returns None for commands that respond asynchronously (set-volume),
+    unless sync=True (batch entries), which waits for the result instead.
+    """
     cmd = cmd_data.get('cmd', '')
     speaker = cmd_data.get('speaker', '')
     speaker_ip = cmd_data.get('ip', None)
     # STABILITY: Echo back requestId for response correlation (stereo mode reliability)
     request_id = cmd_data.get('requestId', None)
 
-    if cmd == 'set-volume':
+    if cmd == 'batch':
+        result = run_batch(cmd_data.get('commands') or [])
+
+    elif cmd_data.get('targets') is not None and cmd not in NON_BATCHABLE:
+        result = run_batch(expand_targets(cmd_data))
+
+    elif cmd == 'set-volume' and sync:
+        result = set_volume(speaker, cmd_data.get('volume', 0.5), speaker_ip)
+
+    elif cmd == 'set-volume':
+        # Answered asynchronously by the speaker's volume drainer
+        def respond(result):
+            if request_id is not None:
+                result['requestId'] = request_id
+            emit(result)
+
         volume = cmd_data.get('volume', 0.5)
-        result = set_volume(speaker, volume, speaker_ip)
+        queue_volume(speaker, volume, speaker_ip, on_done=respond)
+        return None
 
     elif cmd == 'get-volume':
         result = get_volume(speaker, speaker_ip)
@@ -298,9 +1281,70 @@ def process_command(cmd_data):
     elif cmd == 'disconnect':
         result = disconnect_speaker(speaker)
 
+    elif cmd == 'stop-all':
+        result = stop_all(cmd_data.get('speakers'), cmd_data.get('chime', True), cmd_data.get('disconnect', False))
+
     elif cmd == 'status':
         result = get_status()
 
+    elif cmd == 'discover':
+        result = discover_devices(cmd_data.get('timeout', 5), request_id, cmd_data.get('events', False))
+
+    elif cmd == 'get-group-members':
+        result = get_group_members(speaker, speaker_ip)
+
+    elif cmd == 'device-info':
+        result = run_with_cast(speaker, speaker_ip, lambda cast: helper.device_info(speaker, cast=cast))
+
+    elif cmd == 'webrtc-launch':
+        result = run_with_cast(speaker, speaker_ip, lambda cast: helper.webrtc_launch(
+            speaker, cmd_data.get('url'), speaker_ip,
+            cmd_data.get('stream', 'pcaudio'), cmd_data.get('app_id'), cast=cast))
+
+    elif cmd == 'webrtc-proxy-connect':
+        result = run_with_cast(speaker, speaker_ip, lambda cast: helper.webrtc_proxy_connect(
+            speaker, cmd_data.get('mediamtx_url'), speaker_ip,
+            cmd_data.get('stream', 'pcaudio'), cmd_data.get('app_id'), cast=cast))
+
+    elif cmd == 'webrtc-multicast':
+        result = webrtc_multicast(
+            cmd_data.get('speakers') or [], cmd_data.get('ips'), cmd_data.get('url'),
+            cmd_data.get('stream', 'pcaudio'), cmd_data.get('app_id'))
+
+    elif cmd == 'hls-cast':
+        result = run_with_cast(speaker, speaker_ip, lambda cast: helper.hls_cast_to_tv(
+            speaker, cmd_data.get('url'), speaker_ip,
+            cmd_data.get('model'), cmd_data.get('app_id'), cast=cast))
+
+    elif cmd == 'cast-url':
+        result = run_with_cast(speaker, speaker_ip, lambda cast: helper.cast_url_to_tv(
+            speaker, cmd_data.get('url'), cmd_data.get('content_type'), speaker_ip, cast=cast))
+
+    elif cmd in ('stop', 'stop-fast'):
+        result = run_with_cast(speaker, speaker_ip, lambda cast: helper.stop_cast_fast(speaker, speaker_ip, cast=cast))
+
+    elif cmd == 'measure-latency':
+        result = run_with_cast(speaker, speaker_ip, lambda cast: helper.measure_latency(
+            speaker, speaker_ip, cmd_data.get('timeout', 15), cast=cast))
+
+    elif cmd == 'subscribe':
+        result = subscribe_speaker(speaker, speaker_ip)
+
+    elif cmd == 'unsubscribe':
+        result = unsubscribe_speaker(speaker)
+
+    elif cmd == 'latency-stream-start':
+        result = start_latency_stream(speaker, speaker_ip, cmd_data.get('interval_ms'))
+
+    elif cmd == 'latency-stream-stop':
+        result = stop_latency_stream(speaker, speaker_ip)
+
+    elif cmd == 'latency-stats':
+        result = {"success": True, "speaker": speaker, **helper.get_latency_tracker(speaker).stats()}
+
+    elif cmd == 'telemetry':
+        result = {"success": True, **helper.telemetry.snapshot()}
+
     elif cmd == 'quit':
         cleanup_all()
         result = {"success": True, "message": "Daemon shutting down"}
@@ -315,9 +1359,128 @@ def process_command(cmd_data):
     return result
 
 
+def run_command(cmd_data):
+    """Worker-pool entry point: process one command and write its response."""
+    try:
+        result = process_command(cmd_data)
+    except Exception as e:
+        log(f"Command '{cmd_data.get('cmd', 'unknown')}' crashed: {e}")
+        result = {"success": False, "error": str(e)}
+        if cmd_data.get('requestId') is not None:
+            result['requestId'] = cmd_data['requestId']
+    if result is not None:
+        emit(result)
+
+
+# =============================================================================
+# LOCAL CONTROL SOCKET
+# =============================================================================
+# cast-helper.py is still spawned directly (by Electron, scripts, the user).
+# Instead of paying its own discovery + connect, it forwards the command to us
+# over 127.0.0.1 and gets the answer from our warm connections. The port and a
+# per-run token are published in helper.daemon_control_path().
+
+class ControlHandler(socketserver.StreamRequestHandler):
+    """One JSON command per line in, one JSON result per line out."""
+
+    def handle(self):
+        for line in self.rfile:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                cmd_data = json.loads(line)
+            except json.JSONDecodeError as e:
+                self.reply({"success": False, "error": f"Invalid JSON: {e}"})
+                continue
+
+            # STABILITY: any local process can connect - only token holders
+            # (readers of our control file) may drive the speakers
+            token = str(cmd_data.pop('token', '') or '')
+            if not hmac.compare_digest(token, control_token):
+                self.reply({"success": False, "error": "Unauthorized", "error_code": "UNAUTHORIZED"})
+                return
+
+            cmd = cmd_data.get('cmd', 'unknown')
+            log(f"Received (socket): {cmd}")
+            if cmd == 'quit':
+                # Lifetime belongs to whoever owns our stdin (Electron)
+                result = {"success": False, "error": "quit is only accepted on stdin"}
+            else:
+                # One-shot clients read a single line: no discover events
+                # ("stream" is left alone - it names the WebRTC stream)
+                if cmd == 'discover':
+                    cmd_data['events'] = False
+                try:
+                    result = process_command(cmd_data, sync=True)
+                except Exception as e:
+                    log(f"Socket command '{cmd}' crashed: {e}")
+                    result = {"success": False, "error": str(e)}
+            self.reply(result)
+
+    def reply(self, result):
+        try:
+            self.wfile.write((json.dumps(result) + "\n").encode('utf-8'))
+            self.wfile.flush()
+        except OSError:
+            pass  # Client gave up (timeout) - nothing to deliver to
+
+
+class ControlServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+def start_control_server():
+    """Listen on an ephemeral localhost port and publish it for cast-helper.py."""
+    global control_server
+    try:
+        control_server = ControlServer(('127.0.0.1', 0), ControlHandler)
+    except OSError as e:
+        log(f"Control socket unavailable ({e}) - CLI commands will run standalone")
+        return
+    threading.Thread(target=control_server.serve_forever, name="control", daemon=True).start()
+
+    path = helper.daemon_control_path()
+    control = {"port": control_server.server_address[1], "pid": os.getpid(), "token": control_token}
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(control, f)
+        os.replace(tmp_path, path)  # Atomic: clients never read a half-written file
+        log(f"Control socket on 127.0.0.1:{control['port']}")
+    except OSError as e:
+        log(f"Could not publish control socket: {e}")
+
+
+def stop_control_server():
+    """Stop accepting CLI commands and withdraw the control file (if still ours)."""
+    if control_server is None:
+        return
+    control_server.shutdown()
+    control_server.server_close()
+    path = helper.daemon_control_path()
+    try:
+        with open(path, encoding='utf-8') as f:
+            if json.load(f).get('pid') == os.getpid():
+                os.remove(path)
+    except (OSError, ValueError):
+        pass
+
+
 def main():
-    """Main daemon loop - read JSON commands from stdin, write results to stdout."""
+    """Main daemon loop - read JSON commands from stdin, write results to stdout.
+
+    Each command is handed to the worker pool so a slow speaker never blocks
+    the reader. Only 'quit' runs inline, after in-flight commands finish.
+    """
     log("Cast Daemon starting...")
+    start_discovery()
+    threading.Thread(target=keepalive_loop, name="keepalive", daemon=True).start()
+    helper.telemetry.on_change = on_stream_change
+    helper.telemetry.start()
+    start_control_server()
     log("Reading JSON commands from stdin...")
 
     try:
@@ -330,26 +1493,28 @@ def main():
                 cmd_data = json.loads(line)
                 log(f"Received: {cmd_data.get('cmd', 'unknown')}")
 
-                result = process_command(cmd_data)
-
-                # Output result as JSON line
-                print(json.dumps(result), flush=True)
-
-                # Handle quit command
+                # Handle quit command - drain in-flight work, then shut down
                 if cmd_data.get('cmd') == 'quit':
+                    executor.shutdown(wait=True)
+                    emit(process_command(cmd_data))
                     break
 
+                executor.submit(run_command, cmd_data)
+
             except json.JSONDecodeError as e:
-                error_result = {"success": False, "error": f"Invalid JSON: {e}"}
-                print(json.dumps(error_result), flush=True)
+                emit({"success": False, "error": f"Invalid JSON: {e}"})
             except Exception as e:
-                error_result = {"success": False, "error": str(e)}
-                print(json.dumps(error_result), flush=True)
+                emit({"success": False, "error": str(e)})
 
     except KeyboardInterrupt:
         log("Interrupted")
     finally:
+        shutdown_event.set()
+        stop_control_server()
+        executor.shutdown(wait=False)
+        helper.telemetry.stop()
         cleanup_all()
+        stop_discovery()
         log("Daemon stopped")
 
 
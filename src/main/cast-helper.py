@@ -8,16 +8,65 @@ Supports:
 - cast: HTTP streaming (MP3/HLS)
 - webrtc: Launch custom receiver and relay signaling messages
 - stop: Stop casting
+
+Any command accepts --profile-startup: module-load, lazy-import and command
+timings are reported as a JSON line on stderr (see scripts/bench_startup.py).
+
+If cast-daemon.py is running, Cast commands are forwarded to it over its
+localhost control socket and answered from its warm connections; otherwise
+(or with --no-daemon) they run in-process as before.
 """
+import time
+_module_start = time.perf_counter()
+
 import sys
 import os
-import subprocess
 import json
-import time
 import threading
 import functools
-import pychromecast
-from pychromecast.controllers import BaseController
+import weakref
+import itertools
+import math
+import collections
+import importlib
+import types
+
+
+# =============================================================================
+# STARTUP: Lazy imports
+# =============================================================================
+# pychromecast pulls in zeroconf + protobuf (hundreds of ms on Windows). Every
+# Electron call spawns a fresh interpreter, and commands like get-audio-outputs
+# never touch Cast - so the import happens on first use, not at module load.
+# Same for heavier stdlib modules (subprocess, http.client, concurrent.futures):
+# imported inside the functions that need them.
+
+import_timings = {}  # module name -> import time in ms (see --profile-startup)
+
+
+def timed_import(name):
+    """Import a module, recording how long the first import took."""
+    if name in sys.modules:
+        return sys.modules[name]
+    start = time.perf_counter()
+    module = importlib.import_module(name)
+    import_timings[name] = round((time.perf_counter() - start) * 1000, 1)
+    return module
+
+
+class LazyModule(types.ModuleType):
+    """Module stand-in that performs the real import on first attribute access."""
+
+    def __init__(self, name):
+        super().__init__(name)
+
+    def __getattr__(self, attr):
+        module = timed_import(self.__name__)
+        globals()[self.__name__] = module  # Later lookups skip the proxy
+        return getattr(module, attr)
+
+
+pychromecast = LazyModule('pychromecast')
 
 
 # =============================================================================
@@ -59,32 +108,31 @@ AUDIO_APP_ID = "4B876246"
 CUSTOM_APP_ID = AUDIO_APP_ID
 WEBRTC_NAMESPACE = "urn:x-cast:com.pcnestspeaker.webrtc"
 
+# Max time a multicast member waits for the others before connecting anyway
+MULTICAST_BARRIER_TIMEOUT = 15  # seconds
+# Max time webrtc_launch() waits on MediaMTX telemetry for the receiver's session to carry data
+WEBRTC_VERIFY_TIMEOUT = 4.0  # seconds
 
-def wait_for_receiver_ready(cast, expected_app_id, max_wait=3.0, poll_interval=0.3):
-    """Wait for Cast receiver to be ready using polling instead of fixed sleep.
 
-    STABILITY/LATENCY: This replaces blind time.sleep(3) calls with smart polling.
-    Saves 1-2 seconds on average when receiver loads quickly.
+def wait_for_receiver_ready(cast, expected_app_id, max_wait=3.0):
+    """Wait for Cast receiver to be ready.
+
+    STABILITY/LATENCY: Woken by the CastStatus event for the app (see CastSession)
+    instead of polling - returns the moment the device reports it running.
 
     Args:
         cast: The pychromecast Cast object
         expected_app_id: The app ID we launched
         max_wait: Maximum time to wait in seconds
-        poll_interval: Time between status checks
 
     Returns:
         bool: True if receiver is ready, False if timed out
     """
     start = time.time()
-    while time.time() - start < max_wait:
-        try:
-            if cast.status and cast.status.app_id == expected_app_id:
-                elapsed = time.time() - start
-                print(f"[Cast] Receiver ready in {elapsed:.1f}s", file=sys.stderr)
-                return True
-        except:
-            pass
-        time.sleep(poll_interval)
+    if get_cast_session(cast).wait_for_app(expected_app_id, max_wait):
+        elapsed = time.time() - start
+        print(f"[Cast] Receiver ready in {elapsed:.1f}s", file=sys.stderr)
+        return True
 
     print(f"[Cast] Receiver not confirmed ready after {max_wait}s, proceeding anyway", file=sys.stderr)
     return False
@@ -143,34 +191,1073 @@ def get_chromecast_with_retry(speaker_name, speaker_ip=None, timeout=10, max_att
     raise last_error
 
 
-class WebRTCController(BaseController):
-    """Controller for WebRTC signaling messages."""
+class WebRTCMessaging:
+    """Controller for WebRTC signaling messages (mixed into pychromecast's
+    BaseController by webrtc_controller_class(), so it loads lazily).
+
+    Request/response exchanges are multiplexed: request() tags the message with
+    a requestId and registers a Future BEFORE sending, so a fast reply can't be
+    missed. Replies are routed by requestId when the receiver echoes it, else to
+    the oldest pending request expecting that message type. Streams (e.g.
+    latency samples) go to the listener set for their type. Anything else is
+    queued for wait_for_message().
+    """
+
+    MAX_QUEUED = 100
 
     def __init__(self):
         super().__init__(WEBRTC_NAMESPACE, "pcnestspeaker.webrtc")
         self.messages = []
-        self.message_event = threading.Event()
+        self.message_cond = threading.Condition()
+        self.pending = {}  # requestId -> (reply_types, Future), in send order
+        self.listeners = {}  # message type -> callback(data)
+        self.request_ids = itertools.count(1)
 
     def receive_message(self, _message, data):
         """Called when we receive a message from the Cast device."""
         print(f"[WebRTC] Received: {json.dumps(data)}", file=sys.stderr)
-        self.messages.append(data)
-        self.message_event.set()
+        future = None
+        listener = None
+        with self.message_cond:
+            request_id = data.get('requestId')
+            if request_id in self.pending:
+                future = self.pending.pop(request_id)[1]
+            else:
+                for pending_id, (reply_types, pending_future) in self.pending.items():
+                    if data.get('type') in reply_types:
+                        future = pending_future
+                        del self.pending[pending_id]
+                        break
+            if future is None:
+                listener = self.listeners.get(data.get('type'))
+            if future is None and listener is None:
+                self.messages.append(data)
+                del self.messages[:-self.MAX_QUEUED]
+                self.message_cond.notify_all()
+        if future is not None and not future.done():
+            future.set_result(data)
+        elif listener is not None:
+            try:
+                listener(data)
+            except Exception as e:
+                print(f"[WebRTC] Listener for '{data.get('type')}' failed: {e}", file=sys.stderr)
         return True
 
+    def set_listener(self, message_type, callback):
+        """Route every unsolicited message of message_type to callback (None removes it)."""
+        with self.message_cond:
+            if callback is None:
+                self.listeners.pop(message_type, None)
+            else:
+                self.listeners[message_type] = callback
+
     def send_message(self, data):
         """Send a message to the Cast device."""
         print(f"[WebRTC] Sending: {json.dumps(data)}", file=sys.stderr)
         self.send_message_nocheck(data)
 
-    def wait_for_message(self, timeout=10):
-        """Wait for a message from the Cast device."""
-        self.message_event.clear()
-        if self.message_event.wait(timeout):
-            if self.messages:
-                return self.messages.pop(0)
+    def request(self, data, reply_types):
+        """Send data tagged with a new requestId; returns a Future for the reply.
+
+        reply_types: message types that answer this request (used when the
+                     receiver doesn't echo requestId).
+        """
+        from concurrent.futures import Future
+        future = Future()
+        with self.message_cond:
+            request_id = f"py-{next(self.request_ids)}"
+            self.pending[request_id] = (tuple(reply_types), future)
+        future.request_id = request_id
+        try:
+            self.send_message({**data, "requestId": request_id})
+        except Exception as e:
+            self.cancel(future)
+            future.set_exception(e)
+        return future
+
+    def cancel(self, future):
+        """Forget a pending request (e.g. after its caller timed out)."""
+        with self.message_cond:
+            self.pending.pop(getattr(future, 'request_id', None), None)
+
+    def call(self, data, reply_types, timeout=10):
+        """request() and wait for the reply. Returns None on timeout."""
+        from concurrent.futures import TimeoutError as FutureTimeoutError
+        future = self.request(data, reply_types)
+        try:
+            return future.result(timeout)
+        except FutureTimeoutError:
+            self.cancel(future)
+            return None
+
+    def wait_for_message(self, timeout=10, types=None):
+        """Wait for an unsolicited message (optionally of the given types).
+
+        Messages that arrived before the call are returned immediately.
+        """
+        def take():
+            for i, message in enumerate(self.messages):
+                if types is None or message.get('type') in types:
+                    return self.messages.pop(i)
+            return None
+
+        deadline = time.time() + timeout
+        with self.message_cond:
+            message = take()
+            while message is None:
+                remaining = deadline - time.time()
+                if remaining <= 0 or not self.message_cond.wait(remaining):
+                    return take()
+                message = take()
+            return message
+
+
+# Controllers registered per cast object. Registering a new controller on every
+# call would stack duplicate handlers on long-lived (daemon) connections.
+_controllers = weakref.WeakKeyDictionary()
+_controllers_lock = threading.Lock()
+
+
+def _get_controller(cast, key, factory):
+    """Return the cast's controller for key, creating and registering it once."""
+    with _controllers_lock:
+        per_cast = _controllers.setdefault(cast, {})
+        controller = per_cast.get(key)
+        if controller is None:
+            controller = factory()
+            cast.register_handler(controller)
+            per_cast[key] = controller
+        return controller
+
+
+@functools.lru_cache(maxsize=None)
+def webrtc_controller_class():
+    """Build WebRTCController on first use - BaseController needs pychromecast."""
+    BaseController = timed_import('pychromecast.controllers').BaseController
+
+    class WebRTCController(WebRTCMessaging, BaseController):
+        pass
+
+    return WebRTCController
+
+
+def __getattr__(name):
+    # Keep helper.WebRTCController working for importers
+    if name == 'WebRTCController':
+        return webrtc_controller_class()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def get_webrtc_controller(cast):
+    """Get the (single) WebRTC namespace controller for a cast."""
+    return _get_controller(cast, 'webrtc', webrtc_controller_class())
+
+
+class MultizoneStatusWaiter:
+    """Multizone listener that signals when a group's member list arrives."""
+
+    def __init__(self):
+        self.event = threading.Event()
+
+    def multizone_member_added(self, uuid):
+        pass
+
+    def multizone_member_removed(self, uuid):
+        pass
+
+    def multizone_status_received(self):
+        self.event.set()
+
+
+def get_multizone_controller(cast):
+    """Get the (single) multizone controller for a cast group, plus its status waiter."""
+    from pychromecast.controllers.multizone import MultizoneController
+
+    def create():
+        mz = MultizoneController(cast.uuid)
+        mz.waiter = MultizoneStatusWaiter()
+        mz.register_listener(mz.waiter)
+        return mz
+
+    return _get_controller(cast, 'multizone', create)
+
+
+# =============================================================================
+# CAST SESSION LIFECYCLE
+# =============================================================================
+# LATENCY: Instead of fixed sleeps after quit_app()/start_app()/play_media(),
+# every step waits on the real CastStatus / MediaStatus events with a deadline.
+# A fast device moves through the states as fast as it answers; a slow one
+# still gets the full budget.
+
+DEFAULT_MEDIA_RECEIVER_ID = "CC1AD845"
+# App IDs reported while nothing is really running (backdrop / idle screen)
+IDLE_APP_IDS = (None, "E8C28D3C")
+
+SESSION_STOP_TIMEOUT = 3.0      # quit_app() -> app gone
+SESSION_LAUNCH_TIMEOUT = 10.0   # start_app() -> app reported running
+SESSION_MEDIA_TIMEOUT = 10.0    # play_media() -> first media status
+# The disconnect "ding" is audio with no completion event - hold the
+# Default Media Receiver just long enough for it to play.
+CHIME_HOLD = 1.0
+
+
+class CastSession:
+    """State machine driven by a cast's status events.
+
+    States: IDLE -> LAUNCHING -> READY -> LOADING -> PLAYING / BUFFERING,
+    and STOPPING back to IDLE. Transitions happen in the status callbacks;
+    callers block in wait_until() on a Condition with a deadline.
+    """
+
+    IDLE = "IDLE"
+    STOPPING = "STOPPING"
+    LAUNCHING = "LAUNCHING"
+    READY = "READY"
+    LOADING = "LOADING"
+    PLAYING = "PLAYING"
+    BUFFERING = "BUFFERING"
+
+    def __init__(self, cast):
+        self.cast = cast
+        self.cond = threading.Condition()
+        self.app_id = cast.status.app_id if cast.status else None
+        self.state = self.IDLE if self.app_id in IDLE_APP_IDS else self.READY
+        self.target_app_id = None
+        self.media_status = None
+        self.media_updates = 0
+        self.load_error = None
+        cast.register_status_listener(self)
+        cast.media_controller.register_status_listener(self)
+
+    # --- pychromecast listener callbacks (socket thread) ---
+
+    def new_cast_status(self, status):
+        with self.cond:
+            self.app_id = status.app_id if status else None
+            if self.app_id in IDLE_APP_IDS:
+                if self.state != self.LAUNCHING:
+                    self.state = self.IDLE
+            elif self.app_id == self.target_app_id and self.state in (self.IDLE, self.LAUNCHING):
+                self.state = self.READY
+            self.cond.notify_all()
+
+    def new_media_status(self, status):
+        with self.cond:
+            self.media_status = status
+            self.media_updates += 1
+            if status and status.player_state in (self.PLAYING, self.BUFFERING):
+                self.state = status.player_state
+            self.cond.notify_all()
+
+    def load_media_failed(self, queue_item_id=None, error_code=None):
+        with self.cond:
+            self.load_error = error_code or "LOAD_FAILED"
+            self.cond.notify_all()
+
+    # --- waiting ---
+
+    def wait_until(self, predicate, timeout):
+        """Block until predicate() is true (evaluated under the lock) or timeout.
+
+        Returns the predicate's final value.
+        """
+        with self.cond:
+            return self.cond.wait_for(predicate, timeout)
+
+    def app_running(self, app_id):
+        return self.app_id == app_id
+
+    def wait_for_app(self, app_id, timeout=SESSION_LAUNCH_TIMEOUT):
+        """Wait for app_id to be reported running. Asks for a fresh status first."""
+        if self.app_running(app_id):
+            return True
+        try:
+            self.cast.socket_client.receiver_controller.update_status()
+        except Exception:
+            pass
+        return self.wait_until(lambda: self.app_id == app_id, timeout)
+
+    # --- transitions ---
+
+    def quit(self, timeout=SESSION_STOP_TIMEOUT):
+        """Quit the running app and wait for the device to report it gone.
+
+        No-op when nothing is running. Returns True once the app is gone.
+        """
+        with self.cond:
+            running = self.app_id
+            if running in IDLE_APP_IDS:
+                self.state = self.IDLE
+                return True
+            self.state = self.STOPPING
+        self.cast.quit_app()
+        return self.wait_until(lambda: self.app_id != running, timeout)
+
+    def launch(self, app_id, timeout=SESSION_LAUNCH_TIMEOUT, fresh=True):
+        """Start app_id and wait until the device reports it running.
+
+        fresh: quit whatever is running first - the Cast "ding" only plays
+               when a NEW app starts, not when resuming the same one.
+        Raises whatever start_app() raises (callers classify launch errors).
+        Returns True when the app was confirmed, False on timeout.
+        """
+        start = time.time()
+        if fresh:
+            try:
+                self.quit()
+            except Exception:
+                pass  # Ignore if nothing to quit
+        with self.cond:
+            self.target_app_id = app_id
+            self.state = self.LAUNCHING
+        self.cast.start_app(app_id, timeout=timeout)
+        remaining = max(0.5, timeout - (time.time() - start))
+        ready = self.wait_for_app(app_id, remaining)
+        with self.cond:
+            if ready:
+                self.state = self.READY
+        return ready
+
+    def play(self, url, content_type, timeout=SESSION_MEDIA_TIMEOUT, **kwargs):
+        """play_media() and wait for the first media status that follows it.
+
+        Returns the MediaStatus (None on timeout).
+        """
+        with self.cond:
+            seen = self.media_updates
+            self.load_error = None
+            self.state = self.LOADING
+        self.cast.media_controller.play_media(url, content_type, **kwargs)
+        self.wait_until(lambda: self.media_updates > seen or self.load_error, timeout)
+        return self.media_status if self.media_updates > seen else None
+
+    def wait_for_playback(self, timeout=SESSION_MEDIA_TIMEOUT):
+        """Wait for PLAYING/BUFFERING, a load failure, or an IDLE with a reason."""
+        def settled():
+            status = self.media_status
+            if self.load_error:
+                return True
+            if not status:
+                return False
+            if status.player_state in (self.PLAYING, self.BUFFERING):
+                return True
+            return status.player_state == "IDLE" and bool(getattr(status, 'idle_reason', None))
+        self.wait_until(settled, timeout)
+        return self.media_status
+
+    def chime(self):
+        """Play the Cast "ding" by briefly launching the Default Media Receiver."""
+        self.launch(DEFAULT_MEDIA_RECEIVER_ID, timeout=SESSION_STOP_TIMEOUT * 2, fresh=False)
+        time.sleep(CHIME_HOLD)
+        self.cast.quit_app()  # Leave speaker idle
+
+    def stop(self, chime=True, log_prefix="[stop]"):
+        """Quit the app (stops audio), then optionally play the disconnect chime."""
+        self.quit()
+        if chime:
+            try:
+                self.chime()
+            except Exception as e:
+                print(f"{log_prefix} Disconnect chime failed (non-critical): {e}", file=sys.stderr)
+
+
+def get_cast_session(cast):
+    """Get the (single) session state machine for a cast."""
+    with _controllers_lock:
+        per_cast = _controllers.setdefault(cast, {})
+        session = per_cast.get('session')
+        if session is None:
+            session = per_cast['session'] = CastSession(cast)
+        return session
+
+
+# =============================================================================
+# MEDIAMTX HTTP CLIENT (keep-alive pool)
+# =============================================================================
+# LATENCY: WHEP signaling and control-API polls reuse persistent HTTP/1.1
+# connections instead of paying TCP (and TLS) setup per request - matters when
+# many speakers come up at once. In the daemon the pool lives for the process.
+
+MEDIAMTX_API = "http://localhost:9997"
+
+
+class HTTPConnectionPool:
+    """Thread-safe pool of persistent http.client connections, per origin.
+
+    request() returns (status, body_bytes); network failures raise OSError /
+    http.client.HTTPException. A reused connection the server already closed
+    is retried once on a fresh one. Every call is timed per endpoint.
+    """
+
+    def __init__(self, max_idle_per_host=4):
+        self.max_idle_per_host = max_idle_per_host
+        self.lock = threading.Lock()
+        self.idle = {}     # (scheme, host, port) -> [HTTPConnection]
+        self.timings = {}  # "METHOD /path" -> {count, errors, reused, total_ms, max_ms, last_ms}
+
+    def _origin(self, url):
+        from urllib.parse import urlsplit
+        parts = urlsplit(url)
+        port = parts.port or (443 if parts.scheme == 'https' else 80)
+        path = parts.path or '/'
+        if parts.query:
+            path += '?' + parts.query
+        return (parts.scheme, parts.hostname, port), path
+
+    def _acquire(self, origin, timeout):
+        import http.client
+        with self.lock:
+            conns = self.idle.get(origin)
+            if conns:
+                conn = conns.pop()
+                conn.timeout = timeout
+                if conn.sock:
+                    conn.sock.settimeout(timeout)
+                return conn, True
+        scheme, host, port = origin
+        cls = http.client.HTTPSConnection if scheme == 'https' else http.client.HTTPConnection
+        return cls(host, port, timeout=timeout), False
+
+    def _release(self, origin, conn):
+        with self.lock:
+            conns = self.idle.setdefault(origin, [])
+            if len(conns) < self.max_idle_per_host:
+                conns.append(conn)
+                return
+        conn.close()
+
+    def _record(self, endpoint, elapsed_ms, reused, error):
+        with self.lock:
+            t = self.timings.setdefault(endpoint, {
+                "count": 0, "errors": 0, "reused": 0, "total_ms": 0.0, "max_ms": 0.0, "last_ms": 0.0
+            })
+            t["count"] += 1
+            t["errors"] += 1 if error else 0
+            t["reused"] += 1 if reused else 0
+            t["total_ms"] += elapsed_ms
+            t["max_ms"] = max(t["max_ms"], elapsed_ms)
+            t["last_ms"] = elapsed_ms
+
+    def request(self, method, url, body=None, headers=None, timeout=5):
+        origin, path = self._origin(url)
+        endpoint = f"{method} {path.split('?')[0]}"
+        start = time.perf_counter()
+        reused = False
+        try:
+            for attempt in range(2):
+                conn, reused = self._acquire(origin, timeout)
+                try:
+                    conn.request(method, path, body=body, headers=headers or {})
+                    response = conn.getresponse()
+                    data = response.read()  # Drain fully so the connection can be reused
+                except ConnectionError:
+                    # RemoteDisconnected, reset, broken pipe - or ConnectionAbortedError,
+                    # which Windows raises for a pooled socket the server has closed
+                    conn.close()
+                    if reused and attempt == 0:
+                        continue  # Stale keep-alive connection - retry once on a fresh one
+                    raise
+                except Exception:
+                    conn.close()
+                    raise
+                if response.will_close:
+                    conn.close()
+                else:
+                    self._release(origin, conn)
+                self._record(endpoint, (time.perf_counter() - start) * 1000, reused, response.status >= 400)
+                return response.status, data
+        except Exception:
+            self._record(endpoint, (time.perf_counter() - start) * 1000, reused, True)
+            raise
+
+    def get_json(self, url, timeout=5):
+        """GET url and decode JSON. Raises on HTTP errors as well as network errors."""
+        status, data = self.request('GET', url, headers={'Accept': 'application/json'}, timeout=timeout)
+        if status >= 400:
+            raise OSError(f"HTTP {status} from {url}")
+        return json.loads(data.decode())
+
+    def metrics(self):
+        """Per-endpoint timing snapshot (ms) plus idle connection counts."""
+        with self.lock:
+            endpoints = {
+                endpoint: {
+                    "count": t["count"],
+                    "errors": t["errors"],
+                    "reused": t["reused"],
+                    "avg_ms": round(t["total_ms"] / t["count"], 1) if t["count"] else 0,
+                    "max_ms": round(t["max_ms"], 1),
+                    "last_ms": round(t["last_ms"], 1)
+                }
+                for endpoint, t in self.timings.items()
+            }
+            idle = {f"{scheme}://{host}:{port}": len(conns) for (scheme, host, port), conns in self.idle.items()}
+        return {"endpoints": endpoints, "idle_connections": idle}
+
+    def close(self):
+        with self.lock:
+            conns = [c for pool in self.idle.values() for c in pool]
+            self.idle.clear()
+        for conn in conns:
+            conn.close()
+
+
+http_pool = HTTPConnectionPool()
+
+
+# =============================================================================
+# MEDIAMTX SESSION TELEMETRY
+# =============================================================================
+# A background sampler polls the control API at a fixed rate and keeps a short
+# history per WebRTC session, so byte rates and stalls are known at any time -
+# not only during the launch check. Launch verification reads from it.
+
+TELEMETRY_INTERVAL = 0.25       # seconds between samples while MediaMTX answers
+TELEMETRY_IDLE_INTERVAL = 2.0   # back-off while the API is unreachable
+TELEMETRY_HISTORY = 120         # samples kept per session (~30s)
+TELEMETRY_RATE_WINDOW = 1.0     # seconds of history used for byte rates
+STALL_AFTER = 1.0               # no bytesSent progress for this long = stalled
+
+
+class SessionTelemetry:
+    """Ring buffer of (time, bytesSent) samples for one MediaMTX WebRTC session."""
+
+    __slots__ = ('id', 'path', 'remote_addr', 'created', 'samples', 'last_progress', 'stalled')
+
+    def __init__(self, item, now):
+        self.id = item.get('id')
+        self.path = item.get('path', '')
+        self.remote_addr = item.get('remoteAddr', '')
+        self.created = now
+        self.samples = collections.deque(maxlen=TELEMETRY_HISTORY)
+        self.last_progress = now
+        self.stalled = False
+
+    @property
+    def remote_host(self):
+        # "192.168.1.20:41234" / "[fe80::1]:41234" -> host part
+        return self.remote_addr.rsplit(':', 1)[0].strip('[]')
+
+    @property
+    def bytes_sent(self):
+        return self.samples[-1][1] if self.samples else 0
+
+    def add(self, now, bytes_sent):
+        """Record a sample. Returns "stalled"/"resumed" on a state change, else None."""
+        if not self.samples or bytes_sent > self.samples[-1][1]:
+            self.last_progress = now
+        self.samples.append((now, bytes_sent))
+        stalled = bytes_sent > 0 and now - self.last_progress >= STALL_AFTER
+        if stalled != self.stalled:
+            self.stalled = stalled
+            return "stalled" if stalled else "resumed"
         return None
 
+    def rate(self, window=TELEMETRY_RATE_WINDOW):
+        """Bytes/second over the last `window` seconds of samples."""
+        if len(self.samples) < 2:
+            return 0.0
+        t_last, b_last = self.samples[-1]
+        t_first, b_first = self.samples[-1]
+        for t, b in reversed(self.samples):
+            if t_last - t > window:
+                break
+            t_first, b_first = t, b
+        if t_last <= t_first:
+            return 0.0
+        return (b_last - b_first) / (t_last - t_first)
+
+    def describe(self, now):
+        return {
+            "id": self.id,
+            "path": self.path,
+            "remote_addr": self.remote_addr,
+            "bytes_sent": self.bytes_sent,
+            "bytes_per_sec": round(self.rate()),
+            "stalled": self.stalled,
+            "since_progress_ms": int((now - self.last_progress) * 1000),
+            "age_seconds": int(now - self.created)
+        }
+
+
+class MediaMTXTelemetry:
+    """Background sampler of /v3/webrtcsessions/list and /v3/paths/list.
+
+    on_change(event, session) is called from the sampler thread with
+    "stalled" / "resumed" / "closed" when a session changes state.
+    """
+
+    def __init__(self, api=MEDIAMTX_API, on_change=None):
+        self.api = api
+        self.on_change = on_change
+        self.cond = threading.Condition()
+        self.sessions = {}  # session id -> SessionTelemetry
+        self.paths = {}     # path name -> {"ready", "bytes_received", "bytes_per_sec", "readers"}
+        self.api_ok = False
+        self.last_sample = 0.0
+        self.samples_taken = 0
+        self.thread = None
+        self.stop_event = threading.Event()
+
+    def start(self):
+        with self.cond:
+            if self.thread and self.thread.is_alive():
+                return self
+            self.stop_event.clear()
+            self.thread = threading.Thread(target=self._run, name="mediamtx-telemetry", daemon=True)
+            self.thread.start()
+        return self
+
+    def stop(self):
+        self.stop_event.set()
+
+    def _run(self):
+        while not self.stop_event.is_set():
+            try:
+                self.sample()
+            except Exception as e:
+                with self.cond:
+                    if self.api_ok:
+                        print(f"[Telemetry] MediaMTX API unavailable: {e}", file=sys.stderr)
+                    self.api_ok = False
+                    self.cond.notify_all()
+            self.stop_event.wait(TELEMETRY_INTERVAL if self.api_ok else TELEMETRY_IDLE_INTERVAL)
+
+    def sample(self):
+        """Take one sample of both endpoints (normally called by the sampler thread)."""
+        sessions = http_pool.get_json(f"{self.api}/v3/webrtcsessions/list", timeout=1).get('items', [])
+        paths = http_pool.get_json(f"{self.api}/v3/paths/list", timeout=1).get('items', [])
+        now = time.time()
+        changes = []
+        with self.cond:
+            seen = set()
+            for item in sessions:
+                session_id = item.get('id')
+                seen.add(session_id)
+                session = self.sessions.get(session_id)
+                if session is None:
+                    session = self.sessions[session_id] = SessionTelemetry(item, now)
+                change = session.add(now, item.get('bytesSent', 0) or 0)
+                if change:
+                    changes.append((change, session))
+            for session_id in list(self.sessions):
+                if session_id not in seen:
+                    changes.append(("closed", self.sessions.pop(session_id)))
+
+            for item in paths:
+                name = item.get('name', '')
+                received = item.get('bytesReceived', 0) or 0
+                previous = self.paths.get(name)
+                rate = 0.0
+                if previous and now > previous['t']:
+                    rate = max(0.0, (received - previous['bytes_received']) / (now - previous['t']))
+                self.paths[name] = {
+                    "ready": bool(item.get('ready')),
+                    "bytes_received": received,
+                    "bytes_per_sec": round(rate),
+                    "readers": len(item.get('readers') or []),
+                    "t": now
+                }
+            for name in list(self.paths):
+                if self.paths[name]['t'] != now:
+                    del self.paths[name]
+
+            self.api_ok = True
+            self.last_sample = now
+            self.samples_taken += 1
+            self.cond.notify_all()
+
+        for change, session in changes:
+            print(f"[Telemetry] {session.path} ({session.remote_addr}) {change}", file=sys.stderr)
+            if self.on_change:
+                try:
+                    self.on_change(change, session)
+                except Exception as e:
+                    print(f"[Telemetry] on_change failed: {e}", file=sys.stderr)
+
+    def find(self, stream_name, remote_host=None):
+        """Sessions reading stream_name (optionally from one receiver IP). Caller holds no lock."""
+        with self.cond:
+            return [s for s in self.sessions.values()
+                    if stream_name in s.path and (remote_host is None or s.remote_host == remote_host)]
+
+    def wait_for_flow(self, stream_name, timeout, remote_host=None):
+        """Block until a session on stream_name carries data, or timeout.
+
+        Returns {"connected", "data_flowing", "bytes_sent"} from the latest samples.
+        """
+        self.start()
+
+        def state():
+            matches = [s for s in self.sessions.values()
+                       if stream_name in s.path and (remote_host is None or s.remote_host == remote_host)]
+            flowing = [s for s in matches if s.bytes_sent > 0]
+            return matches, flowing
+
+        with self.cond:
+            self.cond.wait_for(lambda: state()[1], timeout)
+            matches, flowing = state()
+            return {
+                "connected": bool(matches),
+                "data_flowing": bool(flowing),
+                "bytes_sent": max((s.bytes_sent for s in matches), default=0)
+            }
+
+    def snapshot(self):
+        now = time.time()
+        with self.cond:
+            return {
+                "running": bool(self.thread and self.thread.is_alive()),
+                "api_ok": self.api_ok,
+                "last_sample_ms_ago": int((now - self.last_sample) * 1000) if self.last_sample else None,
+                "samples": self.samples_taken,
+                "interval": TELEMETRY_INTERVAL,
+                "sessions": [s.describe(now) for s in self.sessions.values()],
+                "paths": {name: {k: v for k, v in p.items() if k != 't'} for name, p in self.paths.items()},
+                "stalled": sum(1 for s in self.sessions.values() if s.stalled)
+            }
+
+
+telemetry = MediaMTXTelemetry()
+
+
+def find_cast(speaker_name, speaker_ip=None, log_prefix="[Connect]"):
+    """Find a speaker by name: direct host:port from the device cache first,
+    then the IP as a known_hosts hint, then full discovery.
+
+    Returns:
+        tuple: (cast, browser). cast is None if the speaker wasn't found (the
+        browser is already stopped then). browser is None on the direct path.
+        Stop the browser only AFTER cast.wait() - zeroconf must stay running until then.
+    """
+    cast = connect_direct(speaker_name, speaker_ip, log_prefix)
+    if cast:
+        return cast, None
+
+    cast, browser = _discover_cast(speaker_name, speaker_ip, log_prefix)
+    if cast:
+        # Refresh the cache so the next command takes the direct path
+        save_device_cache([describe_device(cast.cast_info)])
+    return cast, browser
+
+
+def _discover_cast(speaker_name, speaker_ip=None, log_prefix="[Connect]"):
+    """mDNS lookup for find_cast(): known_hosts hint first, then full discovery."""
+    if speaker_ip:
+        print(f"{log_prefix} Connecting directly to {speaker_ip}...", file=sys.stderr)
+        chromecasts, browser = pychromecast.get_listed_chromecasts(
+            friendly_names=[speaker_name],
+            known_hosts=[speaker_ip],
+            timeout=5
+        )
+        if chromecasts:
+            return chromecasts[0], browser
+        # Fallback: try discovery without IP hint
+        print(f"{log_prefix} Direct connection failed, trying discovery...", file=sys.stderr)
+        if browser:
+            browser.stop_discovery()
+    else:
+        print(f"{log_prefix} Looking for '{speaker_name}'...", file=sys.stderr)
+
+    chromecasts, browser = pychromecast.get_listed_chromecasts(
+        friendly_names=[speaker_name],
+        timeout=10
+    )
+    if chromecasts:
+        return chromecasts[0], browser
+    browser.stop_discovery()
+    return None, None
+
+# =============================================================================
+# DEVICE CACHE: Last discovery results on disk for warm-start discovery
+# =============================================================================
+DEVICE_CACHE_VERSION = 1
+DEVICE_CACHE_TTL = 7 * 24 * 3600  # Drop devices not seen for a week
+DEVICE_CACHE_FRESH = 10 * 60  # Newer than this: good enough to answer discover instantly
+_device_cache_lock = threading.Lock()  # Serializes read-merge-write (find_cast, parallel multicast)
+
+
+def device_cache_path():
+    """Location of the device cache (override with PCNS_DEVICE_CACHE)."""
+    override = os.environ.get('PCNS_DEVICE_CACHE')
+    if override:
+        return override
+    base = os.environ.get('LOCALAPPDATA') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'pc-nest-speaker', 'device-cache.json')
+
+
+def load_device_cache(max_age=DEVICE_CACHE_TTL):
+    """Load cached devices seen within max_age seconds.
+
+    Returns:
+        list: Device dicts (discover format + "last_seen"), [] if missing/stale/old version
+    """
+    try:
+        with open(device_cache_path(), 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('version') != DEVICE_CACHE_VERSION:
+            return []
+        now = time.time()
+        return [d for d in data.get('devices', []) if now - d.get('last_seen', 0) <= max_age]
+    except (OSError, ValueError):
+        return []
+
+
+def save_device_cache(speakers):
+    """Merge freshly discovered devices into the cache (atomic write).
+
+    Devices missing from this scan are kept until DEVICE_CACHE_TTL expires -
+    a speaker that was asleep during one scan shouldn't vanish from warm start.
+    """
+    try:
+        with _device_cache_lock:
+            now = time.time()
+            by_uuid = {d['uuid']: d for d in load_device_cache()}
+            for speaker in speakers:
+                entry = dict(speaker)
+                entry['last_seen'] = now
+                by_uuid[entry['uuid']] = entry
+
+            path = device_cache_path()
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Unique per writer: other processes (CLI, daemon) may save concurrently
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({"version": DEVICE_CACHE_VERSION, "saved_at": now, "devices": list(by_uuid.values())}, f)
+            os.replace(tmp_path, path)
+    except Exception as e:
+        print(f"[DeviceCache] Could not save cache: {e}", file=sys.stderr)
+
+
+def find_cached_device(speaker_name=None, speaker_ip=None):
+    """Find a cached device by name (preferred) or IP. Returns dict or None."""
+    devices = load_device_cache()
+    for device in devices:
+        if speaker_name and device.get('name') == speaker_name:
+            return device
+    if speaker_ip:
+        for device in devices:
+            if device.get('ip') == speaker_ip and (not speaker_name or device.get('name') == speaker_name):
+                return device
+    return None
+
+
+def cast_info_from_cache(device):
+    """Build a pychromecast CastInfo from a cached device (connects by host:port, no mDNS)."""
+    from uuid import UUID
+    from pychromecast.models import CastInfo, HostServiceInfo
+    host, port = device['ip'], device.get('port') or 8009
+    return CastInfo(
+        # The socket client only dials addresses listed in services
+        services={HostServiceInfo(host, port)},
+        uuid=UUID(device['uuid']),
+        model_name=device.get('model'),
+        friendly_name=device['name'],
+        host=host,
+        port=port,
+        cast_type=device.get('cast_type'),
+        manufacturer=device.get('manufacturer')
+    )
+
+
+DIRECT_CONNECT_TIMEOUT = 3  # seconds for the single cached host:port attempt
+
+
+def connect_cached(device, speaker_ip=None, zconf=None, timeout=DIRECT_CONNECT_TIMEOUT):
+    """Connect straight to a cached device's host:port - no zeroconf, one TLS handshake.
+
+    speaker_ip overrides the cached host (the caller knows a newer address).
+    Raises ConnectionError if nothing answers there (stale entry).
+    """
+    if speaker_ip:
+        device = dict(device, ip=speaker_ip)
+    cast = pychromecast.get_chromecast_from_cast_info(
+        cast_info_from_cache(device), zconf, tries=1, timeout=timeout
+    )
+    try:
+        cast.wait(timeout=timeout + 2)
+    except pychromecast.error.RequestTimeout:
+        pass
+    if cast.status is None:
+        cast.disconnect()
+        raise ConnectionError(f"no response from {device['ip']}:{device.get('port') or 8009}")
+    return cast
+
+
+def connect_direct(speaker_name, speaker_ip=None, log_prefix="[Connect]"):
+    """Connect from the device cache without mDNS. Returns the cast, or None
+    when the speaker isn't cached or the entry is stale (caller falls back to discovery).
+    """
+    device = find_cached_device(speaker_name, speaker_ip)
+    if not device or not device.get('uuid'):
+        return None
+    host = speaker_ip or device['ip']
+    try:
+        start = time.time()
+        cast = connect_cached(device, speaker_ip)
+        print(f"{log_prefix} Direct connect to {host}:{device.get('port') or 8009} "
+              f"in {time.time() - start:.2f}s (no mDNS)", file=sys.stderr)
+        return cast
+    except Exception as e:
+        print(f"{log_prefix} Cached address {host} is stale ({e}), falling back to discovery...", file=sys.stderr)
+        return None
+
+
+def cached_discover_result(max_age=DEVICE_CACHE_FRESH):
+    """Discover-shaped result from cached devices seen within max_age, or None."""
+    speakers = load_device_cache(max_age)
+    if not speakers:
+        return None
+    oldest = min(s['last_seen'] for s in speakers)
+    return {
+        "success": True,
+        "speakers": [{k: v for k, v in s.items() if k != 'last_seen'} for s in speakers],
+        "cached": True,
+        "cache_age": int(time.time() - oldest)
+    }
+
+
+def discover_cached(timeout=5):
+    """Answer discover from the cache and revalidate with a background scan.
+
+    The background scan is a detached `discover` process that refreshes the
+    cache for the next start. Falls back to a normal scan if the cache is empty.
+    """
+    result = cached_discover_result()
+    if not result:
+        print("[DeviceCache] No fresh cache - scanning network", file=sys.stderr)
+        return discover_speakers(timeout)
+
+    print(f"[DeviceCache] Warm start with {len(result['speakers'])} cached device(s), revalidating in background", file=sys.stderr)
+    import subprocess
+    flags = getattr(subprocess, 'DETACHED_PROCESS', 0) | getattr(subprocess, 'CREATE_NO_WINDOW', 0)
+    subprocess.Popen(
+        [sys.executable, os.path.abspath(__file__), "discover", str(timeout), "--no-daemon"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        creationflags=flags
+    )
+    return result
+
+
+def describe_device(info):
+    """JSON-ready description of a discovered device (from its CastInfo)."""
+    return {
+        "name": info.friendly_name,
+        "model": info.model_name or "Chromecast",
+        "ip": info.host,
+        "port": info.port,
+        "cast_type": info.cast_type,  # "audio", "cast", or "group"
+        "uuid": str(info.uuid),
+        "manufacturer": info.manufacturer
+    }
+
+
+def resolve_group_members(group_cc, info_by_uuid, timeout=3):
+    """Resolve the member speakers of a Cast group.
+
+    Returns as soon as the multizone status reply arrives (usually ~100ms)
+    instead of sleeping a fixed time.
+
+    Args:
+        group_cc: Chromecast object for the group
+        info_by_uuid: str(uuid) -> CastInfo of already discovered devices
+        timeout: Max seconds to wait for the multizone response
+
+    Returns:
+        list: [{ name, ip, uuid, model }, ...] (members not yet discovered are skipped)
+    """
+    group_cc.wait(timeout=5)  # Quick connect to group
+
+    mz = get_multizone_controller(group_cc)
+    mz.waiter.event.clear()
+    mz.update_members()
+    if not mz.waiter.event.wait(timeout):
+        print(f"[GroupResolve] No multizone reply from '{group_cc.name}' after {timeout}s", file=sys.stderr)
+
+    # Get members - could be dict (UUID -> name) or list depending on pychromecast version
+    member_uuids = []
+    if hasattr(mz, 'members'):
+        if isinstance(mz.members, dict):
+            member_uuids = list(mz.members.keys())
+        elif isinstance(mz.members, list):
+            member_uuids = mz.members
+
+    # Match to discovered devices (instant - no network calls)
+    members = []
+    for uuid in member_uuids:
+        uuid_str = str(uuid)
+        info = info_by_uuid.get(uuid_str)
+        if info:
+            members.append({
+                "name": info.friendly_name,
+                "ip": info.host,
+                "uuid": uuid_str,
+                "model": info.model_name
+            })
+    return members
+
+
+def resolve_groups(groups, info_by_uuid, connect=None, on_resolved=None):
+    """Resolve members of several groups concurrently (fills data["members"]).
+
+    Total time stays ~one group's round trip regardless of group count.
+
+    Args:
+        groups: [(group_cc_or_cast_info, group_data), ...]
+        info_by_uuid: str(uuid) -> CastInfo of discovered devices
+        connect: Optional callable(group) -> Chromecast, for callers that hold
+                 CastInfo rather than connected Chromecast objects (daemon)
+        on_resolved: Optional callable(group_data), called as each group finishes
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    def resolve(item):
+        group, group_data = item
+        try:
+            print(f"[GroupResolve] Resolving members for '{group_data['name']}'...", file=sys.stderr)
+            group_cc = connect(group) if connect else group
+            if not group_cc:
+                raise Exception("group not reachable")
+            group_data["members"] = resolve_group_members(group_cc, info_by_uuid)
+            for member in group_data["members"]:
+                print(f"[GroupResolve]   Member: {member['name']} @ {member['ip']}", file=sys.stderr)
+            print(f"[GroupResolve] Group '{group_data['name']}' has {len(group_data['members'])} members", file=sys.stderr)
+        except Exception as e:
+            print(f"[GroupResolve] Failed to resolve '{group_data['name']}': {e}", file=sys.stderr)
+            # Group still added with empty members - will fall back to get-group-members if needed
+        if on_resolved:
+            on_resolved(group_data)
+
+    if not groups:
+        return
+    with ThreadPoolExecutor(max_workers=len(groups)) as pool:
+        list(pool.map(resolve, groups))
+
+
+def members_sharing_host(group_info, infos):
+    """Fallback member detection: audio devices that share the group's IP."""
+    return [
+        {
+            "name": info.friendly_name,
+            "ip": info.host,
+            "uuid": str(info.uuid),
+            "model": info.model_name
+        }
+        for info in infos
+        if info.host == group_info.host and info.cast_type == 'audio'
+    ]
+
+
+def summarize_speakers(speakers):
+    """Log a one-line count of discovered device types."""
+    audio_count = len([s for s in speakers if s['cast_type'] == 'audio'])
+    cast_count = len([s for s in speakers if s['cast_type'] == 'cast'])
+    group_count = len([s for s in speakers if s['cast_type'] == 'group'])
+    print(f"Summary: {audio_count} audio, {cast_count} cast, {group_count} group devices", file=sys.stderr)
+
+
 def discover_speakers(timeout=5):
     """Discover all Chromecast/Nest speakers on the network.
 
@@ -181,9 +1268,6 @@ def discover_speakers(timeout=5):
     Groups are detected and their member speakers are resolved during discovery,
     so group connections don't need a second discovery phase.
     """
-    from pychromecast.controllers.multizone import MultizoneController
-    import time
-
     try:
         print(f"Scanning network (timeout: {timeout}s)...", file=sys.stderr)
 
@@ -195,70 +1279,28 @@ def discover_speakers(timeout=5):
         # First pass: collect all devices and identify groups
         speakers = []
         groups = []  # Cast groups to resolve members for
-        cc_by_uuid = {}  # For quick UUID -> device lookup
+        info_by_uuid = {}  # For quick UUID -> device lookup
 
         for cc in chromecasts:
             info = cc.cast_info
-            cc_by_uuid[str(cc.uuid)] = cc
-            device_data = {
-                "name": cc.name,
-                "model": info.model_name or "Chromecast",
-                "ip": info.host,
-                "port": info.port,
-                "cast_type": info.cast_type,  # "audio", "cast", or "group"
-                "uuid": str(cc.uuid)
-            }
+            info_by_uuid[str(cc.uuid)] = info
+            device_data = describe_device(info)
             if info.cast_type == 'group':
                 device_data["members"] = []  # Will be populated below
                 groups.append((cc, device_data))
             speakers.append(device_data)
             print(f"Found: {cc.name} | Model: {info.model_name} | IP: {info.host} | Type: {info.cast_type}", file=sys.stderr)
 
-        # Second pass: resolve group members (fast - uses cached chromecasts, no re-discovery)
-        for group_cc, group_data in groups:
-            try:
-                print(f"[GroupResolve] Resolving members for '{group_data['name']}'...", file=sys.stderr)
-                group_cc.wait(timeout=5)  # Quick connect to group
-
-                mz = MultizoneController(group_cc.uuid)
-                group_cc.register_handler(mz)
-                mz.update_members()
-                time.sleep(0.5)  # Brief wait for response (was 2s)
-
-                # Get member UUIDs
-                member_uuids = []
-                if hasattr(mz, 'members'):
-                    if isinstance(mz.members, dict):
-                        member_uuids = list(mz.members.keys())
-                    elif isinstance(mz.members, list):
-                        member_uuids = mz.members
-
-                # Match to discovered devices (instant - no network calls)
-                for uuid in member_uuids:
-                    uuid_str = str(uuid)
-                    if uuid_str in cc_by_uuid:
-                        member_cc = cc_by_uuid[uuid_str]
-                        member_info = member_cc.cast_info
-                        group_data["members"].append({
-                            "name": member_cc.name,
-                            "ip": member_info.host,
-                            "uuid": uuid_str,
-                            "model": member_info.model_name
-                        })
-                        print(f"[GroupResolve]   Member: {member_cc.name} @ {member_info.host}", file=sys.stderr)
-
-                print(f"[GroupResolve] Group '{group_data['name']}' has {len(group_data['members'])} members", file=sys.stderr)
-            except Exception as e:
-                print(f"[GroupResolve] Failed to resolve '{group_data['name']}': {e}", file=sys.stderr)
-                # Group still added with empty members - will fall back to get-group-members if needed
+        # Second pass: resolve group members in parallel (uses cached chromecasts, no re-discovery)
+        resolve_groups(groups, info_by_uuid)
 
         browser.stop_discovery()
 
         # Log summary
-        audio_count = len([s for s in speakers if s['cast_type'] == 'audio'])
-        cast_count = len([s for s in speakers if s['cast_type'] == 'cast'])
-        group_count = len([s for s in speakers if s['cast_type'] == 'group'])
-        print(f"Summary: {audio_count} audio, {cast_count} cast, {group_count} group devices", file=sys.stderr)
+        summarize_speakers(speakers)
+
+        # Remember for warm starts (discover --cached, direct host:port connects)
+        save_device_cache(speakers)
 
         return {"success": True, "speakers": speakers}
 
@@ -266,21 +1308,109 @@ def discover_speakers(timeout=5):
         return {"success": False, "error": str(e)}
 
 
-def device_info(speaker_name):
-    """Get detailed device information including supported receivers."""
+def discover_speakers_stream(timeout=5, emit=None):
+    """Discover speakers, emitting each one the moment it answers.
+
+    Instead of one JSON blob after the full timeout, writes JSON lines:
+        {"type": "device", "device": {...}}             - as each device is found
+        {"type": "group", "name", "uuid", "members"}   - as each group resolves
+        {"type": "done", "success": true, "speakers"}  - final summary (same as discover)
+
+    Args:
+        timeout: Seconds to listen for devices
+        emit: Optional callable(dict); defaults to printing JSON lines on stdout
+    """
+    import zeroconf
+
+    if emit is None:
+        emit = lambda data: print(json.dumps(data), flush=True)
+
+    start = time.time()
+    found = {}  # uuid -> CastInfo
+    found_lock = threading.Lock()
+    zconf = zeroconf.Zeroconf()
+    browser = None
+    group_casts = []
+
+    def on_device(uuid, _service):
+        info = browser.devices.get(uuid)
+        if not info:
+            return
+        with found_lock:
+            if uuid in found:
+                return
+            found[uuid] = info
+        device = describe_device(info)
+        if info.cast_type == 'group':
+            device["members"] = []
+        print(f"Found: {info.friendly_name} | Model: {info.model_name} | IP: {info.host} | Type: {info.cast_type}", file=sys.stderr)
+        emit({"type": "device", "device": device, "elapsed_ms": int((time.time() - start) * 1000)})
+
     try:
-        print(f"Looking for '{speaker_name}'...", file=sys.stderr)
+        print(f"Streaming scan (timeout: {timeout}s)...", file=sys.stderr)
+        listener = pychromecast.SimpleCastListener(add_callback=on_device, update_callback=on_device)
+        browser = pychromecast.discovery.CastBrowser(listener, zconf)
+        browser.start_discovery()
+        time.sleep(timeout)
 
-        chromecasts, browser = pychromecast.get_listed_chromecasts(
-            friendly_names=[speaker_name],
-            timeout=10
-        )
+        with found_lock:
+            infos = list(found.values())
+        info_by_uuid = {str(info.uuid): info for info in infos}
 
-        if not chromecasts:
+        speakers = []
+        groups = []
+        for info in infos:
+            device_data = describe_device(info)
+            if info.cast_type == 'group':
+                device_data["members"] = []
+                groups.append((info, device_data))
+            speakers.append(device_data)
+
+        def connect_group(info):
+            group_cc = pychromecast.get_chromecast_from_cast_info(info, zconf)
+            group_casts.append(group_cc)
+            return group_cc
+
+        def group_done(group_data):
+            emit({
+                "type": "group",
+                "name": group_data["name"],
+                "uuid": group_data["uuid"],
+                "members": group_data["members"],
+                "elapsed_ms": int((time.time() - start) * 1000)
+            })
+
+        resolve_groups(groups, info_by_uuid, connect=connect_group, on_resolved=group_done)
+
+        summarize_speakers(speakers)
+        save_device_cache(speakers)
+        emit({"type": "done", "success": True, "speakers": speakers, "elapsed_ms": int((time.time() - start) * 1000)})
+
+    except Exception as e:
+        emit({"type": "done", "success": False, "error": str(e)})
+    finally:
+        for group_cc in group_casts:
+            try:
+                group_cc.disconnect()
+            except:
+                pass
+        if browser:
             browser.stop_discovery()
-            return {"success": False, "error": f"Speaker '{speaker_name}' not found"}
+        zconf.close()
+
+
+def device_info(speaker_name, cast=None):
+    """Get detailed device information including supported receivers.
+
+    cast: Already-connected Chromecast (daemon) - skips discovery entirely.
+    """
+    try:
+        browser = None
+        if cast is None:
+            cast, browser = find_cast(speaker_name, log_prefix="[DeviceInfo]")
+            if not cast:
+                return {"success": False, "error": f"Speaker '{speaker_name}' not found"}
 
-        cast = chromecasts[0]
         info = cast.cast_info
         print(f"Connected to {info.host}, waiting...", file=sys.stderr)
         cast.wait(timeout=10)
@@ -309,7 +1439,8 @@ def device_info(speaker_name):
                 "icon_url": cast.status.icon_url
             }
 
-        browser.stop_discovery()
+        if browser:
+            browser.stop_discovery()
         print(f"Device info retrieved successfully", file=sys.stderr)
         return {"success": True, "device": device_info}
 
@@ -488,8 +1619,7 @@ def webrtc_connect(speaker_name, webrtc_server_port=8080):
         cast2.wait()
 
         # Register WebRTC controller on new connection
-        webrtc = WebRTCController()
-        cast2.register_handler(webrtc)
+        webrtc = get_webrtc_controller(cast2)
         time.sleep(2)  # Wait for handler registration
 
         # Get local IP for webrtc-streamer URL
@@ -601,7 +1731,8 @@ def get_volume(speaker_name):
         return {"success": False, "error": str(e)}
 
 
-def webrtc_launch(speaker_name, https_url=None, speaker_ip=None, stream_name="pcaudio", app_id=None):
+def webrtc_launch(speaker_name, https_url=None, speaker_ip=None, stream_name="pcaudio", app_id=None, cast=None,
+                  start_barrier=None):
     """Launch custom receiver for WebRTC streaming.
 
     If https_url is provided, sends it to the receiver via play_media customData.
@@ -611,51 +1742,24 @@ def webrtc_launch(speaker_name, https_url=None, speaker_ip=None, stream_name="pc
 
     stream_name: MediaMTX stream path (default: "pcaudio", or "left"/"right" for stereo split)
     app_id: Which receiver to use (AUDIO_APP_ID or VISUAL_APP_ID). Defaults to AUDIO_APP_ID.
+    cast: Already-connected Chromecast (daemon) - skips discovery entirely.
+    start_barrier: Optional barrier (BarrierMember) shared by multicast members - the
+                   "connect" message is held until every member's receiver is
+                   ready, so all speakers start together.
     """
     # Use passed app_id or default to audio receiver
     receiver_app_id = app_id if app_id else AUDIO_APP_ID
+    if https_url:
+        telemetry.start()  # Warm up the sampler while the receiver launches
     try:
         browser = None
 
-        if speaker_ip:
-            # Connect directly to IP - much faster and more reliable for groups
-            print(f"[WebRTC] Connecting directly to {speaker_ip}...", file=sys.stderr)
-            # Use get_listed_chromecasts with known_hosts for direct IP connection
-            chromecasts, browser = pychromecast.get_listed_chromecasts(
-                friendly_names=[speaker_name],
-                known_hosts=[speaker_ip],
-                timeout=5
-            )
-            if chromecasts:
-                cast = chromecasts[0]
-            else:
-                # Fallback: try discovery without IP hint
-                print(f"[WebRTC] Direct connection failed, trying discovery...", file=sys.stderr)
-                if browser:
-                    browser.stop_discovery()
-                chromecasts, browser = pychromecast.get_listed_chromecasts(
-                    friendly_names=[speaker_name],
-                    timeout=10
-                )
-                if not chromecasts:
-                    browser.stop_discovery()
-                    return {"success": False, "error": f"Speaker '{speaker_name}' not found"}
-                cast = chromecasts[0]
-        else:
-            # Fall back to discovery if no IP provided
-            print(f"[WebRTC] Looking for '{speaker_name}'...", file=sys.stderr)
-
-            chromecasts, browser = pychromecast.get_listed_chromecasts(
-                friendly_names=[speaker_name],
-                timeout=10
-            )
-
-            if not chromecasts:
-                browser.stop_discovery()
+        if cast is None:
+            # Connect directly to IP if known - much faster and more reliable for groups
+            cast, browser = find_cast(speaker_name, speaker_ip, "[WebRTC]")
+            if not cast:
                 return {"success": False, "error": f"Speaker '{speaker_name}' not found"}
 
-            cast = chromecasts[0]
-
         host = cast.cast_info.host if hasattr(cast, 'cast_info') else speaker_ip or 'unknown'
         print(f"[WebRTC] Connected to {host}, waiting for ready...", file=sys.stderr)
         cast.wait(timeout=10)
@@ -669,18 +1773,15 @@ def webrtc_launch(speaker_name, https_url=None, speaker_ip=None, stream_name="pc
         print(f"[WebRTC] Device UUID: {cast.uuid}", file=sys.stderr)
         print(f"[WebRTC] Device model: {cast.cast_info.model_name}", file=sys.stderr)
 
+        session = get_cast_session(cast)
         try:
-            # ENSURE CONNECT CHIME: Quit any existing app first for fresh session
+            # ENSURE CONNECT CHIME: launch(fresh=True) quits any existing app first
             # The "ding" only plays when starting a NEW app, not when resuming!
-            try:
-                cast.quit_app()
-                time.sleep(0.5)  # Brief pause before starting new app
-            except:
-                pass  # Ignore if nothing to quit
-
-            cast.start_app(receiver_app_id)
-            wait_for_receiver_ready(cast, receiver_app_id)  # STABILITY: Poll instead of blind sleep
-            print("[WebRTC] Receiver launched!", file=sys.stderr)
+            launch_start = time.time()
+            if session.launch(receiver_app_id):
+                print(f"[WebRTC] Receiver launched in {time.time() - launch_start:.1f}s!", file=sys.stderr)
+            else:
+                print("[WebRTC] Receiver launch not confirmed yet, continuing...", file=sys.stderr)
         except Exception as app_error:
             error_type = type(app_error).__name__
             error_msg = str(app_error)
@@ -708,32 +1809,15 @@ def webrtc_launch(speaker_name, https_url=None, speaker_ip=None, stream_name="pc
         if https_url:
             print(f"[WebRTC] Sending WebRTC URL to receiver: {https_url}", file=sys.stderr)
 
-            # Wait for receiver to be fully loaded
-            for i in range(10):
-                cast.socket_client.receiver_controller.update_status()
-                time.sleep(0.5)
-                if cast.status and cast.status.app_id == receiver_app_id:
-                    print(f"[WebRTC] App ready, transport_id: {cast.status.transport_id}", file=sys.stderr)
-                    break
-                print(f"[WebRTC] Waiting for app... ({i+1}/10)", file=sys.stderr)
+            # Wait for receiver to be fully loaded (returns at once if already confirmed)
+            if session.wait_for_app(receiver_app_id, timeout=5):
+                print(f"[WebRTC] App ready, transport_id: {cast.status.transport_id}", file=sys.stderr)
+            else:
+                print(f"[WebRTC] App not reported ready after 5s, sending anyway", file=sys.stderr)
 
             # Send URL via custom namespace message
             # The receiver listens on 'urn:x-cast:com.pcnestspeaker.webrtc'
-            WEBRTC_NAMESPACE = "urn:x-cast:com.pcnestspeaker.webrtc"
-
-            # Create and register a simple message controller
-            from pychromecast.controllers import BaseController
-
-            class WebRTCController(BaseController):
-                def __init__(self):
-                    super().__init__(WEBRTC_NAMESPACE)
-
-                def receive_message(self, message, data):
-                    print(f"[WebRTC] Received: {data}", file=sys.stderr)
-                    return True
-
-            webrtc_controller = WebRTCController()
-            cast.register_handler(webrtc_controller)
+            webrtc_controller = get_webrtc_controller(cast)
 
             # Send connect message with URL and custom stream name
             message = {
@@ -741,55 +1825,32 @@ def webrtc_launch(speaker_name, https_url=None, speaker_ip=None, stream_name="pc
                 "url": https_url,
                 "stream": stream_name
             }
+            if start_barrier:
+                # MULTICAST SYNC: release every member's connect at the same moment
+                try:
+                    start_barrier.wait(timeout=MULTICAST_BARRIER_TIMEOUT)
+                except threading.BrokenBarrierError:
+                    print(f"[WebRTC] Start barrier broken (a member failed/timed out) - connecting now", file=sys.stderr)
             print(f"[WebRTC] Sending message: {message}", file=sys.stderr)
             webrtc_controller.send_message(message)
-
-            # Wait for message to be processed
-            time.sleep(2)
             print("[WebRTC] URL sent via custom namespace!", file=sys.stderr)
 
-            # VERIFICATION: Quick check if MediaMTX session exists
-            # Reduced from 10s to 2s - fail fast if ICE doesn't work
-            import urllib.request
-            import urllib.error
-
-            # MediaMTX API is always on localhost
-            mediamtx_api = "http://localhost:9997"
+            # VERIFICATION: Check if MediaMTX session exists
+            # The receiver doesn't ack "connect", so poll until data flows or
+            # the deadline passes - fail fast if ICE doesn't work
             if https_url:
                 print(f"[WebRTC] Checking connection...", file=sys.stderr)
-                connected = False
-                data_flowing = False
-
-                # Quick poll - 4 attempts × 0.5s = 2 seconds max (was 10 seconds!)
-                for attempt in range(4):
-                    try:
-                        api_url = f"{mediamtx_api}/v3/webrtcsessions/list"
-                        req = urllib.request.Request(api_url, method='GET')
-                        with urllib.request.urlopen(req, timeout=1) as resp:
-                            sessions_data = json.loads(resp.read().decode())
-                            sessions = sessions_data.get('items', [])
-
-                            # Look for session on our stream
-                            for session in sessions:
-                                if stream_name in session.get('path', ''):
-                                    connected = True
-                                    bytes_sent = session.get('bytesSent', 0)
-                                    if bytes_sent > 0:
-                                        data_flowing = True
-                                        print(f"[WebRTC] ✓ Connected! bytesSent={bytes_sent}", file=sys.stderr)
-                                        break
-
-                            if data_flowing:
-                                break
-                            elif connected and attempt >= 2:
-                                # Only warn after 2nd attempt if still no data
-                                print(f"[WebRTC] Session exists but bytesSent=0 ({attempt+1}/4)", file=sys.stderr)
-
-                    except Exception as api_err:
-                        if attempt == 3:  # Only log on last attempt
-                            print(f"[WebRTC] API check failed: {api_err}", file=sys.stderr)
-
-                    time.sleep(0.5)
+
+                # Woken by the telemetry sampler as soon as bytes flow (4s max)
+                # (matched on the receiver's IP so multicast members verify independently)
+                flow = telemetry.wait_for_flow(stream_name, WEBRTC_VERIFY_TIMEOUT,
+                                               remote_host=host if host != 'unknown' else None)
+                connected = flow["connected"]
+                data_flowing = flow["data_flowing"]
+                if data_flowing:
+                    print(f"[WebRTC] ✓ Connected! bytesSent={flow['bytes_sent']}", file=sys.stderr)
+                elif not telemetry.api_ok:
+                    print(f"[WebRTC] API check failed: MediaMTX API unreachable", file=sys.stderr)
 
                 # Report verification result
                 if data_flowing:
@@ -824,7 +1885,7 @@ def webrtc_launch(speaker_name, https_url=None, speaker_ip=None, stream_name="pc
         return {"success": False, "error": str(e)}
 
 
-def webrtc_proxy_connect(speaker_name, mediamtx_url, speaker_ip=None, stream_name="pcaudio", app_id=None):
+def webrtc_proxy_connect(speaker_name, mediamtx_url, speaker_ip=None, stream_name="pcaudio", app_id=None, cast=None):
     """
     Connect to WebRTC using PROXY SIGNALING - avoids mixed content issues!
 
@@ -839,46 +1900,19 @@ def webrtc_proxy_connect(speaker_name, mediamtx_url, speaker_ip=None, stream_nam
     No HTTP fetch from receiver = no mixed content = works everywhere!
 
     app_id: Which receiver to use (AUDIO_APP_ID or VISUAL_APP_ID). Defaults to AUDIO_APP_ID.
+    cast: Already-connected Chromecast (daemon) - skips discovery entirely.
     """
     # Use passed app_id or default to audio receiver
     receiver_app_id = app_id if app_id else AUDIO_APP_ID
-    import urllib.request
-    import urllib.error
 
     try:
-        browser = None
-
-        # Step 1: Connect to speaker
-        if speaker_ip:
-            print(f"[WebRTC-Proxy] Connecting directly to {speaker_ip}...", file=sys.stderr)
-            chromecasts, browser = pychromecast.get_listed_chromecasts(
-                friendly_names=[speaker_name],
-                known_hosts=[speaker_ip],
-                timeout=5
-            )
-            if chromecasts:
-                cast = chromecasts[0]
-            else:
-                if browser:
-                    browser.stop_discovery()
-                chromecasts, browser = pychromecast.get_listed_chromecasts(
-                    friendly_names=[speaker_name],
-                    timeout=10
-                )
-                if not chromecasts:
-                    browser.stop_discovery()
-                    return {"success": False, "error": f"Speaker '{speaker_name}' not found"}
-                cast = chromecasts[0]
-        else:
-            print(f"[WebRTC-Proxy] Looking for '{speaker_name}'...", file=sys.stderr)
-            chromecasts, browser = pychromecast.get_listed_chromecasts(
-                friendly_names=[speaker_name],
-                timeout=10
-            )
-            if not chromecasts:
-                browser.stop_discovery()
+        browser = None
+
+        # Step 1: Connect to speaker
+        if cast is None:
+            cast, browser = find_cast(speaker_name, speaker_ip, "[WebRTC-Proxy]")
+            if not cast:
                 return {"success": False, "error": f"Speaker '{speaker_name}' not found"}
-            cast = chromecasts[0]
 
         host = cast.cast_info.host if hasattr(cast, 'cast_info') else speaker_ip or 'unknown'
         print(f"[WebRTC-Proxy] Connected to {host}, waiting for ready...", file=sys.stderr)
@@ -886,18 +1920,14 @@ def webrtc_proxy_connect(speaker_name, mediamtx_url, speaker_ip=None, stream_nam
 
         # Step 2: Launch custom receiver
         print(f"[WebRTC-Proxy] Launching receiver (App ID: {receiver_app_id})...", file=sys.stderr)
+        session = get_cast_session(cast)
         try:
-            # ENSURE CONNECT CHIME: Quit any existing app first for fresh session
+            # ENSURE CONNECT CHIME: launch(fresh=True) quits any existing app first
             # The "ding" only plays when starting a NEW app, not when resuming!
-            try:
-                cast.quit_app()
-                time.sleep(0.5)
-            except:
-                pass
-
-            cast.start_app(receiver_app_id)
-            wait_for_receiver_ready(cast, receiver_app_id)  # STABILITY: Poll instead of blind sleep
-            print("[WebRTC-Proxy] Receiver launched!", file=sys.stderr)
+            if session.launch(receiver_app_id):
+                print("[WebRTC-Proxy] Receiver launched!", file=sys.stderr)
+            else:
+                print("[WebRTC-Proxy] Receiver launch not confirmed yet, continuing...", file=sys.stderr)
         except Exception as app_error:
             error_msg = str(app_error)
             print(f"[WebRTC-Proxy] ERROR launching app: {error_msg}", file=sys.stderr)
@@ -913,25 +1943,17 @@ def webrtc_proxy_connect(speaker_name, mediamtx_url, speaker_ip=None, stream_nam
             return {"success": False, "error": error_msg}
 
         # Step 3: Register WebRTC controller and send request_offer
-        webrtc = WebRTCController()
-        cast.register_handler(webrtc)
-
-        # Wait for receiver to be ready
-        for i in range(10):
-            cast.socket_client.receiver_controller.update_status()
-            time.sleep(0.5)
-            if cast.status and cast.status.app_id == receiver_app_id:
-                print(f"[WebRTC-Proxy] App ready!", file=sys.stderr)
-                break
-            print(f"[WebRTC-Proxy] Waiting for app... ({i+1}/10)", file=sys.stderr)
+        webrtc = get_webrtc_controller(cast)
 
-        # Send request_offer message
-        print(f"[WebRTC-Proxy] Requesting SDP offer from receiver (stream: {stream_name})...", file=sys.stderr)
-        webrtc.send_message({"type": "request_offer", "stream": stream_name})
+        # Wait for receiver to be ready (returns at once if already confirmed)
+        if session.wait_for_app(receiver_app_id, timeout=5):
+            print(f"[WebRTC-Proxy] App ready!", file=sys.stderr)
+        else:
+            print(f"[WebRTC-Proxy] App not reported ready after 5s, requesting offer anyway", file=sys.stderr)
 
-        # Step 4: Wait for SDP offer from receiver
-        print("[WebRTC-Proxy] Waiting for offer from receiver...", file=sys.stderr)
-        offer_response = webrtc.wait_for_message(timeout=15)
+        # Send request_offer message, Step 4: wait for SDP offer from receiver
+        print(f"[WebRTC-Proxy] Requesting SDP offer from receiver (stream: {stream_name})...", file=sys.stderr)
+        offer_response = webrtc.call({"type": "request_offer", "stream": stream_name}, ("offer",), timeout=15)
 
         if not offer_response:
             if browser:
@@ -956,32 +1978,31 @@ def webrtc_proxy_connect(speaker_name, mediamtx_url, speaker_ip=None, stream_nam
         whep_url = f"{mediamtx_url}/{stream_name}/whep"
         print(f"[WebRTC-Proxy] POSTing offer to {whep_url}...", file=sys.stderr)
 
-        req = urllib.request.Request(
-            whep_url,
-            data=offer_sdp.encode('utf-8'),
-            headers={'Content-Type': 'application/sdp'},
-            method='POST'
-        )
-
         try:
-            with urllib.request.urlopen(req, timeout=10) as response:
-                answer_sdp = response.read().decode('utf-8')
-                print(f"[WebRTC-Proxy] Got SDP answer ({len(answer_sdp)} bytes)", file=sys.stderr)
-        except urllib.error.HTTPError as e:
-            error_body = e.read().decode('utf-8') if e.fp else str(e)
+            # Pooled keep-alive connection - no TCP/TLS setup when it's warm
+            status, body = http_pool.request(
+                'POST',
+                whep_url,
+                body=offer_sdp.encode('utf-8'),
+                headers={'Content-Type': 'application/sdp'},
+                timeout=10
+            )
+        except (OSError, timed_import('http.client').HTTPException) as e:
             if browser:
                 browser.stop_discovery()
-            return {"success": False, "error": f"WHEP error {e.code}: {error_body}"}
-        except urllib.error.URLError as e:
+            return {"success": False, "error": f"Cannot reach MediaMTX: {e}"}
+
+        if status >= 400:
             if browser:
                 browser.stop_discovery()
-            return {"success": False, "error": f"Cannot reach MediaMTX: {e.reason}"}
+            return {"success": False, "error": f"WHEP error {status}: {body.decode('utf-8', errors='replace')}"}
+
+        answer_sdp = body.decode('utf-8')
+        print(f"[WebRTC-Proxy] Got SDP answer ({len(answer_sdp)} bytes)", file=sys.stderr)
 
         # Step 6: Send answer to receiver
         print("[WebRTC-Proxy] Sending SDP answer to receiver...", file=sys.stderr)
         webrtc.send_message({"type": "answer", "sdp": answer_sdp})
-
-        time.sleep(1)
         print("[WebRTC-Proxy] Proxy signaling complete!", file=sys.stderr)
 
         if browser:
@@ -1006,128 +2027,95 @@ def webrtc_signal(speaker_name, message_json):
         message = json.loads(message_json)
         print(f"[WebRTC] Signaling to '{speaker_name}': {message.get('type')}", file=sys.stderr)
 
-        chromecasts, browser = pychromecast.get_listed_chromecasts(
-            friendly_names=[speaker_name],
-            timeout=10
-        )
-
-        if not chromecasts:
-            browser.stop_discovery()
+        cast, browser = find_cast(speaker_name, log_prefix="[WebRTC]")
+        if not cast:
             return {"success": False, "error": f"Speaker '{speaker_name}' not found"}
-
-        cast = chromecasts[0]
         cast.wait()
 
         # Register WebRTC controller
-        webrtc = WebRTCController()
-        cast.register_handler(webrtc)
+        webrtc = get_webrtc_controller(cast)
 
         # Ensure custom app is running
         if cast.app_id != CUSTOM_APP_ID:
             print(f"[WebRTC] Launching receiver...", file=sys.stderr)
-            cast.start_app(CUSTOM_APP_ID)
-            time.sleep(2)
-
-        # Send the signaling message
-        webrtc.send_message(message)
+            get_cast_session(cast).launch(CUSTOM_APP_ID, fresh=False)
 
         # Wait for response (for offer, expect answer)
         if message.get('type') == 'offer':
-            print("[WebRTC] Waiting for answer...", file=sys.stderr)
-            response = webrtc.wait_for_message(timeout=15)
-            if response:
+            print("[WebRTC] Sending offer, waiting for answer...", file=sys.stderr)
+            response = webrtc.call(message, ("answer",), timeout=15)
+            if browser:
                 browser.stop_discovery()
+            if response:
                 return {"success": True, "response": response}
             else:
-                browser.stop_discovery()
                 return {"success": False, "error": "Timeout waiting for answer"}
 
         # ICE candidates don't need response
-        browser.stop_discovery()
+        webrtc.send_message(message)
+        if browser:
+            browser.stop_discovery()
         return {"success": True}
 
     except Exception as e:
         return {"success": False, "error": str(e)}
 
-def stop_cast(speaker_name):
+def stop_cast(speaker_name, cast=None):
     """Stop casting to a speaker.
 
     Plays the Cast "ding" sound on disconnect by briefly launching
     the Default Media Receiver before quitting.
+
+    cast: Already-connected Chromecast (daemon) - skips discovery entirely.
     """
     try:
-        chromecasts, browser = pychromecast.get_listed_chromecasts(
-            friendly_names=[speaker_name],
-            timeout=10
-        )
+        browser = None
+        if cast is None:
+            cast, browser = find_cast(speaker_name, log_prefix="[stop]")
 
-        if chromecasts:
-            cast = chromecasts[0]
+        if cast:
             cast.wait()
-            cast.quit_app()
-
-            # PLAY DISCONNECT CHIME: Launch Default Media Receiver briefly
-            # The "ding" sound ONLY plays when start_app() is called!
-            try:
-                time.sleep(0.3)
-                cast.start_app("CC1AD845")  # Triggers the ding!
-                time.sleep(1.0)
-                cast.quit_app()  # Leave speaker idle
-            except Exception as e:
-                print(f"[stop] Disconnect chime failed (non-critical): {e}", file=sys.stderr)
+            # Quit (waits for the app to be gone), then PLAY DISCONNECT CHIME:
+            # the "ding" sound ONLY plays when start_app() is called!
+            get_cast_session(cast).stop(chime=True, log_prefix="[stop]")
 
-        browser.stop_discovery()
+        if browser:
+            browser.stop_discovery()
         return {"success": True}
 
     except Exception as e:
         return {"success": False, "error": str(e)}
 
 
-def stop_cast_fast(speaker_name, speaker_ip):
+def stop_cast_fast(speaker_name, speaker_ip, cast=None):
     """
     Stop casting using cached IP - no network scan needed.
     Much faster than stop_cast() (~1s vs 10s).
 
     Plays the Cast "ding" sound on disconnect by briefly launching
     the Default Media Receiver before quitting.
+
+    cast: Already-connected Chromecast (daemon) - skips discovery entirely.
     """
     try:
-        if not speaker_ip:
+        if cast is None and not speaker_ip:
             # Fallback to regular stop if no IP provided
             return stop_cast(speaker_name)
 
-        print(f"[stop-fast] Connecting directly to {speaker_name} at {speaker_ip}", file=sys.stderr)
-
-        # Use get_listed_chromecasts with IP for more reliable connection
-        # Direct Chromecast(ip) can have issues with internal cast_type lookup
-        try:
-            chromecasts, browser = pychromecast.get_chromecasts(timeout=3)
-            cast = None
-            for cc in chromecasts:
-                if cc.cast_info.host == speaker_ip:
-                    cast = cc
-                    break
-            browser.stop_discovery()
-
+        browser = None
+        if cast is None:
+            # Direct host:port from the device cache (no scan), known_hosts hint as fallback
+            print(f"[stop-fast] Connecting directly to {speaker_name} at {speaker_ip}", file=sys.stderr)
+            cast, browser = find_cast(speaker_name, speaker_ip, "[stop-fast]")
             if not cast:
-                # Fallback to direct IP connection
-                cast = pychromecast.Chromecast(speaker_ip)
-        except:
-            # Last resort fallback
-            cast = pychromecast.Chromecast(speaker_ip)
+                return {"success": True}  # Nothing reachable to stop - resync will reconnect
 
         cast.wait(timeout=5)
-        cast.quit_app()
-
-        # PLAY DISCONNECT CHIME: Launch Default Media Receiver briefly
-        # The "ding" sound ONLY plays when start_app() is called!
-        try:
-            time.sleep(0.3)
-            cast.start_app("CC1AD845")  # Triggers the ding!
-            time.sleep(1.0)
-            cast.quit_app()  # Leave speaker idle
-        except Exception as e:
-            print(f"[stop-fast] Disconnect chime failed (non-critical): {e}", file=sys.stderr)
+        if browser:
+            browser.stop_discovery()
+        # Quit (waits for the app to be gone), then PLAY DISCONNECT CHIME:
+        # the "ding" sound ONLY plays when start_app() is called!
+        get_cast_session(cast).stop(chime=True, log_prefix="[stop-fast]")
 
         return {"success": True}
 
@@ -1142,20 +2130,17 @@ def get_volume(speaker_name):
     Returns: { success: true, volume: 0.0-1.0, muted: bool }
     """
     try:
-        chromecasts, browser = pychromecast.get_listed_chromecasts(friendly_names=[speaker_name])
-
-        if not chromecasts:
-            browser.stop_discovery()
+        cast, browser = find_cast(speaker_name, log_prefix="[Volume]")
+        if not cast:
             return {"success": False, "error": f"Speaker '{speaker_name}' not found"}
-
-        cast = chromecasts[0]
         cast.wait()
 
         # Get volume status
         volume_level = cast.status.volume_level  # 0.0 - 1.0
         is_muted = cast.status.volume_muted
 
-        browser.stop_discovery()
+        if browser:
+            browser.stop_discovery()
         return {
             "success": True,
             "volume": volume_level,
@@ -1171,19 +2156,16 @@ def set_volume(speaker_name, volume):
     Args: speaker_name (str), volume (float 0.0-1.0)
     """
     try:
-        chromecasts, browser = pychromecast.get_listed_chromecasts(friendly_names=[speaker_name])
-
-        if not chromecasts:
-            browser.stop_discovery()
+        cast, browser = find_cast(speaker_name, log_prefix="[Volume]")
+        if not cast:
             return {"success": False, "error": f"Speaker '{speaker_name}' not found"}
-
-        cast = chromecasts[0]
         cast.wait()
 
         # Set volume (0.0 - 1.0)
         cast.set_volume(volume)
 
-        browser.stop_discovery()
+        if browser:
+            browser.stop_discovery()
         return {"success": True, "volume": volume}
 
     except Exception as e:
@@ -1202,9 +2184,6 @@ def get_group_members(group_name):
     Returns:
         { success: true, members: [{ name, ip, uuid }, ...], group_name, group_uuid }
     """
-    from pychromecast.controllers.multizone import MultizoneController
-    import time
-
     try:
         print(f"[GroupMembers] Looking for group '{group_name}'...", file=sys.stderr)
 
@@ -1223,74 +2202,10 @@ def get_group_members(group_name):
             return {"success": False, "error": f"Group '{group_name}' not found"}
 
         print(f"[GroupMembers] Found group, connecting...", file=sys.stderr)
-        group_cast.wait(timeout=10)
-
-        # Get group UUID
-        group_uuid = str(group_cast.uuid)
-        print(f"[GroupMembers] Group UUID: {group_uuid}", file=sys.stderr)
-
-        # Use MultizoneController to get members
-        mz = MultizoneController(group_cast.uuid)
-        group_cast.register_handler(mz)
-
-        # Request member list
-        mz.update_members()
-        time.sleep(2)  # Give time for response
-
-        # Get members - could be dict (UUID -> name) or list depending on pychromecast version
-        if hasattr(mz, 'members'):
-            if isinstance(mz.members, dict):
-                member_uuids = list(mz.members.keys())
-            elif isinstance(mz.members, list):
-                member_uuids = mz.members
-            else:
-                member_uuids = []
-            print(f"[GroupMembers] Raw members: {mz.members}", file=sys.stderr)
-        else:
-            member_uuids = []
-        print(f"[GroupMembers] Found {len(member_uuids)} member UUIDs: {member_uuids}", file=sys.stderr)
-
-        # Match member UUIDs to discovered devices to get IPs
-        members = []
-        for cc in chromecasts:
-            cc_uuid = str(cc.uuid)
-            if cc_uuid in member_uuids or cc_uuid in [str(u) for u in member_uuids]:
-                info = cc.cast_info
-                member_data = {
-                    "name": cc.name,
-                    "ip": info.host,
-                    "uuid": cc_uuid,
-                    "model": info.model_name
-                }
-                members.append(member_data)
-                print(f"[GroupMembers] Member: {cc.name} @ {info.host}", file=sys.stderr)
-
-        # If multizone didn't work, try alternative: find speakers sharing the group IP
-        if not members:
-            group_ip = group_cast.cast_info.host
-            print(f"[GroupMembers] Multizone empty, trying IP match for {group_ip}...", file=sys.stderr)
-            for cc in chromecasts:
-                info = cc.cast_info
-                # Individual speakers that share the group's IP are likely members
-                if info.host == group_ip and info.cast_type == 'audio':
-                    member_data = {
-                        "name": cc.name,
-                        "ip": info.host,
-                        "uuid": str(cc.uuid),
-                        "model": info.model_name
-                    }
-                    members.append(member_data)
-                    print(f"[GroupMembers] Member (IP match): {cc.name} @ {info.host}", file=sys.stderr)
+        result = group_members_result(group_cast, [cc.cast_info for cc in chromecasts])
 
         browser.stop_discovery()
-
-        return {
-            "success": True,
-            "group_name": group_name,
-            "group_uuid": group_uuid,
-            "members": members,
-            "count": len(members)
-        }
+        return result
 
     except Exception as e:
         import traceback
@@ -1299,7 +2214,42 @@ def get_group_members(group_name):
         return {"success": False, "error": str(e)}
 
 
-def cast_url_to_tv(device_name, url, content_type=None, device_ip=None):
+def group_members_result(group_cast, infos):
+    """Build the get-group-members response for a connected group.
+
+    Args:
+        group_cast: Chromecast object for the group
+        infos: CastInfo of every discovered device (to map member UUIDs to IPs)
+    """
+    group_cast.wait(timeout=10)
+
+    # Get group UUID
+    group_uuid = str(group_cast.uuid)
+    print(f"[GroupMembers] Group UUID: {group_uuid}", file=sys.stderr)
+
+    # Use MultizoneController to get members, then match UUIDs to discovered devices
+    info_by_uuid = {str(info.uuid): info for info in infos}
+    members = resolve_group_members(group_cast, info_by_uuid, timeout=5)
+    for member in members:
+        print(f"[GroupMembers] Member: {member['name']} @ {member['ip']}", file=sys.stderr)
+
+    # If multizone didn't work, try alternative: find speakers sharing the group IP
+    if not members:
+        print(f"[GroupMembers] Multizone empty, trying IP match for {group_cast.cast_info.host}...", file=sys.stderr)
+        members = members_sharing_host(group_cast.cast_info, infos)
+        for member in members:
+            print(f"[GroupMembers] Member (IP match): {member['name']} @ {member['ip']}", file=sys.stderr)
+
+    return {
+        "success": True,
+        "group_name": group_cast.name,
+        "group_uuid": group_uuid,
+        "members": members,
+        "count": len(members)
+    }
+
+
+def cast_url_to_tv(device_name, url, content_type=None, device_ip=None, cast=None):
     """Cast ANY URL to a TV device (Chromecast, Shield, etc.).
 
     This is the simple "send URL, TV plays it" function.
@@ -1317,6 +2267,7 @@ def cast_url_to_tv(device_name, url, content_type=None, device_ip=None):
         url: URL to cast (YouTube URLs will be rejected - use YouTube app)
         content_type: MIME type (auto-detected if None)
         device_ip: Optional direct IP for faster connection
+        cast: Already-connected Chromecast (daemon) - skips discovery entirely
 
     Returns:
         { success: true, state: "PLAYING", url: "..." }
@@ -1351,38 +2302,19 @@ def cast_url_to_tv(device_name, url, content_type=None, device_ip=None):
         print(f"[CastURL] Content-Type: {content_type}", file=sys.stderr)
 
         # Connect to device
-        if device_ip:
-            print(f"[CastURL] Using direct IP: {device_ip}", file=sys.stderr)
-            chromecasts, browser = pychromecast.get_listed_chromecasts(
-                friendly_names=[device_name],
-                known_hosts=[device_ip],
-                timeout=5
-            )
-        else:
-            chromecasts, browser = pychromecast.get_listed_chromecasts(
-                friendly_names=[device_name],
-                timeout=10
-            )
-
-        if not chromecasts:
-            if browser:
-                browser.stop_discovery()
-            return {"success": False, "error": f"Device '{device_name}' not found"}
-
-        cast = chromecasts[0]
+        if cast is None:
+            cast, browser = find_cast(device_name, device_ip, "[CastURL]")
+            if not cast:
+                return {"success": False, "error": f"Device '{device_name}' not found"}
         host = cast.cast_info.host if hasattr(cast, 'cast_info') else device_ip or 'unknown'
         print(f"[CastURL] Connected to {host}", file=sys.stderr)
         cast.wait(timeout=10)
 
         # Use Default Media Receiver for URL casting (most compatible)
-        DEFAULT_MEDIA_RECEIVER = 'CC1AD845'
         print(f"[CastURL] Launching Default Media Receiver...", file=sys.stderr)
 
         try:
-            cast.quit_app()  # Ensure chime
-            time.sleep(0.5)
-            cast.start_app(DEFAULT_MEDIA_RECEIVER)
-            time.sleep(2)
+            get_cast_session(cast).launch(DEFAULT_MEDIA_RECEIVER_ID)  # fresh=True ensures chime
         except Exception as e:
             print(f"[CastURL] App launch warning (non-critical): {e}", file=sys.stderr)
 
@@ -1417,7 +2349,7 @@ def cast_url_to_tv(device_name, url, content_type=None, device_ip=None):
         return {"success": False, "error": str(e)}
 
 
-def hls_cast_to_tv(speaker_name, hls_url, speaker_ip=None, device_model=None, app_id=None):
+def hls_cast_to_tv(speaker_name, hls_url, speaker_ip=None, device_model=None, app_id=None, cast=None):
     """Cast HLS stream to TV devices (NVIDIA Shield, Chromecast with screen).
 
     TVs don't support WebRTC, but they DO support HLS. We can use either:
@@ -1431,47 +2363,21 @@ def hls_cast_to_tv(speaker_name, hls_url, speaker_ip=None, device_model=None, ap
         device_model: Model name from discovery (e.g., "SHIELD Android TV")
         app_id: Receiver app ID. Default is Visual receiver (FCAA4619) for ambient videos.
                 Pass 'CC1AD845' for Default Media Receiver.
+        cast: Already-connected Chromecast (daemon) - skips discovery entirely
 
     Returns:
         { success: true, state: "PLAYING", mode: "hls" }
     """
     # Default to Visual receiver for ambient videos (unless explicitly overridden)
     VISUAL_APP_ID = 'FCAA4619'
-    DEFAULT_MEDIA_RECEIVER = 'CC1AD845'
     receiver_id = app_id if app_id else VISUAL_APP_ID
     try:
         browser = None
 
-        if speaker_ip:
-            print(f"[HLS-TV] Connecting directly to {speaker_ip}...", file=sys.stderr)
-            chromecasts, browser = pychromecast.get_listed_chromecasts(
-                friendly_names=[speaker_name],
-                known_hosts=[speaker_ip],
-                timeout=5
-            )
-            if chromecasts:
-                cast = chromecasts[0]
-            else:
-                if browser:
-                    browser.stop_discovery()
-                chromecasts, browser = pychromecast.get_listed_chromecasts(
-                    friendly_names=[speaker_name],
-                    timeout=10
-                )
-                if not chromecasts:
-                    browser.stop_discovery()
-                    return {"success": False, "error": f"Device '{speaker_name}' not found"}
-                cast = chromecasts[0]
-        else:
-            print(f"[HLS-TV] Looking for '{speaker_name}'...", file=sys.stderr)
-            chromecasts, browser = pychromecast.get_listed_chromecasts(
-                friendly_names=[speaker_name],
-                timeout=10
-            )
-            if not chromecasts:
-                browser.stop_discovery()
+        if cast is None:
+            cast, browser = find_cast(speaker_name, speaker_ip, "[HLS-TV]")
+            if not cast:
                 return {"success": False, "error": f"Device '{speaker_name}' not found"}
-            cast = chromecasts[0]
 
         host = cast.cast_info.host if hasattr(cast, 'cast_info') else speaker_ip or 'unknown'
         # Use passed model from discovery, fall back to querying device
@@ -1492,17 +2398,13 @@ def hls_cast_to_tv(speaker_name, hls_url, speaker_ip=None, device_model=None, ap
         launch_success = [False]
         launch_error = [None]
 
+        session = get_cast_session(cast)
+
         def launch_receiver():
             try:
-                # ENSURE CHIME: Quit any existing app first for fresh session
-                try:
-                    cast.quit_app()
-                    time.sleep(0.5)
-                except:
-                    pass
+                # ENSURE CHIME: launch(fresh=True) quits any existing app first
                 # CRITICAL: Shield needs 30s timeout for cold boot (default 10s is too short!)
-                cast.start_app(receiver_id, timeout=30)
-                time.sleep(2)  # Give receiver time to load
+                session.launch(receiver_id, timeout=30)
                 launch_success[0] = True
             except Exception as e:
                 launch_error[0] = e
@@ -1533,30 +2435,26 @@ def hls_cast_to_tv(speaker_name, hls_url, speaker_ip=None, device_model=None, ap
         # Give receiver extra time to fully load after splash (poll for readiness)
         wait_for_receiver_ready(cast, receiver_id, max_wait=3.0)  # STABILITY: Poll instead of blind sleep
 
-        mc = cast.media_controller
-
         # Send HLS URL to receiver
         receiver_name = "Visual receiver" if receiver_id == VISUAL_APP_ID else "Default Media Receiver"
         print(f"[HLS-TV] Sending HLS to {receiver_name}...", file=sys.stderr)
         print(f"[HLS-TV] Playing: {hls_url}", file=sys.stderr)
 
-        mc.play_media(
+        # Wait for the first media status after LOAD (media controller active)
+        status = session.play(
             hls_url,
             "application/x-mpegURL",  # HLS MIME type
+            timeout=30,
             stream_type="LIVE",
             autoplay=True,
             current_time=0
         )
+        if status is None:
+            print(f"[HLS-TV] Warning: no media status within 30s", file=sys.stderr)
 
-        # Wait for media controller to become active
-        try:
-            mc.block_until_active(timeout=30)
-        except Exception as block_err:
-            print(f"[HLS-TV] Warning: block_until_active failed: {block_err}", file=sys.stderr)
-
-        # Check actual media status
-        time.sleep(2)  # Give it a moment to update status
-        status = mc.status
+        # Wait for the player to settle (PLAYING/BUFFERING, or IDLE with a reason).
+        # Visual Receiver stays IDLE without a reason (hls.js plays), so this is capped.
+        status = session.wait_for_playback(timeout=2) or cast.media_controller.status
         print(f"[HLS-TV] Media status after play:", file=sys.stderr)
         if status:
             print(f"[HLS-TV]   player_state: {status.player_state}", file=sys.stderr)
@@ -1601,51 +2499,103 @@ def hls_cast_to_tv(speaker_name, hls_url, speaker_ip=None, device_model=None, ap
         return {"success": False, "error": str(e)}
 
 
-def webrtc_launch_multicast(speaker_names, https_url, speaker_ips=None, stream_name="pcaudio", app_id=None):
+class BarrierMember:
+    """One multicast member's handle on the shared start barrier.
+
+    Passed to webrtc_launch() as start_barrier; records whether this
+    member's wait() released with the others (passed=True), found the
+    barrier broken (False) or was never reached (None).
+    """
+
+    def __init__(self, barrier):
+        self.barrier = barrier
+        self.passed = None
+
+    def wait(self, timeout=None):
+        try:
+            index = self.barrier.wait(timeout)
+        except threading.BrokenBarrierError:
+            self.passed = False
+            raise
+        self.passed = True
+        return index
+
+
+def webrtc_launch_multicast(speaker_names, https_url, speaker_ips=None, stream_name="pcaudio", app_id=None, casts=None):
     """Launch custom receiver on MULTIPLE speakers for true multi-room audio.
 
     This is the solution for Cast Groups - instead of casting to the group (which only
     plays on the leader), we cast to each member individually.
 
+    All members launch concurrently and wait at a shared barrier once their
+    receiver is ready; the "connect" message then goes to every receiver at
+    the same moment. Total time ~= the slowest single launch.
+
     Args:
         speaker_names: List of speaker names to cast to
         https_url: WebRTC URL to send to receivers
         speaker_ips: Optional list of IPs (same order as names) for faster connection
         stream_name: MediaMTX stream path
         app_id: Which receiver to use (AUDIO_APP_ID or VISUAL_APP_ID). Defaults to AUDIO_APP_ID.
+        casts: Optional dict of speaker name -> connected Chromecast (daemon)
 
     Returns:
-        { success: true, launched: ["Speaker1", "Speaker2"], failed: [] }
+        { success: true, launched: ["Speaker1", "Speaker2"], failed: [],
+          synchronized: true, unsynchronized: [] }
+        unsynchronized lists launched members whose connect went out without
+        the others (barrier broken or timed out).
     """
+    from concurrent.futures import ThreadPoolExecutor
+
     try:
         print(f"[Multicast] Launching on {len(speaker_names)} speakers: {speaker_names}", file=sys.stderr)
+        start = time.time()
 
-        launched = []
-        failed = []
+        if not speaker_names:
+            return {"success": False, "error": "No speakers given", "launched": [], "failed": [], "total": 0, "mode": "multicast"}
+
+        start_barrier = threading.Barrier(len(speaker_names))
 
-        # Launch receiver on each speaker
-        for i, name in enumerate(speaker_names):
-            ip = speaker_ips[i] if speaker_ips and i < len(speaker_ips) else None
+        def launch(index):
+            name = speaker_names[index]
+            ip = speaker_ips[index] if speaker_ips and index < len(speaker_ips) else None
+            cast = casts.get(name) if casts else None
+            member = BarrierMember(start_barrier)
             print(f"[Multicast] Launching on '{name}' (IP: {ip})...", file=sys.stderr)
+            try:
+                result = webrtc_launch(name, https_url, ip, stream_name, app_id, cast=cast, start_barrier=member)
+            except Exception as e:
+                result = {"success": False, "error": str(e)}
+            if not result.get("success") and member.passed is None:
+                # Failed before the sync point: don't keep the others waiting for it
+                start_barrier.abort()
+            return name, result, member.passed
 
-            result = webrtc_launch(name, https_url, ip, stream_name, app_id)
+        with ThreadPoolExecutor(max_workers=len(speaker_names)) as pool:
+            outcomes = list(pool.map(launch, range(len(speaker_names))))
 
+        launched = []
+        failed = []
+        unsynchronized = []  # Launched, but connected without the others
+        for name, result, passed in outcomes:
             if result.get("success"):
                 launched.append(name)
+                if not passed:
+                    unsynchronized.append(name)
                 print(f"[Multicast] SUCCESS: {name}", file=sys.stderr)
             else:
                 failed.append({"name": name, "error": result.get("error", "Unknown error")})
                 print(f"[Multicast] FAILED: {name} - {result.get('error')}", file=sys.stderr)
 
-            # Small delay between launches to avoid overwhelming network
-            time.sleep(0.5)
-
         return {
             "success": len(launched) > 0,
             "launched": launched,
             "failed": failed,
             "total": len(speaker_names),
-            "mode": "multicast"
+            "mode": "multicast",
+            "synchronized": bool(launched) and not unsynchronized,
+            "unsynchronized": unsynchronized,
+            "elapsed_ms": int((time.time() - start) * 1000)
         }
 
     except Exception as e:
@@ -1842,7 +2792,7 @@ def set_default_audio_output(device_name):
         return {"success": False, "error": str(e)}
 
 
-def measure_latency(speaker_name, speaker_ip=None, timeout=15):
+def measure_latency(speaker_name, speaker_ip=None, timeout=15, cast=None):
     """Request latency measurement from Cast receiver.
 
     Sends a 'measure-latency' message to the receiver, which measures RTT
@@ -1852,6 +2802,7 @@ def measure_latency(speaker_name, speaker_ip=None, timeout=15):
         speaker_name: Name of the speaker
         speaker_ip: Optional IP for faster connection
         timeout: How long to wait for response (default 15s, measurement takes ~10s)
+        cast: Already-connected Chromecast (daemon) - skips discovery entirely
 
     Returns:
         { success: true, rtt: 42, recommendedDelay: 521, samples: 5 }
@@ -1859,60 +2810,29 @@ def measure_latency(speaker_name, speaker_ip=None, timeout=15):
     try:
         browser = None
 
-        if speaker_ip:
-            print(f"[MeasureLatency] Connecting to {speaker_name} at {speaker_ip}...", file=sys.stderr)
-            chromecasts, browser = pychromecast.get_listed_chromecasts(
-                friendly_names=[speaker_name],
-                known_hosts=[speaker_ip],
-                timeout=5
-            )
-        else:
-            print(f"[MeasureLatency] Looking for '{speaker_name}'...", file=sys.stderr)
-            chromecasts, browser = pychromecast.get_listed_chromecasts(
-                friendly_names=[speaker_name],
-                timeout=10
-            )
-
-        if not chromecasts:
-            if browser:
-                browser.stop_discovery()
-            return {"success": False, "error": f"Speaker '{speaker_name}' not found"}
+        if cast is None:
+            cast, browser = find_cast(speaker_name, speaker_ip, "[MeasureLatency]")
+            if not cast:
+                return {"success": False, "error": f"Speaker '{speaker_name}' not found"}
 
-        cast = chromecasts[0]
         cast.wait(timeout=10)
 
         # Register WebRTC namespace controller
-        webrtc = WebRTCController()
-        cast.register_handler(webrtc)
-
-        # Clear any pending messages
-        webrtc.messages.clear()
-        webrtc.message_event.clear()
-
-        # Send measure-latency request
-        print(f"[MeasureLatency] Sending measure-latency request...", file=sys.stderr)
-        webrtc.send_message({"type": "measure-latency"})
-
-        # Wait for latency-result response
-        print(f"[MeasureLatency] Waiting for response (up to {timeout}s)...", file=sys.stderr)
-
-        # Poll for response
-        import time
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            if webrtc.messages:
-                response = webrtc.messages.pop(0)
-                if response.get('type') == 'latency-result':
-                    print(f"[MeasureLatency] Got result: RTT={response.get('rtt')}ms, Recommended={response.get('recommendedDelay')}ms", file=sys.stderr)
-                    if browser:
-                        browser.stop_discovery()
-                    return {
-                        "success": True,
-                        "rtt": response.get('rtt'),
-                        "recommendedDelay": response.get('recommendedDelay'),
-                        "samples": response.get('samples', 0)
-                    }
-            time.sleep(0.5)
+        webrtc = get_webrtc_controller(cast)
+
+        # Send measure-latency request, wake on the matching latency-result
+        print(f"[MeasureLatency] Sending measure-latency request, waiting up to {timeout}s...", file=sys.stderr)
+        response = webrtc.call({"type": "measure-latency"}, ("latency-result",), timeout=timeout)
+        if response:
+            print(f"[MeasureLatency] Got result: RTT={response.get('rtt')}ms, Recommended={response.get('recommendedDelay')}ms", file=sys.stderr)
+            if browser:
+                browser.stop_discovery()
+            return {
+                "success": True,
+                "rtt": response.get('rtt'),
+                "recommendedDelay": response.get('recommendedDelay'),
+                "samples": response.get('samples', 0)
+            }
 
         if browser:
             browser.stop_discovery()
@@ -1925,11 +2845,165 @@ def measure_latency(speaker_name, speaker_ip=None, timeout=15):
         return {"success": False, "error": str(e)}
 
 
+# =============================================================================
+# CONTINUOUS LATENCY TELEMETRY
+# =============================================================================
+# Instead of one 10-second measurement, the receiver streams RTT/jitter samples
+# ("latency-sample") and we keep a sliding window per speaker. The recommended
+# delay is derived from percentiles and only moves past a hysteresis band, so
+# the PC-speaker sync delay follows the network without twitching.
+
+LATENCY_WINDOW = 120                # samples kept per speaker (~2 min at 1 Hz)
+LATENCY_MIN_SAMPLES = 5             # before a recommended delay is published
+LATENCY_HYSTERESIS_MS = 10          # ignore recommended-delay moves smaller than this
+LATENCY_STREAM_INTERVAL_MS = 1000   # receiver sampling interval
+# Same pipeline budget as the receiver's BUFFER_OFFSET_MS
+# (FFmpeg 50ms + Opus 20ms + Jitter 50ms + Decode 10ms + Speaker 30ms)
+PIPELINE_OFFSET_MS = 160
+
+
+def percentile(sorted_values, p):
+    """Nearest-rank percentile of an already sorted list (None if empty)."""
+    if not sorted_values:
+        return None
+    rank = max(0, min(len(sorted_values) - 1, math.ceil(p / 100.0 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+class LatencyTracker:
+    """Sliding window of receiver RTT/jitter samples (ms) for one speaker."""
+
+    def __init__(self, window=LATENCY_WINDOW):
+        self.lock = threading.Lock()
+        self.samples = collections.deque(maxlen=window)  # (time, rtt_ms, jitter_ms or None)
+        self.total = 0
+        self.recommended_delay = None
+
+    def add(self, rtt, jitter=None):
+        """Record a sample. Returns True when the recommended delay changed."""
+        if rtt is None:
+            return False
+        with self.lock:
+            self.samples.append((time.time(), float(rtt), None if jitter is None else float(jitter)))
+            self.total += 1
+            if len(self.samples) < LATENCY_MIN_SAMPLES:
+                return False
+            candidate = self._candidate_delay()
+            if self.recommended_delay is None or abs(candidate - self.recommended_delay) >= LATENCY_HYSTERESIS_MS:
+                self.recommended_delay = candidate
+                return True
+            return False
+
+    def _candidate_delay(self):
+        # One-way ~ RTT/2 at p95, plus p95 jitter, plus the fixed pipeline
+        rtts = sorted(rtt for _, rtt, _ in self.samples)
+        jitters = sorted(j for _, _, j in self.samples if j is not None)
+        return int(round(percentile(rtts, 95) / 2 + (percentile(jitters, 95) or 0))) + PIPELINE_OFFSET_MS
+
+    def stats(self):
+        with self.lock:
+            rtts = sorted(rtt for _, rtt, _ in self.samples)
+            jitters = sorted(j for _, _, j in self.samples if j is not None)
+            last = self.samples[-1][0] if self.samples else None
+
+        def summary(values):
+            if not values:
+                return None
+            return {
+                "p50": percentile(values, 50),
+                "p95": percentile(values, 95),
+                "p99": percentile(values, 99),
+                "min": values[0],
+                "max": values[-1]
+            }
+
+        return {
+            "samples": len(rtts),
+            "total_samples": self.total,
+            "rtt": summary(rtts),
+            "jitter": summary(jitters),
+            "recommendedDelay": self.recommended_delay,
+            "last_sample_ms_ago": int((time.time() - last) * 1000) if last else None
+        }
+
+
+latency_trackers = {}
+latency_trackers_lock = threading.Lock()
+
+
+def get_latency_tracker(speaker_name):
+    with latency_trackers_lock:
+        tracker = latency_trackers.get(speaker_name)
+        if tracker is None:
+            tracker = latency_trackers[speaker_name] = LatencyTracker()
+        return tracker
+
+
+def start_latency_stream(speaker_name, cast, interval_ms=LATENCY_STREAM_INTERVAL_MS, on_update=None):
+    """Ask the receiver to stream latency samples; feed them to the speaker's tracker.
+
+    on_update(speaker_name, stats) is called whenever the recommended delay moves.
+    """
+    tracker = get_latency_tracker(speaker_name)
+    webrtc = get_webrtc_controller(cast)
+
+    def on_sample(data):
+        if tracker.add(data.get('rtt'), data.get('jitter')) and on_update:
+            on_update(speaker_name, tracker.stats())
+
+    webrtc.set_listener('latency-sample', on_sample)
+    webrtc.send_message({"type": "latency-stream-start", "intervalMs": interval_ms})
+    return {"success": True, "speaker": speaker_name, "interval_ms": interval_ms}
+
+
+def stop_latency_stream(speaker_name, cast):
+    """Stop the receiver's latency stream. Returns the final window stats."""
+    webrtc = get_webrtc_controller(cast)
+    webrtc.set_listener('latency-sample', None)
+    webrtc.send_message({"type": "latency-stream-stop"})
+    return {"success": True, "speaker": speaker_name, **get_latency_tracker(speaker_name).stats()}
+
+
+def measure_latency_continuous(speaker_name, speaker_ip=None, duration=10, interval_ms=500, cast=None):
+    """Collect streamed latency samples for `duration` seconds and return percentiles.
+
+    Returns:
+        { success: true, samples: 20, rtt: {p50, p95, p99, min, max}, jitter: {...}, recommendedDelay: 190 }
+    """
+    try:
+        browser = None
+
+        if cast is None:
+            cast, browser = find_cast(speaker_name, speaker_ip, "[MeasureLatency]")
+            if not cast:
+                return {"success": False, "error": f"Speaker '{speaker_name}' not found"}
+
+        cast.wait(timeout=10)
+        print(f"[MeasureLatency] Streaming samples every {interval_ms}ms for {duration}s...", file=sys.stderr)
+        start_latency_stream(speaker_name, cast, interval_ms)
+        time.sleep(duration)  # Collection window - samples arrive on the socket thread
+        result = stop_latency_stream(speaker_name, cast)
+
+        if browser:
+            browser.stop_discovery()
+        if not result["samples"]:
+            return {"success": False, "error": "No latency samples (receiver not streaming WebRTC?)"}
+        print(f"[MeasureLatency] {result['samples']} samples, RTT p50={result['rtt']['p50']}ms "
+              f"p95={result['rtt']['p95']}ms, Recommended={result['recommendedDelay']}ms", file=sys.stderr)
+        return result
+
+    except Exception as e:
+        import traceback
+        print(f"[MeasureLatency] ERROR: {e}", file=sys.stderr)
+        traceback.print_exc(file=sys.stderr)
+        return {"success": False, "error": str(e)}
+
+
 def set_volume_fast(speaker_name, volume_level, speaker_ip=None):
     """Fast volume set using direct IP connection (no discovery).
 
-    This is 10x faster than set_volume() because it uses known_hosts hint.
-    Use when you have the speaker IP cached.
+    Connects straight to the cached host:port (no mDNS at all), falling back
+    to the known_hosts hint, then discovery. Use when you have the speaker IP cached.
 
     Args:
         speaker_name: Name of the speaker (used for logging/fallback)
@@ -1938,31 +3012,12 @@ def set_volume_fast(speaker_name, volume_level, speaker_ip=None):
     """
     try:
         volume = max(0.0, min(1.0, float(volume_level)))
-        browser = None
-
-        if speaker_ip:
-            # Use known_hosts for faster discovery (< 2 seconds vs 10 seconds)
-            print(f"Fast volume: using known host {speaker_ip}...", file=sys.stderr)
-            chromecasts, browser = pychromecast.get_listed_chromecasts(
-                friendly_names=[speaker_name],
-                known_hosts=[speaker_ip],
-                timeout=3
-            )
-        else:
-            # Fallback to full discovery (5-10 seconds)
-            print(f"Fast volume: no IP, using discovery...", file=sys.stderr)
-            chromecasts, browser = pychromecast.get_listed_chromecasts(
-                friendly_names=[speaker_name],
-                timeout=10
-            )
 
-        if not chromecasts:
-            if browser:
-                browser.stop_discovery()
+        cast, browser = find_cast(speaker_name, speaker_ip, "Fast volume:")
+        if not cast:
             print(f"Fast volume: FAILED - speaker not found", file=sys.stderr)
             return {"success": False, "error": f"Speaker '{speaker_name}' not found"}
 
-        cast = chromecasts[0]
         cast.wait(timeout=3)
         print(f"Fast volume: connected, setting to {int(volume * 100)}%", file=sys.stderr)
 
@@ -1979,19 +3034,168 @@ def set_volume_fast(speaker_name, volume_level, speaker_ip=None):
         return {"success": False, "error": str(e)}
 
 
+# =============================================================================
+# DAEMON DELEGATION
+# =============================================================================
+# When cast-daemon.py is running it listens on a localhost socket and writes
+# {port, pid, token} to daemon_control_path(). CLI invocations forward their
+# command there first - warm connections, no discovery - and only run
+# in-process when no daemon answers. --no-daemon (or PCNS_NO_DAEMON=1) skips it.
+
+DAEMON_CONNECT_TIMEOUT = 0.5  # seconds - a live daemon accepts instantly
+
+
+def daemon_control_path():
+    """Where a running daemon advertises its control socket (next to the device cache)."""
+    return os.path.join(os.path.dirname(device_cache_path()), 'daemon.json')
+
+
+def forward_to_daemon(cmd_data, timeout=60):
+    """Run cmd_data on a running daemon.
+
+    Returns the daemon's result, or None when no daemon is reachable (caller
+    runs the command in-process). Once the command was sent, a slow or
+    vanished daemon yields an error result instead of None - it may already
+    have run the command, so never run it twice.
+    """
+    import socket
+    try:
+        with open(daemon_control_path(), encoding='utf-8') as f:
+            control = json.load(f)
+        sock = socket.create_connection(('127.0.0.1', control['port']), timeout=DAEMON_CONNECT_TIMEOUT)
+    except (OSError, ValueError, KeyError):
+        return None
+
+    with sock:
+        try:
+            sock.sendall((json.dumps({**cmd_data, "token": control.get('token')}) + "\n").encode('utf-8'))
+        except OSError:
+            return None
+        try:
+            sock.settimeout(timeout)
+            line = sock.makefile('rb').readline()
+        except OSError as e:
+            return {"success": False, "error": f"Daemon did not answer: {e}"}
+
+    if not line:
+        return {"success": False, "error": "daemon closed connection"}
+    try:
+        result = json.loads(line)
+    except ValueError:
+        return {"success": False, "error": "Daemon sent an invalid reply"}
+    if result.get('error_code') == 'UNAUTHORIZED':
+        return None  # Stale control file from another daemon instance
+    result.pop('requestId', None)
+    return result
+
+
+def daemon_command_from_argv(argv):
+    """Map a CLI invocation onto the equivalent daemon command, or None.
+
+    Only commands whose daemon version behaves the same are mapped (e.g. the
+    CLI ping plays a chime, the daemon's doesn't - so ping stays local).
+    Returns (cmd_data, timeout).
+    """
+    def arg(i, default=None):
+        return argv[i] if len(argv) > i and argv[i] != '' else default
+
+    command = argv[0] if argv else None
+    n = len(argv)
+
+    if command == "discover" and "--stream" not in argv and "--cached" not in argv:
+        args = [a for a in argv[1:] if not a.startswith("--")]
+        timeout = int(args[0]) if args else 5
+        return {"cmd": "discover", "timeout": timeout}, timeout + 30
+    if command == "stop" and n >= 2:
+        return {"cmd": "stop", "speaker": argv[1]}, 30
+    if command == "stop-fast" and n >= 3:
+        return {"cmd": "stop-fast", "speaker": argv[1], "ip": arg(2)}, 30
+    if command == "get-volume" and n >= 2:
+        return {"cmd": "get-volume", "speaker": argv[1]}, 20
+    if command == "set-volume" and n >= 3:
+        return {"cmd": "set-volume", "speaker": argv[1], "volume": float(argv[2])}, 20
+    if command == "set-volume-fast" and n >= 3:
+        return {"cmd": "set-volume", "speaker": argv[1], "volume": float(argv[2]), "ip": arg(3)}, 20
+    if command == "device-info" and n >= 2:
+        return {"cmd": "device-info", "speaker": argv[1]}, 30
+    if command == "get-group-members" and n >= 2:
+        return {"cmd": "get-group-members", "speaker": argv[1]}, 30
+    if command == "webrtc-launch" and n >= 2:
+        return {"cmd": "webrtc-launch", "speaker": argv[1], "url": arg(2), "ip": arg(3),
+                "stream": arg(4, "pcaudio"), "app_id": arg(5)}, 60
+    if command == "webrtc-proxy-connect" and n >= 3:
+        return {"cmd": "webrtc-proxy-connect", "speaker": argv[1], "mediamtx_url": argv[2], "ip": arg(3),
+                "stream": arg(4, "pcaudio"), "app_id": arg(5)}, 60
+    if command == "webrtc-multicast" and n >= 3:
+        ips = json.loads(argv[3]) if arg(3) and argv[3] != "null" else None
+        return {"cmd": "webrtc-multicast", "speakers": json.loads(argv[1]), "url": argv[2], "ips": ips,
+                "stream": arg(4, "pcaudio"), "app_id": arg(5)}, 90
+    if command == "hls-cast" and n >= 3:
+        return {"cmd": "hls-cast", "speaker": argv[1], "url": argv[2], "ip": arg(3),
+                "model": arg(4), "app_id": arg(5)}, 90
+    if command == "cast-url" and n >= 3:
+        return {"cmd": "cast-url", "speaker": argv[1], "url": argv[2], "content_type": arg(3), "ip": arg(4)}, 60
+    if command == "measure-latency" and n >= 2 and "--continuous" not in argv:
+        args = [a for a in argv[1:] if not a.startswith("--")]
+        timeout = int(args[2]) if len(args) > 2 else 15
+        return {"cmd": "measure-latency", "speaker": args[0], "ip": args[1] if len(args) > 1 and args[1] else None,
+                "timeout": timeout}, timeout + 30
+    return None
+
+
+def report_startup_profile(command, main_start):
+    """--profile-startup: phase + import timings (ms) as one JSON line on stderr."""
+    now = time.perf_counter()
+    print(json.dumps({
+        "profile": {
+            "command": command,
+            "module_load_ms": round((main_start - _module_start) * 1000, 1),
+            "command_ms": round((now - main_start) * 1000, 1),
+            "total_ms": round((now - _module_start) * 1000, 1),
+            "imports_ms": import_timings,
+            "pychromecast_loaded": 'pychromecast' in sys.modules
+        }
+    }), file=sys.stderr)
+
+
 if __name__ == "__main__":
+    main_start = time.perf_counter()
+    if "--profile-startup" in sys.argv:
+        sys.argv.remove("--profile-startup")
+        import atexit
+        atexit.register(lambda: report_startup_profile(sys.argv[1] if len(sys.argv) > 1 else None, main_start))
+
     if len(sys.argv) < 2:
         print(json.dumps({"success": False, "error": "No command specified"}))
         sys.exit(1)
 
     command = sys.argv[1]
 
+    # DAEMON DELEGATION: reuse a running daemon's warm connections if there is one
+    if "--no-daemon" in sys.argv:
+        sys.argv.remove("--no-daemon")
+    elif not os.environ.get("PCNS_NO_DAEMON"):
+        delegated = daemon_command_from_argv(sys.argv[1:])
+        if delegated:
+            result = forward_to_daemon(*delegated)
+            if result is not None:
+                print(f"[Daemon] '{command}' answered by running daemon", file=sys.stderr)
+                print(json.dumps(result))
+                sys.exit(0)
+
     if command == "discover":
-        # Optional timeout argument: discover [timeout]
+        # Optional timeout argument: discover [timeout] [--cached | --stream]
         # Default 5s for fast boot (was 12s)
-        timeout = int(sys.argv[2]) if len(sys.argv) > 2 else 5
-        result = discover_speakers(timeout=timeout)
-        print(json.dumps(result))
+        # --cached: answer instantly from the device cache, rescan in background
+        # --stream: JSON line per device as found, then group lines, then a "done" line
+        args = [a for a in sys.argv[2:] if not a.startswith("--")]
+        timeout = int(args[0]) if args else 5
+        if "--stream" in sys.argv:
+            discover_speakers_stream(timeout=timeout)
+        elif "--cached" in sys.argv:
+            print(json.dumps(discover_cached(timeout=timeout)))
+        else:
+            print(json.dumps(discover_speakers(timeout=timeout)))
 
     elif command == "ping" and len(sys.argv) >= 3:
         # Ping - triggers Nest's pairing sound by launching a new Cast session
@@ -2000,33 +3204,29 @@ if __name__ == "__main__":
         try:
             import time
             print(f"Pinging '{speaker}'...", file=sys.stderr)
-            chromecasts, browser = pychromecast.get_listed_chromecasts(friendly_names=[speaker])
-            if chromecasts:
-                cast = chromecasts[0]
+            cast, browser = find_cast(speaker, log_prefix="[Ping]")
+            if cast:
                 host = cast.cast_info.host if hasattr(cast, 'cast_info') else 'unknown'
                 print(f"Connecting to {host}...", file=sys.stderr)
                 cast.wait()
 
-                # Step 1: Quit any existing app to reset the session
+                session = get_cast_session(cast)
+
+                # Step 1: Quit any existing app to reset the session (waits for it to be gone)
                 print(f"Quitting existing app...", file=sys.stderr)
-                cast.quit_app()
-                time.sleep(1)
+                session.quit()
 
                 # Step 2: Launch the default media receiver - this triggers the pairing sound!
-                # App ID CC1AD845 is the default media receiver
-                print(f"Launching default receiver (triggers pairing sound)...", file=sys.stderr)
-                cast.start_app("CC1AD845")
-                time.sleep(1.5)  # Give it time to play the chime
-
                 # Step 3: Quit the app so speaker returns to idle
-                cast.quit_app()
+                print(f"Launching default receiver (triggers pairing sound)...", file=sys.stderr)
+                session.chime()
 
                 volume = cast.status.volume_level if cast.status else None
-                browser.stop_discovery()
+                if browser:
+                    browser.stop_discovery()
                 print("Ping successful!", file=sys.stderr)
                 print(json.dumps({"success": True, "ip": host, "volume": volume}))
             else:
-                browser.stop_discovery()
                 print(json.dumps({"success": False, "error": "Speaker not found"}))
         except Exception as e:
             print(json.dumps({"success": False, "error": str(e)}))
@@ -2170,11 +3370,16 @@ if __name__ == "__main__":
 
     elif command == "measure-latency" and len(sys.argv) >= 3:
         # Request latency measurement from Cast receiver
-        # Args: measure-latency <speaker_name> [speaker_ip] [timeout]
-        speaker = sys.argv[2]
-        speaker_ip = sys.argv[3] if len(sys.argv) > 3 and sys.argv[3] != '' else None
-        timeout = int(sys.argv[4]) if len(sys.argv) > 4 else 15
-        result = measure_latency(speaker, speaker_ip, timeout)
+        # Args: measure-latency <speaker_name> [speaker_ip] [timeout] [--continuous]
+        # --continuous: sample RTT/jitter for <timeout> seconds, return p50/p95/p99
+        args = [a for a in sys.argv[2:] if not a.startswith("--")]
+        speaker = args[0]
+        speaker_ip = args[1] if len(args) > 1 and args[1] != '' else None
+        timeout = int(args[2]) if len(args) > 2 else 15
+        if "--continuous" in sys.argv:
+            result = measure_latency_continuous(speaker, speaker_ip, duration=timeout)
+        else:
+            result = measure_latency(speaker, speaker_ip, timeout)
         print(json.dumps(result))
 
     else:
@@ -27,6 +27,7 @@ let isReady = false;
 let isIntentionalShutdown = false; // STABILITY: Track if shutdown is intentional vs crash
 let restartAttempts = 0; // Track restart attempts to prevent infinite loops
 const MAX_RESTART_ATTEMPTS = 3;
+let eventListeners = []; // Callbacks for unsolicited daemon events (subscribe)
 
 // Response line buffer
 let rl = null;
@@ -63,6 +64,18 @@ function startDaemon() {
       try {
         const response = JSON.parse(line);
 
+        // Unsolicited push events (status/media/connection) - not a response
+        if (response.event) {
+          for (const listener of eventListeners) {
+            try {
+              listener(response);
+            } catch (e) {
+              console.error('[Daemon] Event listener error:', e.message);
+            }
+          }
+          return;
+        }
+
         // STABILITY: Match response to request by requestId (stereo mode reliability)
         // If response has requestId, use it. Otherwise fall back to FIFO (legacy).
         const responseId = response.requestId;
@@ -276,6 +289,23 @@ async function disconnectSpeaker(speakerName) {
   }, 3000);
 }
 
+/**
+ * Stop all (or the given) speakers in parallel.
+ * Resolves once every receiver has quit; disconnect chimes finish in the
+ * background and are reported as { event: 'stopped', speaker, ... } events.
+ */
+async function stopAllSpeakers(speakerNames = null, { chime = true, disconnect = false } = {}) {
+  if (!isReady) {
+    return { success: true, results: {}, count: 0 };
+  }
+
+  const cmd = { cmd: 'stop-all', chime, disconnect };
+  if (speakerNames) {
+    cmd.speakers = speakerNames;
+  }
+  return sendCommand(cmd, 8000);
+}
+
 /**
  * Get daemon status
  */
@@ -287,6 +317,122 @@ async function getDaemonStatus() {
   return sendCommand({ cmd: 'status' }, 2000);
 }
 
+/**
+ * Subscribe to pushed status events for a speaker (replaces get-volume polling)
+ */
+async function subscribeSpeaker(speakerName, speakerIp = null) {
+  if (!isReady) {
+    await startDaemon();
+  }
+
+  return sendCommand({
+    cmd: 'subscribe',
+    speaker: speakerName,
+    ip: speakerIp
+  }, 10000);
+}
+
+/**
+ * Stop status events for a speaker
+ */
+async function unsubscribeSpeaker(speakerName) {
+  if (!isReady) {
+    return { success: true };
+  }
+
+  return sendCommand({
+    cmd: 'unsubscribe',
+    speaker: speakerName
+  }, 2000);
+}
+
+/**
+ * Start continuous latency telemetry for a speaker.
+ * The daemon pushes { event: 'latency', recommendedDelay, rtt: {p50, p95, p99}, ... }
+ * whenever the recommended sync delay moves - listen with onDaemonEvent().
+ */
+async function startLatencyStream(speakerName, speakerIp = null, intervalMs = 1000) {
+  if (!isReady) {
+    await startDaemon();
+  }
+
+  return sendCommand({
+    cmd: 'latency-stream-start',
+    speaker: speakerName,
+    ip: speakerIp,
+    interval_ms: intervalMs
+  }, 10000);
+}
+
+/**
+ * Stop continuous latency telemetry (resolves with the final window stats)
+ */
+async function stopLatencyStream(speakerName, speakerIp = null) {
+  if (!isReady) {
+    return { success: true };
+  }
+
+  return sendCommand({
+    cmd: 'latency-stream-stop',
+    speaker: speakerName,
+    ip: speakerIp
+  }, 5000);
+}
+
+/**
+ * List devices from the daemon's shared registry (same shape as `cast-helper.py discover`).
+ * With events: true the daemon also pushes { event: 'discover-device' | 'discover-group', requestId, ... }
+ * as devices are found - listen with onDaemonEvent().
+ */
+async function discoverDevices(timeoutSec = 5, { events = false } = {}) {
+  if (!isReady) {
+    await startDaemon();
+  }
+
+  return sendCommand({
+    cmd: 'discover',
+    timeout: timeoutSec,
+    events
+  }, (timeoutSec + 30) * 1000);
+}
+
+/**
+ * Current sliding-window latency stats for a speaker
+ */
+async function getLatencyStats(speakerName) {
+  if (!isReady) {
+    return { success: false, error: 'Daemon not running' };
+  }
+
+  return sendCommand({
+    cmd: 'latency-stats',
+    speaker: speakerName
+  }, 2000);
+}
+
+/**
+ * Register a callback for daemon events: { event, seq, speaker, ... }
+ * Returns a function that removes the listener.
+ */
+function onDaemonEvent(callback) {
+  eventListeners.push(callback);
+  return () => {
+    eventListeners = eventListeners.filter(l => l !== callback);
+  };
+}
+
+/**
+ * Run any daemon command (webrtc-launch, hls-cast, stop-fast, discover, ...)
+ * against the daemon's cached connections instead of spawning cast-helper.py
+ */
+async function runDaemonCommand(cmd, timeoutMs = 30000) {
+  if (!isReady) {
+    await startDaemon();
+  }
+
+  return sendCommand(cmd, timeoutMs);
+}
+
 /**
  * Check if daemon is running
  */
@@ -302,6 +448,15 @@ module.exports = {
   pingSpeaker,
   connectSpeaker,
   disconnectSpeaker,
+  stopAllSpeakers,
   getDaemonStatus,
+  subscribeSpeaker,
+  unsubscribeSpeaker,
+  startLatencyStream,
+  stopLatencyStream,
+  getLatencyStats,
+  discoverDevices,
+  onDaemonEvent,
+  runDaemonCommand,
   isDaemonRunning
 };
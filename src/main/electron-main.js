@@ -1317,11 +1317,14 @@ async function autoDiscoverDevices() {
     }
 
     // Discover speakers in background
+    // BOOT OPTIMIZATION: --cached answers from the device cache (seen in the
+    // last 10 min) and rescans in the background; full scan if there's none
     sendLog('Scanning for Chromecast/Nest speakers...');
-    const speakerResult = await runPython(['discover']);
+    const speakerResult = await runPython(['discover', '--cached']);
     if (speakerResult.success && speakerResult.speakers) {
       discoveredSpeakers = speakerResult.speakers;
-      sendLog(`Found ${speakerResult.speakers.length} speakers`, 'success');
+      sendLog(`Found ${speakerResult.speakers.length} speakers` +
+        (speakerResult.cached ? ` (cached ${speakerResult.cache_age}s ago)` : ''), 'success');
 
       // Send to renderer
       if (mainWindow && mainWindow.webContents) {
@@ -3,9 +3,15 @@
 PC Nest Speaker - Full Streaming Test
 Streams system audio to a selected Nest speaker using HLS with MP3 fallback.
 
-Run: python stream_to_nest.py
+Run: python stream_to_nest.py [--flask]
+
+HLS files and /live.mp3 are served by a single-threaded asyncio server;
+--flask uses the previous http.server + threaded Flask pair instead (see
+scripts/bench_stream_server.py for a comparison).
 """
 
+import asyncio
+import json
 import os
 import socket
 import subprocess
@@ -14,10 +20,12 @@ import time
 import threading
 import pathlib
 import re
+from collections import deque
+from itertools import islice
 from shutil import which
 
 import pychromecast
-from flask import Flask, Response
+from flask import Flask, Response, request
 
 # Configuration
 PORT = 8000
@@ -32,6 +40,52 @@ HLS_SEGMENT_TIME = "0.5"
 HLS_LIST_SIZE = "3"
 CHUNK_SIZE = 8192
 AUDIO_BUFFER_SIZE = "100"
+# Shared MP3 history, kept by audio duration: at least RING_MIN_MS, and never
+# less than the largest queue bound or prebuffer in use - so the overflow
+# policy, not the ring size, decides when a listener is too far behind.
+RING_MIN_MS = 5000
+# Shared MP3 storage: preallocated slots, filled by consecutive pipe reads. The reader
+# fills them with readinto and listeners get memoryview slices, so the
+# steady state allocates no chunk buffers at all. The pool grows if the
+# ring needs more slots than this. A slot is only rewritten SLOT_GUARD_MS of
+# audio after its last frames left the ring, and never while a listener's
+# socket still has views of it queued (see Listener.pinned_offset).
+RING_SLOTS = 32
+SLOT_GUARD_MS = 2000
+SLOT_HEADROOM = 4096  # Room for a partial frame carried over from the previous slot
+MIN_SLOT_READ = 2048  # Move to a fresh slot once less than this is left in the current one
+
+# Burst of already-encoded audio sent to a new listener before live data, so
+# the receiver's buffer fills at once instead of in real time. Larger = faster
+# start, but that much more latency for the listener. Override per request
+# with /live.mp3?prebuffer=<ms>.
+PREBUFFER_MS = {
+    "audio/mpeg": 500,
+}
+
+# Per-listener queue bound: audio a listener may have pending (not yet taken
+# off the ring) before the overflow policy kicks in. "drop-oldest" skips the
+# stale frames so the listener catches up to live; "disconnect" drops the
+# connection and lets the receiver reconnect. Override per request with
+# /live.mp3?max_lag=<ms>&policy=<name>.
+LISTENER_MAX_LAG_MS = 2000
+LISTENER_MAX_LAG_CAP_MS = 30000  # Upper limit for ?max_lag= / ?prebuffer= (ring memory)
+# A socket that takes no data for this long is closed whatever the policy:
+# its queued views keep slots from being reused (asyncio server)
+LISTENER_STALL_MS = LISTENER_MAX_LAG_CAP_MS
+OVERFLOW_POLICY = "drop-oldest"
+OVERFLOW_POLICIES = ("drop-oldest", "disconnect")
+
+# MP3 frame header tables (MPEG-1 / MPEG-2 / MPEG-2.5, Layer III)
+MP3_BITRATES = {
+    1: [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320],
+    2: [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+}
+MP3_SAMPLE_RATES = {
+    1: [44100, 48000, 32000],
+    2: [22050, 24000, 16000],
+    2.5: [11025, 12000, 8000],
+}
 
 # Audio device priority
 AUDIO_DEVICES = [
@@ -42,6 +96,7 @@ AUDIO_DEVICES = [
 # Flask app for MP3 fallback
 app = Flask(__name__)
 _ffmpeg_mp3_process = None
+_mp3_hub = None
 
 
 def get_local_ip():
@@ -198,20 +253,408 @@ def start_ffmpeg_mp3(device):
     return subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, bufsize=CHUNK_SIZE)
 
 
+def mp3_frame_info(buf, pos):
+    """Parse the Layer III frame header at buf[pos:pos + 4].
+
+    Returns (frame_length, duration_ms), or None if there is no valid header.
+    """
+    if pos + 4 > len(buf) or buf[pos] != 0xFF or (buf[pos + 1] & 0xE0) != 0xE0:
+        return None
+    version_bits = (buf[pos + 1] >> 3) & 0x03
+    layer_bits = (buf[pos + 1] >> 1) & 0x03
+    bitrate_index = buf[pos + 2] >> 4
+    rate_index = (buf[pos + 2] >> 2) & 0x03
+    if version_bits == 1 or layer_bits != 1 or bitrate_index in (0, 15) or rate_index == 3:
+        return None
+    version = {3: 1, 2: 2, 0: 2.5}[version_bits]
+    bitrate = MP3_BITRATES[1 if version == 1 else 2][bitrate_index] * 1000
+    sample_rate = MP3_SAMPLE_RATES[version][rate_index]
+    padding = (buf[pos + 2] >> 1) & 0x01
+    samples = 1152 if version == 1 else 576
+    return samples // 8 * bitrate // sample_rate + padding, samples * 1000 / sample_rate
+
+
+def mp3_frame_run(buf, pos, end):
+    """Find the first run of consecutive whole MP3 frames in buf[pos:end].
+
+    Works in place on a memoryview - nothing is copied. Returns
+    (run_start, run_end, duration_ms). If run_end > run_start the run is
+    ready to publish and scanning continues at run_end; otherwise scanning
+    stopped at run_start (a partial frame or header) and buf[run_start:end]
+    must wait for more data. Leading ID3 tags and junk are skipped by
+    resyncing on the next valid header.
+    """
+    run_start = None
+    duration_ms = 0.0
+    while pos + 4 <= end:
+        info = mp3_frame_info(buf, pos)
+        if info is not None:
+            length, ms = info
+            if pos + length > end:
+                break
+            if run_start is None and mp3_frame_info(buf, pos + length) is None:
+                # Resyncing: a lone 0xFFE pattern in junk isn't a frame
+                # unless another header follows it
+                if pos + length + 4 > end:
+                    break
+                pos += 1
+                continue
+            if run_start is None:
+                run_start = pos
+            pos += length
+            duration_ms += ms
+            continue
+        if run_start is not None:
+            break  # Junk after frames: publish the run, resync from here next call
+        if buf[pos:pos + 3] == b"ID3":
+            if pos + 10 > end:
+                break
+            size = (buf[pos + 6] << 21) | (buf[pos + 7] << 14) | (buf[pos + 8] << 7) | buf[pos + 9]
+            if pos + 10 + size > end:
+                break
+            pos += 10 + size
+        else:
+            pos += 1  # Junk: resync on the next header
+    if run_start is None:
+        return pos, pos, 0.0
+    return run_start, pos, duration_ms
+
+
+class Listener:
+    """One HTTP client's position in the hub, its queue bound and counters."""
+
+    def __init__(self, cursor, offset, max_lag_ms, policy, name=None):
+        self.cursor = cursor
+        self.offset = offset  # Stream byte position matching cursor
+        self.max_lag_ms = max_lag_ms
+        self.policy = policy
+        self.name = name
+        self.sent_bytes = 0
+        self.dropped_bytes = 0
+        self.overflows = 0
+        self.buffered_ms = 0.0  # Audio already handed to the socket but unsent, set by the writer
+        self.pinned_offset = None  # Oldest stream byte the writer's socket may still hold a view of
+        self.disconnected = False
+        self.connected_at = time.time()
+
+    def stats(self):
+        return {
+            "name": self.name,
+            "policy": self.policy,
+            "max_lag_ms": self.max_lag_ms,
+            "sent_bytes": self.sent_bytes,
+            "dropped_bytes": self.dropped_bytes,
+            "overflows": self.overflows,
+            "connected_s": round(time.time() - self.connected_at, 1),
+        }
+
+
+class BroadcastHub:
+    """Fan one encoder's output out to any number of HTTP listeners.
+
+    A single reader thread owns the pipe and appends chunks to a shared ring;
+    every listener keeps its own cursor into it. Listeners never read the
+    pipe themselves, so a second speaker (or a reconnect) can't steal chunks
+    from the first, and extra listeners cost no extra encoding.
+
+    The reader never waits on a listener: a stalled speaker only falls
+    behind in its own queue, where its overflow policy applies. The encoder
+    and every other listener carry on at live latency.
+    """
+
+    def __init__(self, source, content_type="audio/mpeg", ring_slots=RING_SLOTS):
+        self.source = source
+        self.content_type = content_type
+        self.slots = [memoryview(bytearray(SLOT_HEADROOM + CHUNK_SIZE)) for _ in range(ring_slots)]
+        self.slot_end_offset = [0] * ring_slots  # Stream position just past each slot's frames
+        self.slot_end_ms = [0.0] * ring_slots  # Audio position just past each slot's frames
+        self.free_slots = deque(range(ring_slots))  # Never written yet
+        self.used_slots = deque()  # Written slots, oldest first
+        self.ring = deque()  # (view, duration_ms, slot)
+        self.ring_ms = 0.0  # Audio held in the ring
+        self.base_ms = 0.0  # Audio position of ring[0]
+        self.head_ms = 0.0  # Audio position of the next frames published
+        self.retain_ms = max(RING_MIN_MS, LISTENER_MAX_LAG_MS, *PREBUFFER_MS.values())
+        self.base = 0  # Sequence number of ring[0]
+        self.base_offset = 0  # Stream byte position of ring[0]
+        self.head_offset = 0  # Stream byte position of the next frames published
+        self.overwritten_offset = 0  # Views of frames before this position may be reused
+        self.cond = threading.Condition()
+        self.closed = False
+        self.listeners = set()
+        self.dropped_bytes = 0  # Totals across listeners that have gone
+        self.overflows = 0
+        self.on_publish = []  # Called (from the reader thread) after new frames or close
+        self.thread = threading.Thread(target=self._pump, name="mp3-hub", daemon=True)
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def _trim_ring(self):
+        """Retire the oldest entries beyond retain_ms of audio. Caller holds self.cond."""
+        while self.ring and self.ring_ms - self.ring[0][1] >= self.retain_ms:
+            view, duration_ms, _ = self.ring.popleft()
+            self.base += 1
+            self.base_offset += len(view)
+            self.base_ms += duration_ms
+            self.ring_ms -= duration_ms
+
+    def _reusable(self, slot):
+        """slot's frames left the ring at least SLOT_GUARD_MS of audio ago and
+        no listener's socket still queues a view of them. Caller holds self.cond.
+        """
+        if self.slot_end_offset[slot] > self.base_offset or self.slot_end_ms[slot] > self.base_ms - SLOT_GUARD_MS:
+            return False
+        return all(listener.pinned_offset is None or self.slot_end_offset[slot] <= listener.pinned_offset
+                   for listener in self.listeners)
+
+    def _next_slot(self):
+        """Pick the slot for the next read. Caller holds self.cond.
+
+        A written slot is only reused once its frames have been out of the
+        ring for SLOT_GUARD_MS of audio and are not pinned by a listener;
+        until then the pool grows. Views of a reused slot that listeners
+        still hold are marked stale.
+        """
+        if self.free_slots:
+            slot = self.free_slots.popleft()
+        elif self.used_slots and self._reusable(self.used_slots[0]):
+            slot = self.used_slots.popleft()
+            self.overwritten_offset = max(self.overwritten_offset, self.slot_end_offset[slot])
+        else:
+            slot = len(self.slots)
+            self.slots.append(memoryview(bytearray(SLOT_HEADROOM + CHUNK_SIZE)))
+            self.slot_end_offset.append(0)
+            self.slot_end_ms.append(0.0)
+        self.slot_end_offset[slot] = self.head_offset
+        self.slot_end_ms[slot] = self.head_ms
+        self.used_slots.append(slot)
+        return slot
+
+    def _pump(self):
+        """Reader thread: the only consumer of the encoder pipe.
+
+        readinto1 appends to the current slot until it is nearly full, then
+        moves on to the next one, carrying over any partial frame. Complete
+        frame runs are published as memoryview slices of the slot.
+        """
+        with self.cond:
+            slot = self._next_slot()
+        buf = self.slots[slot]
+        pos = end = 0  # Unpublished bytes are buf[pos:end]
+        try:
+            while True:
+                if len(buf) - end < MIN_SLOT_READ:
+                    with self.cond:
+                        slot = self._next_slot()
+                    carry = end - pos
+                    if carry > SLOT_HEADROOM:
+                        carry = 0  # Oversized tag or junk: drop it, resync on new data
+                    elif carry:
+                        self.slots[slot][:carry] = buf[pos:end]
+                    buf = self.slots[slot]
+                    pos, end = 0, carry
+
+                n = self.source.readinto1(buf[end:end + CHUNK_SIZE])
+                if not n:
+                    break
+                end += n
+                with self.cond:
+                    while True:
+                        run_start, run_end, duration_ms = mp3_frame_run(buf, pos, end)
+                        if run_end == run_start:
+                            pos = run_start
+                            break
+                        self.ring.append((buf[run_start:run_end], duration_ms, slot))
+                        self.ring_ms += duration_ms
+                        self.head_ms += duration_ms
+                        self.head_offset += run_end - run_start
+                        pos = run_end
+                    self.slot_end_offset[slot] = self.head_offset
+                    self.slot_end_ms[slot] = self.head_ms
+                    self._trim_ring()
+                    self.cond.notify_all()
+                for callback in self.on_publish:
+                    callback()
+        finally:
+            self.close()
+
+    def close(self):
+        with self.cond:
+            self.closed = True
+            self.cond.notify_all()
+        for callback in self.on_publish:
+            callback()
+
+    def head(self):
+        """Sequence number of the next chunk to arrive."""
+        with self.cond:
+            return self.base + len(self.ring)
+
+    def start_cursor(self, prebuffer_ms):
+        """Cursor for a new listener: far enough back to hold prebuffer_ms.
+
+        Chunks are whole frames, so the burst always starts on a frame
+        boundary the decoder can lock onto immediately.
+        """
+        with self.cond:
+            cursor = self.base + len(self.ring)
+            buffered_ms = 0.0
+            for _, duration_ms, _ in reversed(self.ring):
+                if buffered_ms >= prebuffer_ms:
+                    break
+                buffered_ms += duration_ms
+                cursor -= 1
+            return cursor
+
+    def _enforce_bound(self, listener):
+        """Apply the listener's overflow policy if its queue exceeds the bound.
+
+        Caller holds self.cond. The bound is checked in milliseconds of
+        pending audio, including what the listener's writer still buffers
+        (only ring frames can be dropped, though). The ring retains at least every listener's bound, so
+        frames falling off it unread (listener blocked mid-write) always
+        means an overflow; they count as dropped too. Returns False if the
+        listener must be disconnected.
+        """
+        fell_off = listener.cursor < self.base
+        if fell_off:
+            listener.dropped_bytes += self.base_offset - listener.offset
+            listener.cursor, listener.offset = self.base, self.base_offset
+
+        pending = list(islice(self.ring, listener.cursor - self.base, None))
+        lag_ms = listener.buffered_ms + sum(duration_ms for _, duration_ms, _ in pending)
+        if not fell_off and lag_ms <= listener.max_lag_ms:
+            return True
+
+        listener.overflows += 1
+        if listener.policy == "disconnect":
+            return False
+
+        # drop-oldest: skip whole frame runs until back within the bound
+        for frames, duration_ms, _ in pending:
+            if lag_ms <= listener.max_lag_ms:
+                break
+            lag_ms -= duration_ms
+            listener.dropped_bytes += len(frames)
+            listener.offset += len(frames)
+            listener.cursor += 1
+        return True
+
+    def read(self, listener, timeout=5.0):
+        """Pending chunks for listener, blocking until there are any.
+
+        Returns a list of chunks and advances the listener's cursor. The list
+        is empty once the encoder has ended (or nothing arrived within
+        timeout). Returns None if the overflow policy disconnected it.
+        """
+        with self.cond:
+            self.cond.wait_for(lambda: self.closed or listener.cursor < self.base + len(self.ring), timeout)
+            if not self._enforce_bound(listener):
+                listener.disconnected = True
+                return None
+            chunks = [frames for frames, _, _ in islice(self.ring, listener.cursor - self.base, None)]
+            listener.cursor += len(chunks)
+            listener.offset += sum(len(chunk) for chunk in chunks)
+            return chunks
+
+    def bytes_per_ms(self):
+        """Stream bytes per millisecond of audio published so far (128 kbps until known)."""
+        with self.cond:
+            return self.head_offset / self.head_ms if self.head_ms else 128 / 8
+
+    def add_listener(self, prebuffer_ms=None, max_lag_ms=None, policy=None, name=None):
+        """Register a listener positioned for its prebuffer burst."""
+        if prebuffer_ms is None:
+            prebuffer_ms = PREBUFFER_MS.get(self.content_type, 0)
+        if policy not in OVERFLOW_POLICIES:
+            policy = OVERFLOW_POLICY
+        prebuffer_ms = min(prebuffer_ms, LISTENER_MAX_LAG_CAP_MS)
+        # The burst itself must fit in the queue, or it would overflow at once
+        max_lag_ms = min(max(max_lag_ms or LISTENER_MAX_LAG_MS, prebuffer_ms), LISTENER_MAX_LAG_CAP_MS)
+
+        with self.cond:
+            # The ring must hold this listener's whole queue
+            self.retain_ms = max(self.retain_ms, max_lag_ms)
+            cursor = self.start_cursor(prebuffer_ms)
+            offset = self.base_offset + sum(len(frames) for frames, _, _ in islice(self.ring, cursor - self.base))
+            listener = Listener(cursor, offset, max_lag_ms, policy, name)
+            self.listeners.add(listener)
+        return listener
+
+    def remove_listener(self, listener):
+        with self.cond:
+            self.listeners.discard(listener)
+            self.dropped_bytes += listener.dropped_bytes
+            self.overflows += listener.overflows
+
+    def deliver(self, listener, chunks, copy=False):
+        """Yield the chunks from read() that are still intact, counting the rest as dropped.
+
+        Chunks are memoryviews into the hub's slots: write each one out
+        before asking for the next, or pin them (Listener.pinned_offset)
+        while they are queued. copy=True yields bytes instead, for consumers
+        that keep chunks or insist on bytes (WSGI). A view whose
+        slot was reused while the listener was blocked is dropped, not sent.
+        """
+        offset = listener.offset - sum(len(chunk) for chunk in chunks)
+        for chunk in chunks:
+            if offset >= self.overwritten_offset:
+                data = bytes(chunk) if copy else chunk
+                # Re-check: the reader may have reused the slot mid-copy
+                if offset >= self.overwritten_offset:
+                    yield data
+                    listener.sent_bytes += len(chunk)
+                    offset += len(chunk)
+                    continue
+            listener.dropped_bytes += len(chunk)
+            offset += len(chunk)
+
+    def listen(self, prebuffer_ms=None, max_lag_ms=None, policy=None, name=None, copy=False):
+        """Blocking generator for one listener: the prebuffer burst, then live chunks."""
+        listener = self.add_listener(prebuffer_ms, max_lag_ms, policy, name)
+        try:
+            while True:
+                chunks = self.read(listener)
+                if chunks is None:
+                    print(f"[MP3] Listener {name or '?'} disconnected: more than {listener.max_lag_ms} ms behind")
+                    return
+                if not chunks:
+                    if self.closed:
+                        return
+                    continue
+                yield from self.deliver(listener, chunks, copy)
+        finally:
+            self.remove_listener(listener)
+
+    def stats(self):
+        """Per-listener sent/dropped counters plus totals (including departed listeners)."""
+        with self.cond:
+            listeners = [listener.stats() for listener in self.listeners]
+            return {
+                "listeners": listeners,
+                "dropped_bytes": self.dropped_bytes + sum(l["dropped_bytes"] for l in listeners),
+                "overflows": self.overflows + sum(l["overflows"] for l in listeners),
+                "ring_chunks": len(self.ring),
+                "ring_ms": round(self.ring_ms),
+                "slots": len(self.slots),
+            }
+
+
 @app.route("/live.mp3")
 def live_mp3():
-    """MP3 streaming endpoint."""
-    global _ffmpeg_mp3_process
+    """MP3 streaming endpoint - every listener shares the one encoder via the hub."""
+    prebuffer_ms = request.args.get("prebuffer", type=int)
+    max_lag_ms = request.args.get("max_lag", type=int)
+    policy = request.args.get("policy")
+    name = request.remote_addr
 
     def generate():
-        global _ffmpeg_mp3_process
-        while True:
-            if _ffmpeg_mp3_process is None or _ffmpeg_mp3_process.poll() is not None:
-                break
-            chunk = _ffmpeg_mp3_process.stdout.read(CHUNK_SIZE)
-            if not chunk:
-                break
-            yield chunk
+        if _mp3_hub is None:
+            return
+        # WSGI takes bytes only: one copy per chunk (the asyncio server sends views)
+        yield from _mp3_hub.listen(prebuffer_ms, max_lag_ms, policy, name, copy=True)
 
     return Response(
         generate(),
@@ -223,6 +666,13 @@ def live_mp3():
     )
 
 
+@app.route("/stats")
+def stream_stats():
+    """Listener counters (sent/dropped bytes, overflows) as JSON."""
+    stats = _mp3_hub.stats() if _mp3_hub else {"listeners": []}
+    return Response(json.dumps(stats), mimetype="application/json")
+
+
 def start_flask_server(port):
     """Start Flask server for MP3 streaming."""
     thread = threading.Thread(
@@ -233,6 +683,255 @@ def start_flask_server(port):
     return thread
 
 
+class AsyncStreamServer:
+    """One-thread asyncio HTTP server for /live.mp3, the HLS files and /stats.
+
+    Replaces http.server + Flask (one OS thread per listener): every
+    connection is a coroutine on a single event loop thread, so hundreds of
+    listeners cost a few KB each. /live.mp3 is sent with chunked transfer
+    straight from the hub's memoryviews (no per-listener copies), pinning
+    the slots the transport has not flushed yet. A
+    listener's transport write buffer is capped at its max_lag worth of
+    audio and counts towards its queue, so a slow or stalled client hits
+    the overflow policy instead of piling frames up in the socket. The
+    hub's reader thread wakes the loop once per published chunk.
+    """
+
+    CONTENT_TYPES = {
+        ".m3u8": "application/vnd.apple.mpegurl",
+        ".ts": "video/mp2t",
+        ".aac": "audio/aac",
+        ".mp3": "audio/mpeg",
+    }
+    MAX_HEADER_BYTES = 16384
+
+    def __init__(self, hls_dir=None):
+        self.hls_dir = pathlib.Path(hls_dir).resolve() if hls_dir else None
+        self.hub = None
+        self.loop = None
+        self.server = None
+        self.data_event = None
+        self.ready = threading.Event()
+        self.thread = None
+
+    # --- lifecycle ---------------------------------------------------------
+
+    def start(self, port, host="0.0.0.0"):
+        """Serve on a background thread; returns once the port is bound."""
+        self.thread = threading.Thread(target=self._run, args=(host, port), name="stream-server", daemon=True)
+        self.thread.start()
+        self.ready.wait(10)
+        if self.server is None:
+            raise OSError(f"Stream server could not bind port {port}")
+        return self
+
+    def _run(self, host, port):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.data_event = asyncio.Event()
+        try:
+            self.server = self.loop.run_until_complete(
+                asyncio.start_server(self._handle, host, port, limit=self.MAX_HEADER_BYTES))
+        except OSError as e:
+            print(f"[HTTP] Cannot listen on {host}:{port}: {e}")
+            return
+        finally:
+            self.ready.set()
+        self.loop.run_forever()
+
+    def stop(self):
+        if self.loop is None or self.server is None:
+            return
+        self.loop.call_soon_threadsafe(self.server.close)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+
+    def set_hub(self, hub):
+        """Attach the MP3 hub (may happen after start - e.g. HLS -> MP3 fallback)."""
+        self.hub = hub
+        hub.on_publish.append(lambda: self.loop.call_soon_threadsafe(self._notify))
+
+    def _notify(self):
+        """New frames published: wake every waiting listener (loop thread)."""
+        event, self.data_event = self.data_event, asyncio.Event()
+        event.set()
+
+    # --- HTTP ----------------------------------------------------------------
+
+    async def _handle(self, reader, writer):
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+                    return
+                lines = head.decode("latin-1").split("\r\n")
+                parts = lines[0].split()
+                if len(parts) != 3:
+                    await self._send(writer, 400, b"Bad Request", "text/plain")
+                    return
+                method, target, version = parts
+                headers = {}
+                for line in lines[1:]:
+                    name, _, value = line.partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+
+                path, _, query = target.partition("?")
+                if method not in ("GET", "HEAD"):
+                    await self._send(writer, 405, b"Method Not Allowed", "text/plain")
+                    return
+                if path == "/live.mp3":
+                    # Streams until the client or the encoder goes away
+                    await self._stream_mp3(writer, parse_query(query), writer.get_extra_info("peername"),
+                                           chunked=version == "HTTP/1.1", head_only=method == "HEAD")
+                    return
+                if path == "/stats":
+                    stats = self.hub.stats() if self.hub else {"listeners": []}
+                    await self._send(writer, 200, json.dumps(stats).encode(), "application/json", method == "HEAD")
+                else:
+                    await self._send_file(writer, path, method == "HEAD")
+                if not keep_alive:
+                    return
+        except (ConnectionError, OSError):
+            pass  # Client went away
+        finally:
+            writer.close()
+
+    async def _send(self, writer, status, body, content_type, head_only=False):
+        reason = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+                  503: "Service Unavailable"}.get(status, "")
+        writer.write(
+            f"HTTP/1.1 {status} {reason}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            "Cache-Control: no-cache\r\n"
+            "\r\n".encode("latin-1"))
+        if not head_only:
+            writer.write(body)
+        await writer.drain()
+
+    async def _send_file(self, writer, path, head_only):
+        """Serve a file from the HLS directory (playlist and segments)."""
+        if self.hls_dir is None:
+            await self._send(writer, 404, b"Not Found", "text/plain")
+            return
+        file_path = (self.hls_dir / path.lstrip("/")).resolve()
+        if file_path.parent != self.hls_dir and self.hls_dir not in file_path.parents:
+            await self._send(writer, 404, b"Not Found", "text/plain")
+            return
+        try:
+            # ffmpeg rewrites these constantly: read off the loop thread
+            body = await self.loop.run_in_executor(None, file_path.read_bytes)
+        except OSError:
+            await self._send(writer, 404, b"Not Found", "text/plain")
+            return
+        content_type = self.CONTENT_TYPES.get(file_path.suffix, "application/octet-stream")
+        await self._send(writer, 200, body, content_type, head_only)
+
+    async def _stream_mp3(self, writer, query, peer, chunked=True, head_only=False):
+        """Prebuffer burst, then live frames, until the client or encoder goes away.
+
+        HTTP/1.0 clients get the raw stream, ended by closing the connection.
+        """
+        hub = self.hub
+        if hub is None:
+            await self._send(writer, 503, b"Stream not started", "text/plain")
+            return
+        writer.write(
+            "HTTP/1.1 200 OK\r\n"
+            "Content-Type: audio/mpeg\r\n"
+            f"{'Transfer-Encoding: chunked' if chunked else 'Connection: close'}\r\n"
+            "Cache-Control: no-cache\r\n"
+            "\r\n".encode("latin-1"))
+        if head_only:
+            if chunked:
+                writer.write(b"0\r\n\r\n")
+            await writer.drain()
+            return
+
+        name = peer[0] if peer else None
+        listener = hub.add_listener(
+            query_int(query, "prebuffer"), query_int(query, "max_lag"), query.get("policy"), name)
+        # STABILITY: bound the socket's buffer by the same audio budget as the
+        # hub queue - drain() only pauses above the high-water mark
+        transport = writer.transport
+        bytes_per_ms = hub.bytes_per_ms()
+        limit = int(listener.max_lag_ms * bytes_per_ms)
+        transport.set_write_buffer_limits(high=limit, low=limit // 2)
+        # The transport may queue the views themselves (3.12+ doesn't copy),
+        # so every batch stays pinned until its last byte has been flushed
+        written = transport.get_write_buffer_size()  # Bytes handed to the transport (after what was sent)
+        in_flight = deque()  # (written once the batch was queued, stream offset it starts at)
+        flushed_at, progress_at = 0, self.loop.time()
+        try:
+            while True:
+                event = self.data_event
+                buffered = transport.get_write_buffer_size()
+                while in_flight and in_flight[0][0] <= written - buffered:
+                    in_flight.popleft()
+                # Pin before read(): the returned views must already be covered
+                listener.pinned_offset = in_flight[0][1] if in_flight else listener.offset
+                listener.buffered_ms = buffered / bytes_per_ms
+
+                now = self.loop.time()
+                if written - buffered != flushed_at or not buffered:
+                    flushed_at, progress_at = written - buffered, now
+                elif now - progress_at > LISTENER_STALL_MS / 1000:
+                    print(f"[MP3] Listener {name or '?'} disconnected: socket stalled for {LISTENER_STALL_MS} ms")
+                    return
+
+                chunks = hub.read(listener, timeout=0)
+                if chunks is None:
+                    print(f"[MP3] Listener {name or '?'} disconnected: more than {listener.max_lag_ms} ms behind")
+                    return
+                if not chunks:
+                    if hub.closed:
+                        if chunked:
+                            writer.write(b"0\r\n\r\n")
+                        await writer.drain()
+                        return
+                    await event.wait()
+                    continue
+                start = listener.offset - sum(len(chunk) for chunk in chunks)
+                for chunk in hub.deliver(listener, chunks):
+                    if chunked:
+                        header = b"%x\r\n" % len(chunk)
+                        writer.write(header)
+                        writer.write(chunk)
+                        writer.write(b"\r\n")
+                        written += len(header) + len(chunk) + 2
+                    else:
+                        writer.write(chunk)
+                        written += len(chunk)
+                in_flight.append((written, start))
+                try:
+                    await asyncio.wait_for(writer.drain(), listener.max_lag_ms / 1000)
+                except asyncio.TimeoutError:
+                    pass  # Client stalled: the next read() applies the overflow policy to its buffer
+        finally:
+            if transport.get_write_buffer_size() and not hub.closed:
+                # close() would keep flushing queued views after the pin is gone
+                transport.abort()
+            hub.remove_listener(listener)
+
+
+def parse_query(query):
+    """a=1&b=2 -> {"a": "1", "b": "2"} (last value wins)."""
+    params = {}
+    for pair in query.split("&"):
+        name, _, value = pair.partition("=")
+        if name:
+            params[name] = value
+    return params
+
+
+def query_int(params, name):
+    try:
+        return int(params[name])
+    except (KeyError, ValueError):
+        return None
+
+
 def wait_for_playlist(pl, timeout=20):
     """Wait for HLS playlist to be created."""
     print("Waiting for stream to start", end="", flush=True)
@@ -298,8 +997,12 @@ def main():
     print(f"\nSelected: {speaker['name']}")
 
     # Start HTTP server
+    use_flask = "--flask" in sys.argv
     print("\nStarting HTTP server...")
-    httpd = start_http_server(OUTDIR, PORT)
+    if use_flask:
+        httpd = start_http_server(OUTDIR, PORT)
+    else:
+        server = AsyncStreamServer(OUTDIR).start(PORT)
 
     # Try HLS first
     print("Starting HLS stream...")
@@ -334,13 +1037,21 @@ def main():
         print("\nFalling back to MP3 stream...")
         hls_process.terminate()
 
-        global _ffmpeg_mp3_process
+        global _ffmpeg_mp3_process, _mp3_hub
         _ffmpeg_mp3_process = start_ffmpeg_mp3(device)
-        start_flask_server(PORT)
+        _mp3_hub = BroadcastHub(_ffmpeg_mp3_process.stdout).start()
+        if use_flask:
+            # Free the port for Flask
+            httpd.shutdown()
+            httpd.server_close()
+            start_flask_server(PORT)
+        else:
+            server.set_hub(_mp3_hub)
         time.sleep(2)
 
         mp3_url = f"http://{ip}:{PORT}/live.mp3"
         print(f"MP3 URL: {mp3_url}")
+        print(f"Listener stats: http://{ip}:{PORT}/stats")
 
         try:
             cast_to_speaker(speaker, mp3_url, "audio/mpeg")
@@ -365,6 +1076,8 @@ def main():
         hls_process.terminate()
     except Exception:
         pass
+    if not use_flask:
+        server.stop()
 
     print("[OK] Stopped")
 
@@ -0,0 +1,61 @@
+"""Device cache direct connect (cast-helper.py connect_cached).
+
+Needs pychromecast. Run: python -m pytest tests
+"""
+
+import importlib.util
+import pathlib
+import socket
+import threading
+import uuid
+
+import pytest
+
+pytest.importorskip("pychromecast")
+
+HELPER = pathlib.Path(__file__).resolve().parent.parent / "src" / "main" / "cast-helper.py"
+
+
+@pytest.fixture(scope="module")
+def helper():
+    spec = importlib.util.spec_from_file_location("cast_helper", HELPER)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_connect_cached_dials_cached_host_port(helper):
+    """The cached host:port must actually be dialed (CastInfo.services is
+    what pychromecast connects to - an empty set never opens a socket)."""
+    server = socket.socket()
+    server.bind(("127.0.0.1", 0))
+    server.listen(1)
+    server.settimeout(5)
+    accepted = threading.Event()
+
+    def accept():
+        try:
+            conn, _ = server.accept()
+            accepted.set()
+            conn.close()  # Not a Cast device: the TLS handshake fails
+        except OSError:
+            pass
+
+    threading.Thread(target=accept, daemon=True).start()
+    device = {"uuid": str(uuid.uuid4()), "name": "Test Speaker", "ip": "127.0.0.1",
+              "port": server.getsockname()[1]}
+    try:
+        with pytest.raises(ConnectionError):
+            helper.connect_cached(device, timeout=1)
+        assert accepted.is_set()
+    finally:
+        server.close()
+
+
+def test_cast_info_from_cache_lists_host_service(helper):
+    from pychromecast.models import HostServiceInfo
+
+    device = {"uuid": str(uuid.uuid4()), "name": "Test Speaker", "ip": "10.0.0.5", "port": 8009}
+    info = helper.cast_info_from_cache(device)
+    assert info.services == {HostServiceInfo("10.0.0.5", 8009)}
+    assert (info.host, info.port) == ("10.0.0.5", 8009)